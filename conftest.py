@@ -2,9 +2,31 @@
 Global pytest configuration and fixtures for AutomationExercise testing framework.
 """
 import os
+from collections import Counter, defaultdict
 import pytest
 from playwright.sync_api import sync_playwright
 from dotenv import load_dotenv
+from src.api_client.request_pool import RequestContextPool
+from src.api_client.httpx_transport import HttpxTransport
+from src.api_client.response_cache import ResponseCache
+from src.api_client.latency import API_LATENCY, LatencyRecorder
+from src.helpers.browser_pool import BrowserContextPool
+from src.helpers.sleep_budget import SLEEP_BUDGET, SleepBudget
+from src.helpers.page_metrics import PAGE_METRICS, WEB_VITALS_INIT_SCRIPT, PageMetricsLog
+from src.helpers.network_routing import NetworkBlocker, RoutingRules
+from src.helpers.stand_in_server import StandInServer
+from src.helpers.catalog_snapshot import CatalogSnapshot, load_or_build_snapshot
+from src.helpers.catalog_store import CatalogStore
+from src.helpers.auth_state import StorageStateFactory
+from src.helpers.benchmark import BaselineStore, Benchmark
+from src.helpers.duration_sharding import DurationStore
+from src.helpers.har_replay import (
+    NETWORK_MODES, NETWORK_MODE_LIVE, NETWORK_MODE_RECORD, NETWORK_MODE_REPLAY,
+    BrowserHarRecorder, HarApiTransport, har_file_for, har_file_for_test
+)
+from src.api_client.controllers.products_controller import ProductsController
+from src.api_client.controllers.brands_controller import BrandsController
+from src.api_client.controllers.user_controller import UserController
 from src.fixtures.test_data_fixtures import *  # Registrar fixtures de test_data, api controllers y pages
 
 # Load environment variables
@@ -15,7 +37,94 @@ BASE_URL = os.getenv('BASE_URL', 'https://automationexercise.com')
 API_BASE_URL = os.getenv('API_BASE_URL', 'https://automationexercise.com/api')
 HEADLESS = os.getenv('HEADLESS', 'true').lower() == 'true'
 BROWSER = os.getenv('BROWSER', 'chromium')
+BROWSER_ENGINES = ('chromium', 'firefox', 'webkit')
+# Optional per-engine xdist worker caps, e.g. "webkit=1,firefox=2" (used with --dist loadgroup)
+BROWSER_WORKERS = {
+    engine.strip(): int(cap)
+    for engine, _, cap in (entry.partition('=') for entry in os.getenv('BROWSER_WORKERS', '').split(','))
+    if engine.strip() and cap.strip()
+}
 TIMEOUT = int(os.getenv('TIMEOUT', '30000'))
+API_POOL_SIZE = int(os.getenv('API_POOL_SIZE', '5'))
+# HTTP client behind the API controllers: "playwright" (pooled request contexts) or "httpx"
+API_TRANSPORT = os.getenv('API_TRANSPORT', 'playwright').lower()
+API_TRANSPORTS = ('playwright', 'httpx')
+API_HTTP2 = os.getenv('API_HTTP2', 'false').lower() == 'true'
+API_KEEPALIVE_EXPIRY = float(os.getenv('API_KEEPALIVE_EXPIRY', '30'))
+CONTEXT_POOL_SIZE = int(os.getenv('CONTEXT_POOL_SIZE', '2'))
+API_CACHE_TTL = float(os.getenv('API_CACHE_TTL', '0'))
+API_CACHE_SIZE = int(os.getenv('API_CACHE_SIZE', '128'))
+AUTH_STATE_DIR = os.getenv('AUTH_STATE_DIR', 'results/auth_state')
+AUTH_STATE_TTL = float(os.getenv('AUTH_STATE_TTL', '1800'))
+COLLECT_PAGE_METRICS = os.getenv('COLLECT_PAGE_METRICS', 'true').lower() == 'true'
+PAGE_METRICS_REPORT = os.getenv('PAGE_METRICS_REPORT', 'results/page_metrics.json')
+API_LATENCY_REPORT = os.getenv('API_LATENCY_REPORT', 'results/api_latency.json')
+BENCHMARK_WARMUP = int(os.getenv('BENCHMARK_WARMUP', '3'))
+BENCHMARK_ITERATIONS = int(os.getenv('BENCHMARK_ITERATIONS', '20'))
+BENCHMARK_CONCURRENCY = int(os.getenv('BENCHMARK_CONCURRENCY', '1'))
+BENCHMARK_TOLERANCE = float(os.getenv('BENCHMARK_TOLERANCE', '0.25'))
+BLOCK_THIRD_PARTY = os.getenv('BLOCK_THIRD_PARTY', 'true').lower() == 'true'
+
+# Fixed sleeps of the whole run, merged from test reports (works across xdist workers)
+RUN_SLEEP_BUDGET = SleepBudget()
+# Browser timings and Web Vitals of every navigation, merged from test reports
+RUN_PAGE_METRICS = PageMetricsLog()
+# Requests blocked by the routing layer, by reason, merged from test reports
+RUN_BLOCKED_REQUESTS = Counter()
+# API response cache hit/miss counts, merged from every worker
+RUN_API_CACHE_STATS = Counter()
+# API request latency histograms, merged from every worker
+RUN_API_LATENCY = LatencyRecorder()
+# Benchmark results of the run, by name, merged from test reports
+RUN_BENCHMARKS = {}
+# Setup + call + teardown seconds per test, saved for the next run's duration sharding
+RUN_TEST_DURATIONS = Counter()
+# Test outcomes and seconds per browser engine, for the browser matrix summary
+RUN_BROWSER_OUTCOMES = defaultdict(Counter)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def stand_in_server(pytestconfig):
+    """Local stand-in site targeted through BASE_URL/API_BASE_URL when --stand-in is given."""
+    if not pytestconfig.getoption("stand_in"):
+        yield None
+        return
+    
+    server = StandInServer().start()
+    # Page objects and API clients read these when they are created
+    previous = {name: os.environ.get(name) for name in ("BASE_URL", "API_BASE_URL")}
+    os.environ["BASE_URL"] = server.base_url
+    os.environ["API_BASE_URL"] = server.api_base_url
+    yield server
+    
+    for name, value in previous.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def stand_in_site(stand_in_server):
+    """Stand-in site for tests that always target it: the --stand-in server, or a private one.
+    
+    The private server does not touch BASE_URL/API_BASE_URL, so the rest of
+    the run keeps its target.
+    """
+    if stand_in_server is not None:
+        yield stand_in_server
+        return
+    
+    server = StandInServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def routing_rules(stand_in_server):
+    """Browser allow/deny rules, built once BASE_URL points at the site under test (stand-in included)."""
+    return RoutingRules.from_env()
 
 
 @pytest.fixture(scope="session")
@@ -30,17 +139,93 @@ def browser_context_args():
 
 
 @pytest.fixture(scope="session")
-def playwright_context():
-    """Playwright context for the entire test session."""
+def playwright_instance():
+    """Playwright driver for the session (one per xdist worker)."""
     with sync_playwright() as p:
-        browser = getattr(p, BROWSER).launch(headless=HEADLESS)
-        context = browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            ignore_https_errors=True
-        )
-        yield context
-        context.close()
-        browser.close()
+        yield p
+
+
+@pytest.fixture(scope="session")
+def browser_engine(request):
+    """Browser engine of the current test: parametrized by --browsers, else BROWSER."""
+    return getattr(request, "param", request.config.getoption("browsers")[0])
+
+
+@pytest.fixture(scope="session")
+def worker_browser(playwright_instance, browser_engine):
+    """Browser shared by every test in this worker (one per engine, launched on first use)."""
+    browser = getattr(playwright_instance, browser_engine).launch(headless=HEADLESS)
+    yield browser
+    browser.close()
+
+
+@pytest.fixture(scope="session")
+def browser_context_pool(worker_browser):
+    """Pool of pre-warmed, isolated browser contexts."""
+    pool = BrowserContextPool(
+        worker_browser,
+        size=CONTEXT_POOL_SIZE,
+        viewport={"width": 1920, "height": 1080},
+        ignore_https_errors=True
+    )
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def network_mode(pytestconfig):
+    """Network mode of the run: live, record or replay."""
+    return pytestconfig.getoption("network_mode")
+
+
+@pytest.fixture(scope="module")
+def browser_har(request, network_mode):
+    """HAR recorder/replayer for the browser traffic of the current test module (one archive per test)."""
+    if network_mode == NETWORK_MODE_LIVE:
+        yield None
+        return
+    recorder = BrowserHarRecorder(har_file_for(request.module.__file__, "browser"), network_mode)
+    yield recorder
+    recorder.finalize()
+
+
+def _install_routing(request, context, browser_har, routing_rules):
+    """Install HAR record/replay and third-party blocking on a test's context."""
+    if browser_har:
+        browser_har.install(context, har_file_for_test(request.node.nodeid, "browser"))
+    
+    # Block ads, trackers and fonts unless the test asserts on full-page rendering
+    blocker = None
+    if BLOCK_THIRD_PARTY and not request.node.get_closest_marker("full_render"):
+        blocker = NetworkBlocker(routing_rules)
+        blocker.install(context)
+    return blocker
+
+
+def _install_page_metrics(context):
+    """Install the web-vitals observers once per context, before any of its pages open."""
+    if COLLECT_PAGE_METRICS:
+        context.add_init_script(WEB_VITALS_INIT_SCRIPT)
+
+
+def _report_blocked(request, blocker):
+    """Attach the blocked-request counts of a test to its report."""
+    if blocker and blocker.blocked_total:
+        request.node.user_properties.append(("blocked_requests", blocker.summary()))
+
+
+@pytest.fixture
+def playwright_context(request, browser_context_pool, browser_har, browser_engine, routing_rules):
+    """Fresh browser context for each test, so cookies and cart never leak between tests."""
+    request.node.user_properties.append(("browser", browser_engine))
+    context = browser_context_pool.acquire()
+    blocker = _install_routing(request, context, browser_har, routing_rules)
+    _install_page_metrics(context)
+    
+    yield context
+    
+    _report_blocked(request, blocker)
+    browser_context_pool.release(context)
 
 
 @pytest.fixture
@@ -52,13 +237,278 @@ def page(playwright_context):
     page.close()
 
 
+def _credentials_verifier(user_controller):
+    """Build a check of an email/password pair through /verifyLogin."""
+    def verify_credentials(email: str, password: str) -> bool:
+        response = user_controller.verify_login(email, password)
+        return response["data"].get("responseCode") == 200
+    return verify_credentials
+
+
+@pytest.fixture(scope="session")
+def storage_state_factory(request, worker_browser, network_mode, routing_rules):
+    """Logs each user in once and reuses the saved storage state until AUTH_STATE_TTL expires."""
+    # Check credentials over the API first, so a bad account fails fast instead of after a UI login
+    verify_credentials = None
+    if network_mode != NETWORK_MODE_REPLAY:
+        verify_credentials = _credentials_verifier(UserController(request.getfixturevalue("api_request_pool")))
+    
+    # The login runs outside any test module, so it records to / replays from its own archive
+    login_har = None
+    if network_mode != NETWORK_MODE_LIVE:
+        login_har = BrowserHarRecorder(har_file_for("auth_state", "browser"), network_mode)
+    
+    def prepare_login_context(context) -> None:
+        if login_har:
+            login_har.install(context)
+        if BLOCK_THIRD_PARTY:
+            NetworkBlocker(routing_rules).install(context)
+    
+    # One state per user per worker: a test that logs out only invalidates its own worker's session
+    state_dir = os.path.join(AUTH_STATE_DIR, os.getenv("PYTEST_XDIST_WORKER", "main"))
+    yield StorageStateFactory(
+        worker_browser,
+        state_dir,
+        ttl_seconds=AUTH_STATE_TTL,
+        verify_credentials=verify_credentials,
+        prepare_context=prepare_login_context,
+        viewport={"width": 1920, "height": 1080},
+        ignore_https_errors=True
+    )
+    if login_har:
+        login_har.finalize()
+
+
+@pytest.fixture
+def authenticated_context(request, storage_state_factory, browser_har, ui_test_data, browser_engine,
+                          routing_rules):
+    """Browser context already logged in as the valid test user (the login form is skipped)."""
+    request.node.user_properties.append(("browser", browser_engine))
+    user = ui_test_data["valid_user"]
+    context = storage_state_factory.new_context(user["email"], user["password"])
+    blocker = _install_routing(request, context, browser_har, routing_rules)
+    _install_page_metrics(context)
+    
+    yield context
+    
+    _report_blocked(request, blocker)
+    context.close()
+
+
+@pytest.fixture
+def authenticated_page(authenticated_context):
+    """Page of a context that is already logged in as the valid test user."""
+    page = authenticated_context.new_page()
+    page.set_default_timeout(TIMEOUT)
+    yield page
+    page.close()
+
+
+@pytest.fixture(scope="session")
+def api_request_pool():
+    """Thread-safe API transport shared by the whole session (API_TRANSPORT picks which).
+    
+    "playwright" pins API_POOL_SIZE request contexts to worker threads; "httpx"
+    starts no Playwright driver at all and keeps up to API_POOL_SIZE keep-alive
+    connections (HTTP/2 with API_HTTP2=true).
+    """
+    if API_TRANSPORT == "httpx":
+        pool = HttpxTransport(
+            base_url=os.getenv('API_BASE_URL', API_BASE_URL),
+            headers={'Accept': 'application/json'},
+            max_connections=API_POOL_SIZE,
+            max_keepalive_connections=API_POOL_SIZE,
+            keepalive_expiry=API_KEEPALIVE_EXPIRY,
+            http2=API_HTTP2,
+            timeout=TIMEOUT / 1000,
+            ignore_https_errors=True
+        )
+    else:
+        pool = RequestContextPool(size=API_POOL_SIZE, ignore_https_errors=True)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="module")
+def api_transport(request, network_mode):
+    """Transport for API controllers: the request pool, or a HAR archive in record/replay mode."""
+    if network_mode == NETWORK_MODE_REPLAY:
+        # Replay never touches the network, so the pool is not even started
+        yield HarApiTransport(har_file_for(request.module.__file__, "api"), NETWORK_MODE_REPLAY)
+        return
+    
+    pool = request.getfixturevalue("api_request_pool")
+    if network_mode == NETWORK_MODE_LIVE:
+        yield pool
+        return
+    
+    transport = HarApiTransport(har_file_for(request.module.__file__, "api"), NETWORK_MODE_RECORD, pool)
+    yield transport
+    transport.save()
+
+
 @pytest.fixture
-def api_request_context(playwright_context):
-    """API request context for API tests."""
-    return playwright_context.request
+def cart_seed_transport(request, network_mode, playwright_context):
+    """Transport for HTTP cart seeding: None (context.request), or a HAR archive in record/replay mode."""
+    if network_mode == NETWORK_MODE_LIVE:
+        yield None
+        return
+    
+    har_path = har_file_for_test(request.node.nodeid, "cart")
+    if network_mode == NETWORK_MODE_REPLAY:
+        yield HarApiTransport(har_path, NETWORK_MODE_REPLAY)
+        return
+    
+    # Recorded through the test's own context, so the items still land in its cookie session
+    transport = HarApiTransport(har_path, NETWORK_MODE_RECORD, playwright_context.request)
+    yield transport
+    transport.save()
+
+
+@pytest.fixture(scope="session")
+def api_response_cache(pytestconfig):
+    """GET response cache shared by the API controllers (disabled unless API_CACHE_TTL > 0)."""
+    if API_CACHE_TTL <= 0:
+        yield None
+        return
+    
+    cache = ResponseCache(max_entries=API_CACHE_SIZE, ttl_seconds=API_CACHE_TTL)
+    yield cache
+    
+    stats = cache.stats()
+    if hasattr(pytestconfig, "workeroutput"):
+        # xdist worker: hand the stats to the controller process
+        pytestconfig.workeroutput["api_cache_stats"] = stats
+    else:
+        RUN_API_CACHE_STATS.update(stats)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def api_latency_report(pytestconfig):
+    """Hand this process's API latency histograms to the run report when the session ends."""
+    yield
+    
+    if hasattr(pytestconfig, "workeroutput"):
+        # xdist worker: hand the histograms to the controller process
+        pytestconfig.workeroutput["api_latency"] = API_LATENCY.to_list()
+    else:
+        RUN_API_LATENCY.merge(API_LATENCY.to_list())
+
+
+@pytest.fixture(scope="session")
+def catalog_snapshot(request, tmp_path_factory, network_mode, stand_in_server):
+    """Products and brands fetched once per run and shared by every xdist worker."""
+    # Workers get basetemp/popen-gwN, so the shared directory is its parent
+    base_temp = tmp_path_factory.getbasetemp()
+    cache_dir = base_temp.parent if os.getenv("PYTEST_XDIST_WORKER") else base_temp
+    
+    def build() -> CatalogSnapshot:
+        har_path = har_file_for("catalog_snapshot", "api")
+        if network_mode == NETWORK_MODE_REPLAY:
+            transport = HarApiTransport(har_path, NETWORK_MODE_REPLAY)
+        elif network_mode == NETWORK_MODE_RECORD:
+            transport = HarApiTransport(har_path, NETWORK_MODE_RECORD, request.getfixturevalue("api_request_pool"))
+        else:
+            transport = request.getfixturevalue("api_request_pool")
+        
+        products = ProductsController(transport).get_all_products()
+        brands = BrandsController(transport).get_all_brands()
+        if network_mode == NETWORK_MODE_RECORD:
+            transport.save()
+        return CatalogSnapshot(products["data"]["products"], brands["data"]["brands"])
+    
+    return load_or_build_snapshot(str(cache_dir), build)
+
+
+@pytest.fixture(scope="session")
+def catalog_store(catalog_snapshot):
+    """Columnar, indexed view of the catalog snapshot for id, price and category queries."""
+    return CatalogStore.from_snapshot(catalog_snapshot)
+
+
+@pytest.fixture
+def api_request_context(api_transport):
+    """API request context for API tests (thread-safe; pooled, recorded or replayed)."""
+    return api_transport
+
+
+@pytest.fixture(autouse=True)
+def sleep_budget_tracker(request):
+    """Attach the fixed sleeps a test performed to its report."""
+    marker = SLEEP_BUDGET.mark()
+    yield
+    entries = SLEEP_BUDGET.entries_since(marker)
+    if entries:
+        request.node.user_properties.append(("fixed_sleeps", entries))
+
+
+@pytest.fixture(autouse=True)
+def page_metrics_tracker(request):
+    """Attach the page metrics of a test's navigations to its report."""
+    marker = PAGE_METRICS.mark()
+    yield
+    entries = PAGE_METRICS.entries_since(marker)
+    if entries:
+        request.node.user_properties.append(("page_metrics", entries))
+
+
+@pytest.fixture
+def benchmark(request):
+    """Time a callable with warmup and repetitions, failing if it regressed against the saved baseline."""
+    baselines = BaselineStore()
+    
+    def run(name, func, *args, **kwargs):
+        result = Benchmark(BENCHMARK_WARMUP, BENCHMARK_ITERATIONS, BENCHMARK_CONCURRENCY).run(name, func, *args, **kwargs)
+        request.node.user_properties.append(("benchmark", (name, result.to_dict())))
+        if not request.config.getoption("benchmark_save"):
+            regression = baselines.regression(result, BENCHMARK_TOLERANCE)
+            if regression:
+                pytest.fail(regression)
+        return result
+    
+    return run
 
 
 # Pytest configuration
+def pytest_addoption(parser):
+    """Register command line options."""
+    parser.addoption(
+        "--network-mode",
+        action="store",
+        choices=NETWORK_MODES,
+        default=os.getenv('NETWORK_MODE', NETWORK_MODE_LIVE),
+        help="live: hit BASE_URL/API_BASE_URL; record: also save HAR archives per test module; "
+             "replay: serve browser and API traffic from the saved archives"
+    )
+    parser.addoption(
+        "--stand-in",
+        action="store_true",
+        default=os.getenv('STAND_IN_SERVER', 'false').lower() == 'true',
+        help="run against a local stand-in AutomationExercise server on a random port"
+    )
+    parser.addoption(
+        "--browsers",
+        action="store",
+        default=os.getenv('BROWSERS', BROWSER),
+        type=lambda value: [engine.strip() for engine in value.split(",") if engine.strip()],
+        help="comma-separated engines (chromium,firefox,webkit); with more than one, "
+             "every UI test runs once per engine in the same session"
+    )
+    parser.addoption(
+        "--duration-sharding",
+        action="store_true",
+        default=os.getenv('DURATION_SHARDING', 'false').lower() == 'true',
+        help="with -n: pack tests onto xdist workers by their previous durations, "
+             "keeping UI and API tests on separate workers"
+    )
+    parser.addoption(
+        "--benchmark-save",
+        action="store_true",
+        default=False,
+        help="store this run's benchmark results as the new baselines instead of comparing against them"
+    )
+
+
 def pytest_configure(config):
     """Configure pytest with custom markers and options."""
     config.addinivalue_line(
@@ -67,6 +517,9 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "ui: mark test as UI/E2E test"
     )
+    config.addinivalue_line(
+        "markers", "unit: mark test as unit test (no browser or network)"
+    )
     config.addinivalue_line(
         "markers", "smoke: mark test as smoke test"
     )
@@ -76,21 +529,173 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "slow: mark test as slow test"
     )
+    config.addinivalue_line(
+        "markers", "full_render: disable third-party request blocking for this test"
+    )
+    config.addinivalue_line(
+        "markers", "benchmark: mark test as benchmark compared against saved baselines"
+    )
+    
+    if API_TRANSPORT not in API_TRANSPORTS:
+        raise pytest.UsageError(f"Unknown API_TRANSPORT {API_TRANSPORT!r}; choose from {', '.join(API_TRANSPORTS)}")
+    unknown = [engine for engine in config.getoption("browsers") if engine not in BROWSER_ENGINES]
+    if unknown:
+        raise pytest.UsageError(f"Unknown browser engines {unknown}; choose from {', '.join(BROWSER_ENGINES)}")
+
+
+def pytest_generate_tests(metafunc):
+    """Run every browser test once per engine when --browsers lists several."""
+    engines = metafunc.config.getoption("browsers")
+    if len(engines) > 1 and "browser_engine" in metafunc.fixturenames:
+        # Session scope groups the tests by engine, so each worker launches an engine only when it needs it
+        metafunc.parametrize("browser_engine", engines, indirect=True, scope="session")
 
 
 def pytest_collection_modifyitems(config, items):
     """Modify test collection to add markers based on test location."""
+    engine_slots = Counter()
     for item in items:
+        # Cap the workers an engine may use: its tests are spread over at most N xdist groups
+        engine = getattr(getattr(item, "callspec", None), "params", {}).get("browser_engine")
+        if engine in BROWSER_WORKERS:
+            item.add_marker(pytest.mark.xdist_group(f"{engine}-{engine_slots[engine] % BROWSER_WORKERS[engine]}"))
+            engine_slots[engine] += 1
+        
         # Add markers based on test file location
         if "api" in str(item.fspath):
             item.add_marker(pytest.mark.api)
         if "user_interface" in str(item.fspath):
             item.add_marker(pytest.mark.ui)
+        if "unit" in str(item.fspath):
+            item.add_marker(pytest.mark.unit)
         
         # Add slow marker for tests that might take longer
         if "performance" in item.name or "load" in item.name:
             item.add_marker(pytest.mark.slow)
 
-        # Mark concurrent tests as xfail due to Playwright request context not being thread-safe
-        if "concurrent" in item.name:
-            item.add_marker(pytest.mark.xfail(reason="Playwright request context is not thread-safe across threads", strict=False))
+
+def pytest_runtest_logreport(report):
+    """Collect durations, fixed sleeps, blocked requests, page metrics and benchmark results of each test."""
+    RUN_TEST_DURATIONS[report.nodeid] += report.duration
+    engine = dict(report.user_properties).get("browser")
+    if engine:
+        RUN_BROWSER_OUTCOMES[engine]["seconds"] += report.duration
+        if report.when == "call" or report.failed:
+            RUN_BROWSER_OUTCOMES[engine][report.outcome] += 1
+    if report.when != "teardown":
+        return
+    for name, value in report.user_properties:
+        if name == "fixed_sleeps":
+            RUN_SLEEP_BUDGET.extend(value)
+        elif name == "blocked_requests":
+            RUN_BLOCKED_REQUESTS.update(value)
+        elif name == "page_metrics":
+            RUN_PAGE_METRICS.extend(value)
+        elif name == "benchmark":
+            benchmark_name, summary = value
+            RUN_BENCHMARKS[benchmark_name] = summary
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """Use the duration-based scheduler when --duration-sharding is given."""
+    if not config.getoption("duration_sharding"):
+        return None
+    from src.helpers.xdist_scheduler import DurationScheduling
+    return DurationScheduling(config, log)
+
+
+def pytest_sessionfinish(session):
+    """Save this run's test durations for the next duration-sharded run."""
+    if hasattr(session.config, "workeroutput") or not RUN_TEST_DURATIONS:
+        return
+    DurationStore(getattr(session.config, "cache", None)).update(RUN_TEST_DURATIONS)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Merge the API cache stats and latency histograms of a finished xdist worker."""
+    workeroutput = getattr(node, "workeroutput", {})
+    RUN_API_CACHE_STATS.update(workeroutput.get("api_cache_stats", {}))
+    RUN_API_LATENCY.merge(workeroutput.get("api_latency", []))
+
+
+def _format_metric(value, width, digits=0):
+    """Right-align a metric for the summary table ('-' when the browser did not report it)."""
+    return f"{value:>{width}.{digits}f}" if value is not None else f"{'-':>{width}}"
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Report fixed sleeps, blocked requests, browser matrix, page metrics, API cache, API latency and benchmarks."""
+    if RUN_SLEEP_BUDGET.total_ms:
+        terminalreporter.write_sep("=", f"fixed sleep budget: {RUN_SLEEP_BUDGET.total_ms} ms")
+        for location, totals in RUN_SLEEP_BUDGET.by_location().items():
+            terminalreporter.write_line(f"{totals['total_ms']:>8} ms  {totals['count']:>4}x  {location}")
+    
+    if RUN_BLOCKED_REQUESTS:
+        terminalreporter.write_sep("=", f"blocked requests: {sum(RUN_BLOCKED_REQUESTS.values())}")
+        for reason, count in RUN_BLOCKED_REQUESTS.most_common():
+            terminalreporter.write_line(f"{count:>8}  {reason}")
+    
+    if len(RUN_BROWSER_OUTCOMES) > 1:
+        terminalreporter.write_sep("=", "browser matrix")
+        for engine, outcomes in sorted(RUN_BROWSER_OUTCOMES.items()):
+            terminalreporter.write_line(
+                f"{engine:<10} passed={outcomes['passed']} failed={outcomes['failed']} "
+                f"skipped={outcomes['skipped']} test time={outcomes['seconds']:.1f}s"
+            )
+    
+    if RUN_PAGE_METRICS:
+        terminalreporter.write_sep("=", "page metrics (ms, browser-measured)")
+        terminalreporter.write_line(
+            f"{'count':>6} {'ttfb p50':>9} {'dcl p50':>9} {'load p50':>9} {'load p90':>9} "
+            f"{'lcp p90':>9} {'cls max':>8} {'tbt p90':>9}  url"
+        )
+        for url, row in RUN_PAGE_METRICS.by_url().items():
+            terminalreporter.write_line(
+                f"{row['count']:>6} {_format_metric(row['ttfb_ms_p50'], 9)} {_format_metric(row['dom_content_loaded_ms_p50'], 9)} "
+                f"{_format_metric(row['load_event_ms_p50'], 9)} {_format_metric(row['load_event_ms_p90'], 9)} "
+                f"{_format_metric(row['lcp_ms_p90'], 9)} {_format_metric(row['cls_max'], 8, 3)} "
+                f"{_format_metric(row['tbt_ms_p90'], 9)}  {url}"
+            )
+        if PAGE_METRICS_REPORT:
+            os.makedirs(os.path.dirname(PAGE_METRICS_REPORT) or ".", exist_ok=True)
+            RUN_PAGE_METRICS.write_json(PAGE_METRICS_REPORT)
+            terminalreporter.write_line(f"written to {PAGE_METRICS_REPORT}")
+    
+    if RUN_API_CACHE_STATS:
+        stats = RUN_API_CACHE_STATS
+        lookups = stats["hits"] + stats["misses"]
+        hit_rate = stats["hits"] / lookups * 100 if lookups else 0.0
+        terminalreporter.write_sep("=", f"API response cache: {hit_rate:.1f}% hit rate")
+        terminalreporter.write_line(
+            f"hits={stats['hits']} misses={stats['misses']} revalidations={stats['revalidations']} "
+            f"evictions={stats['evictions']}"
+        )
+    
+    if RUN_API_LATENCY:
+        terminalreporter.write_sep("=", "API latency (ms)")
+        terminalreporter.write_line(f"{'count':>6} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9}  endpoint")
+        for endpoint, stats in RUN_API_LATENCY.summary().items():
+            terminalreporter.write_line(
+                f"{stats['count']:>6} {stats['p50_ms']:>9.1f} {stats['p90_ms']:>9.1f} "
+                f"{stats['p99_ms']:>9.1f} {stats['max_ms']:>9.1f}  {endpoint}"
+            )
+        if API_LATENCY_REPORT:
+            os.makedirs(os.path.dirname(API_LATENCY_REPORT) or ".", exist_ok=True)
+            RUN_API_LATENCY.write_json(API_LATENCY_REPORT)
+            terminalreporter.write_line(f"written to {API_LATENCY_REPORT}")
+    
+    if RUN_BENCHMARKS:
+        terminalreporter.write_sep("=", "benchmarks (ms)")
+        for name, summary in RUN_BENCHMARKS.items():
+            terminalreporter.write_line(
+                f"{summary['median_ms']:>9.1f} median {summary['p90_ms']:>9.1f} p90 "
+                f"{summary['ops_per_second']:>8.1f} ops/s  {name}"
+            )
+        if terminalreporter.config.getoption("benchmark_save"):
+            baselines = BaselineStore()
+            for name, summary in RUN_BENCHMARKS.items():
+                baselines.update(name, summary)
+            baselines.save()
+            terminalreporter.write_line(f"baselines saved to {baselines.path}")
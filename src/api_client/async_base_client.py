@@ -0,0 +1,152 @@
+"""
+Async Base API Client for AutomationExercise.com API testing.
+"""
+import asyncio
+import inspect
+import time
+from typing import Dict, Any, Optional
+from .base_client import APIClientCore
+from .latency import LatencyRecorder
+from .request_pool import BufferedResponse
+from .response_cache import ResponseCache
+
+
+class AsyncBaseAPIClient(APIClientCore):
+    """Async base API client for AutomationExercise.com APIs.
+    
+    Mirrors BaseAPIClient, but every request method is a coroutine, so many
+    requests can be kept in flight from a single event loop (e.g. with
+    asyncio.gather). Request building, the response cache, latency recording
+    and response parsing are shared with BaseAPIClient through APIClientCore.
+    """
+    
+    def __init__(self, request_context: Any, base_url: Optional[str] = None,
+                 cache: Optional[ResponseCache] = None, latency: Optional[LatencyRecorder] = None):
+        """
+        Initialize the async API client.
+        
+        Args:
+            request_context: Playwright async API request context, or any sync transport
+                with fetch() (RequestContextPool, HttpxTransport, HarApiTransport), whose
+                calls are then run on worker threads
+            base_url: Base URL for API requests (optional)
+            cache: Cache for GET responses (optional; GETs always hit the server without it)
+            latency: Recorder for request timings (defaults to the process-wide API_LATENCY)
+        """
+        super().__init__(request_context, base_url, cache, latency)
+    
+    async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                  use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Make a GET request to the API.
+        
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+            use_cache: Set to False to bypass the response cache for this call
+        
+        Returns:
+            Dictionary containing status code and response data
+        """
+        if self.cache is None or not use_cache:
+            return self._result(await self._request("GET", endpoint, self._get_headers(), params=params))
+        
+        headers = self._get_headers()
+        key, entry, hit = self._cache_lookup(endpoint, params, headers)
+        if hit is not None:
+            return hit
+        return self._cache_response(key, entry, await self._request("GET", endpoint, headers, params=params))
+    
+    async def post(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Make a POST request to the API.
+        
+        Args:
+            endpoint: API endpoint path
+            data: Request body data
+        
+        Returns:
+            Dictionary containing status code and response data
+        """
+        return self._result(await self._request("POST", endpoint, self._get_headers(), data=data))
+    
+    async def post_form(self, endpoint: str, form_data: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        Make a POST request with form data to the API.
+        
+        Args:
+            endpoint: API endpoint path
+            form_data: Form data to send
+        
+        Returns:
+            Dictionary containing status code and response data
+        """
+        return self._result(await self._request("POST", endpoint, self._get_form_headers(), form=form_data))
+    
+    async def put(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Make a PUT request to the API.
+        
+        Args:
+            endpoint: API endpoint path
+            data: Request body data
+        
+        Returns:
+            Dictionary containing status code and response data
+        """
+        return self._result(await self._request("PUT", endpoint, self._get_headers(), data=data))
+    
+    async def put_form(self, endpoint: str, form_data: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        Make a PUT request with form data to the API.
+        
+        Args:
+            endpoint: API endpoint path
+            form_data: Form data to send
+        
+        Returns:
+            Dictionary containing status code and response data
+        """
+        return self._result(await self._request("PUT", endpoint, self._get_form_headers(), form=form_data))
+    
+    async def delete(self, endpoint: str, form_data: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        Make a DELETE request to the API.
+        
+        Args:
+            endpoint: API endpoint path
+            form_data: Form data to send
+        
+        Returns:
+            Dictionary containing status code and response data
+        """
+        return self._result(await self._request("DELETE", endpoint, self._get_form_headers(), form=form_data))
+    
+    async def _request(self, method: str, endpoint: str, headers: Dict[str, str], **kwargs: Any) -> Any:
+        """
+        Send a request through the configured request context.
+        
+        An async APIRequestContext is awaited and its body read on the event
+        loop, so the result is a BufferedResponse the shared parsing can read
+        synchronously. A sync transport's fetch() runs on a worker thread, so
+        the pooled, httpx and HAR (record/replay) transports can all back
+        async controllers too.
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path
+            headers: Request headers
+            **kwargs: Extra fetch arguments (params, data, form)
+        
+        Returns:
+            Buffered response object
+        """
+        url, fetch_kwargs = self._build_request(method, endpoint, headers, **kwargs)
+        started = time.perf_counter_ns()
+        if inspect.iscoroutinefunction(self.request.fetch):
+            response = await self.request.fetch(url, **fetch_kwargs)
+            response = BufferedResponse(response.status, response.headers, response.url, await response.body())
+        else:
+            response = await asyncio.to_thread(self.request.fetch, url, **fetch_kwargs)
+        self._record_latency(method, endpoint, started, response)
+        return response
@@ -2,24 +2,39 @@
 Base API Client for AutomationExercise.com API testing.
 """
 import os
-from typing import Dict, Any, Optional
-import httpx
+import time
+from typing import Dict, Any, Optional, Tuple, Type, Union
 from playwright.sync_api import APIRequestContext
+from .request_pool import RequestContextPool
+from .response_cache import CachedResponse, ResponseCache
+from .latency import API_LATENCY, LatencyRecorder
+from .json_body import parse_body
+from .typed_response import ModelT, TypedResponse
 
 
-class BaseAPIClient:
-    """Base API client for AutomationExercise.com APIs."""
+class APIClientCore:
+    """Request building, caching, latency recording and response parsing.
+    
+    Shared by BaseAPIClient and AsyncBaseAPIClient, so the two only differ in
+    how they wait for the transport's fetch().
+    """
     
-    def __init__(self, request_context: APIRequestContext, base_url: Optional[str] = None):
+    def __init__(self, request_context: Any, base_url: Optional[str] = None,
+                 cache: Optional[ResponseCache] = None, latency: Optional[LatencyRecorder] = None):
         """
         Initialize the API client.
         
         Args:
-            request_context: Playwright API request context
+            request_context: Playwright API request context, or any transport with the
+                same fetch() (RequestContextPool, HttpxTransport, HarApiTransport)
             base_url: Base URL for API requests (optional)
+            cache: Cache for GET responses (optional; GETs always hit the server without it)
+            latency: Recorder for request timings (defaults to the process-wide API_LATENCY)
         """
         self.request = request_context
         self.base_url = base_url or os.getenv('API_BASE_URL', 'https://automationexercise.com/api')
+        self.cache = cache
+        self.latency = latency if latency is not None else API_LATENCY
     
     def init(self) -> None:
         """Initialize the API client (no authentication required for AutomationExercise.com)."""
@@ -40,28 +55,158 @@ class BaseAPIClient:
             'Accept': 'application/json'
         }
     
-    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def _build_request(self, method: str, endpoint: str, headers: Dict[str, str],
+                       **kwargs: Any) -> Tuple[str, Dict[str, Any]]:
         """
-        Make a GET request to the API.
+        Build the fetch() arguments of a request.
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path
+            headers: Request headers
+            **kwargs: Extra fetch arguments (params, data, form)
+        
+        Returns:
+            Request URL and the keyword arguments for fetch()
+        """
+        return f"{self.base_url}{endpoint}", {"method": method, "headers": headers, **kwargs}
+    
+    def _record_latency(self, method: str, endpoint: str, started_ns: int, response: Any) -> None:
+        """
+        Record the time spent in fetch() by method and endpoint.
+        
+        APIResponse has no connect/TTFB breakdown, so finer phases are only
+        recorded when the response carries a timings dict (HttpxTransport
+        reports wait and receive).
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path
+            started_ns: perf_counter_ns() taken before fetch()
+            response: Response returned by fetch()
+        """
+        self.latency.record(method, endpoint, time.perf_counter_ns() - started_ns)
+        for phase, elapsed_ns in (getattr(response, "timings", None) or {}).items():
+            self.latency.record(method, endpoint, elapsed_ns, phase)
+    
+    def _cache_lookup(self, endpoint: str, params: Optional[Dict[str, Any]],
+                      headers: Dict[str, str]) -> Tuple[str, Optional[CachedResponse], Optional[Dict[str, Any]]]:
+        """
+        Look a GET up in the response cache.
         
         Args:
             endpoint: API endpoint path
             params: Query parameters
-            
+            headers: Request headers; validators of a stale entry are added to them
+        
+        Returns:
+            Cache key, cached entry (None on a miss) and the result of a fresh hit (None otherwise)
+        """
+        key = self.cache.key(f"{self.base_url}{endpoint}", params)
+        entry, fresh = self.cache.lookup(key)
+        if entry is not None and fresh:
+            return key, entry, self.cache.result(entry)
+        if entry is not None:
+            headers.update(entry.conditional_headers())
+        return key, entry, None
+    
+    def _cache_response(self, key: str, entry: Optional[CachedResponse], response: Any) -> Dict[str, Any]:
+        """
+        Turn the response of a cached GET into its result, revalidating or storing the entry.
+        
+        Args:
+            key: Cache key from _cache_lookup()
+            entry: Stale entry the request was made conditional on (optional)
+            response: Response returned by fetch()
+        
         Returns:
             Dictionary containing status code and response data
         """
-        response = self.request.get(
-            f"{self.base_url}{endpoint}",
-            headers=self._get_headers(),
-            params=params
-        )
+        if response.status == 304 and entry is not None:
+            entry = self.cache.revalidated(key) or entry
+            return self.cache.result(entry)
         
         status = response.status
         data = self._parse_response(response)
+        if status == 200:
+            entry = CachedResponse(
+                status,
+                data,
+                etag=response.headers.get('etag'),
+                last_modified=response.headers.get('last-modified')
+            )
+            self.cache.store(key, entry)
+            # The caller gets a copy, so the cached data stays pristine
+            return self.cache.result(entry)
         
         return {"status": status, "data": data}
     
+    def _result(self, response: Any) -> Dict[str, Any]:
+        """
+        Get the status code and parsed data of a response.
+        
+        Args:
+            response: Response returned by fetch()
+        
+        Returns:
+            Dictionary containing status code and response data
+        """
+        return {"status": response.status, "data": self._parse_response(response)}
+    
+    def _parse_response(self, response) -> Any:
+        """
+        Parse the response from the API.
+        
+        The body is read once and decoded once (orjson when installed),
+        falling back to text when it is not JSON.
+        
+        Args:
+            response: Playwright response object
+        
+        Returns:
+            Parsed response data
+        """
+        return parse_body(response.body())
+
+
+class BaseAPIClient(APIClientCore):
+    """Base API client for AutomationExercise.com APIs."""
+    
+    def __init__(self, request_context: Union[APIRequestContext, RequestContextPool], base_url: Optional[str] = None,
+                 cache: Optional[ResponseCache] = None, latency: Optional[LatencyRecorder] = None):
+        """
+        Initialize the API client.
+        
+        Args:
+            request_context: Playwright API request context, or any transport with the
+                same fetch() (RequestContextPool, HttpxTransport, HarApiTransport)
+            base_url: Base URL for API requests (optional)
+            cache: Cache for GET responses (optional; GETs always hit the server without it)
+            latency: Recorder for request timings (defaults to the process-wide API_LATENCY)
+        """
+        super().__init__(request_context, base_url, cache, latency)
+    
+    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Make a GET request to the API.
+        
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+            use_cache: Set to False to bypass the response cache for this call
+        
+        Returns:
+            Dictionary containing status code and response data
+        """
+        if self.cache is None or not use_cache:
+            return self._result(self._request("GET", endpoint, self._get_headers(), params=params))
+        
+        headers = self._get_headers()
+        key, entry, hit = self._cache_lookup(endpoint, params, headers)
+        if hit is not None:
+            return hit
+        return self._cache_response(key, entry, self._request("GET", endpoint, headers, params=params))
+    
     def post(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Make a POST request to the API.
@@ -69,20 +214,11 @@ class BaseAPIClient:
         Args:
             endpoint: API endpoint path
             data: Request body data
-            
+        
         Returns:
             Dictionary containing status code and response data
         """
-        response = self.request.post(
-            f"{self.base_url}{endpoint}",
-            headers=self._get_headers(),
-            data=data
-        )
-        
-        status = response.status
-        response_data = self._parse_response(response)
-        
-        return {"status": status, "data": response_data}
+        return self._result(self._request("POST", endpoint, self._get_headers(), data=data))
     
     def post_form(self, endpoint: str, form_data: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """
@@ -91,20 +227,11 @@ class BaseAPIClient:
         Args:
             endpoint: API endpoint path
             form_data: Form data to send
-            
+        
         Returns:
             Dictionary containing status code and response data
         """
-        response = self.request.post(
-            f"{self.base_url}{endpoint}",
-            headers=self._get_form_headers(),
-            form=form_data
-        )
-        
-        status = response.status
-        response_data = self._parse_response(response)
-        
-        return {"status": status, "data": response_data}
+        return self._result(self._request("POST", endpoint, self._get_form_headers(), form=form_data))
     
     def put(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -113,20 +240,11 @@ class BaseAPIClient:
         Args:
             endpoint: API endpoint path
             data: Request body data
-            
+        
         Returns:
             Dictionary containing status code and response data
         """
-        response = self.request.put(
-            f"{self.base_url}{endpoint}",
-            headers=self._get_headers(),
-            data=data
-        )
-        
-        status = response.status
-        response_data = self._parse_response(response)
-        
-        return {"status": status, "data": response_data}
+        return self._result(self._request("PUT", endpoint, self._get_headers(), data=data))
     
     def put_form(self, endpoint: str, form_data: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """
@@ -135,20 +253,11 @@ class BaseAPIClient:
         Args:
             endpoint: API endpoint path
             form_data: Form data to send
-            
+        
         Returns:
             Dictionary containing status code and response data
         """
-        response = self.request.put(
-            f"{self.base_url}{endpoint}",
-            headers=self._get_form_headers(),
-            form=form_data
-        )
-        
-        status = response.status
-        response_data = self._parse_response(response)
-        
-        return {"status": status, "data": response_data}
+        return self._result(self._request("PUT", endpoint, self._get_form_headers(), form=form_data))
     
     def delete(self, endpoint: str, form_data: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """
@@ -157,33 +266,59 @@ class BaseAPIClient:
         Args:
             endpoint: API endpoint path
             form_data: Form data to send
-            
+        
         Returns:
             Dictionary containing status code and response data
         """
-        response = self.request.delete(
-            f"{self.base_url}{endpoint}",
-            headers=self._get_form_headers(),
-            form=form_data
-        )
+        return self._result(self._request("DELETE", endpoint, self._get_form_headers(), form=form_data))
+    
+    def typed(self, method: str, endpoint: str, model_type: Type[ModelT],
+              params: Optional[Dict[str, Any]] = None,
+              form_data: Optional[Dict[str, str]] = None) -> TypedResponse[ModelT]:
+        """
+        Make a request whose body is decoded only when the caller asks for it.
         
-        status = response.status
-        data = self._parse_response(response)
+        The response cache is bypassed: the raw bytes are what makes the
+        result cheap, and cached entries only hold decoded data.
         
-        return {"status": status, "data": data}
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path
+            model_type: Pydantic model of a successful response body
+            params: Query parameters
+            form_data: Form data to send
+        
+        Returns:
+            Typed response over the raw body
+        """
+        headers = self._get_form_headers() if form_data is not None else self._get_headers()
+        kwargs: Dict[str, Any] = {}
+        if params is not None:
+            kwargs["params"] = params
+        if form_data is not None:
+            kwargs["form"] = form_data
+        response = self._request(method, endpoint, headers, **kwargs)
+        return TypedResponse(response.status, response.body(), model_type, headers=response.headers)
     
-    def _parse_response(self, response) -> Any:
+    def _request(self, method: str, endpoint: str, headers: Dict[str, str], **kwargs: Any) -> Any:
         """
-        Parse the response from the API.
+        Send a request through the configured request context.
+        
+        APIRequestContext and the pooled, httpx and HAR transports all expose
+        fetch(), so the verb helpers do not need to know which one they were
+        given. The time spent in fetch() is recorded by method and endpoint.
         
         Args:
-            response: Playwright response object
-            
+            method: HTTP method
+            endpoint: API endpoint path
+            headers: Request headers
+            **kwargs: Extra fetch arguments (params, data, form)
+        
         Returns:
-            Parsed response data
+            Playwright (or buffered) response object
         """
-        try:
-            return response.json()
-        except Exception:
-            # If JSON parsing fails, return text content
-            return response.text()
+        started = time.perf_counter_ns()
+        url, fetch_kwargs = self._build_request(method, endpoint, headers, **kwargs)
+        response = self.request.fetch(url, **fetch_kwargs)
+        self._record_latency(method, endpoint, started, response)
+        return response
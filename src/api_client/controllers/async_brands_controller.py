@@ -0,0 +1,28 @@
+"""
+Async Brands API Controller for AutomationExercise.com.
+"""
+from typing import Dict, Any
+from ..async_base_client import AsyncBaseAPIClient
+from .endpoints import BRANDS_LIST
+
+
+class AsyncBrandsController(AsyncBaseAPIClient):
+    """Async controller for Brands API endpoints."""
+    
+    async def get_all_brands(self) -> Dict[str, Any]:
+        """
+        Get all brands list.
+        
+        Returns:
+            Dictionary containing status code and brands data
+        """
+        return await self.get(BRANDS_LIST)
+    
+    async def put_to_brands_list(self) -> Dict[str, Any]:
+        """
+        PUT to brands list (should return 405 Method Not Allowed).
+        
+        Returns:
+            Dictionary containing status code and error data
+        """
+        return await self.put(BRANDS_LIST)
@@ -0,0 +1,49 @@
+"""
+Async Products API Controller for AutomationExercise.com.
+"""
+from typing import Dict, Any
+from ..async_base_client import AsyncBaseAPIClient
+from .endpoints import PRODUCTS_LIST, SEARCH_PRODUCT, search_form
+
+
+class AsyncProductsController(AsyncBaseAPIClient):
+    """Async controller for Products API endpoints."""
+    
+    async def get_all_products(self) -> Dict[str, Any]:
+        """
+        Get all products list.
+        
+        Returns:
+            Dictionary containing status code and products data
+        """
+        return await self.get(PRODUCTS_LIST)
+    
+    async def post_to_products_list(self) -> Dict[str, Any]:
+        """
+        POST to products list (should return 405 Method Not Allowed).
+        
+        Returns:
+            Dictionary containing status code and error data
+        """
+        return await self.post(PRODUCTS_LIST)
+    
+    async def search_product(self, search_term: str) -> Dict[str, Any]:
+        """
+        Search for products by term.
+        
+        Args:
+            search_term: Product search term
+            
+        Returns:
+            Dictionary containing status code and search results
+        """
+        return await self.post_form(SEARCH_PRODUCT, search_form(search_term))
+    
+    async def search_product_without_parameter(self) -> Dict[str, Any]:
+        """
+        Search product without parameter (should return 400 Bad Request).
+        
+        Returns:
+            Dictionary containing status code and error data
+        """
+        return await self.post_form(SEARCH_PRODUCT)
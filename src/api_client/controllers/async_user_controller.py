@@ -0,0 +1,123 @@
+"""
+Async User Authentication API Controller for AutomationExercise.com.
+"""
+from typing import Dict, Any
+from ..async_base_client import AsyncBaseAPIClient
+from .endpoints import (
+    CREATE_ACCOUNT, DELETE_ACCOUNT, UPDATE_ACCOUNT, USER_DETAIL_BY_EMAIL, VERIFY_LOGIN, account_form,
+    credentials_form, email_params
+)
+
+
+class AsyncUserController(AsyncBaseAPIClient):
+    """Async controller for User Authentication API endpoints."""
+    
+    async def verify_login(self, email: str, password: str) -> Dict[str, Any]:
+        """
+        Verify login with valid credentials.
+        
+        Args:
+            email: User email
+            password: User password
+            
+        Returns:
+            Dictionary containing status code and login response
+        """
+        return await self.post_form(VERIFY_LOGIN, credentials_form(email, password))
+    
+    async def verify_login_without_email(self, password: str) -> Dict[str, Any]:
+        """
+        Verify login without email parameter (should return 400 Bad Request).
+        
+        Args:
+            password: User password
+            
+        Returns:
+            Dictionary containing status code and error data
+        """
+        return await self.post_form(VERIFY_LOGIN, {"password": password})
+    
+    async def delete_verify_login(self) -> Dict[str, Any]:
+        """
+        DELETE to verify login (should return 405 Method Not Allowed).
+        
+        Returns:
+            Dictionary containing status code and error data
+        """
+        return await self.delete(VERIFY_LOGIN)
+    
+    async def verify_login_invalid_details(self, email: str, password: str) -> Dict[str, Any]:
+        """
+        Verify login with invalid credentials.
+        
+        Args:
+            email: Invalid user email
+            password: Invalid user password
+            
+        Returns:
+            Dictionary containing status code and error response
+        """
+        return await self.post_form(VERIFY_LOGIN, credentials_form(email, password))
+    
+    async def create_user_account(self, name: str, email: str, password: str, 
+                                 first_name: str = "", last_name: str = "", 
+                                 address1: str = "", address2: str = "", 
+                                 country: str = "", state: str = "", 
+                                 city: str = "", zipcode: str = "", 
+                                 mobile_number: str = "") -> Dict[str, Any]:
+        """
+        Create/Register user account.
+        
+        Args:
+            Account fields, as for endpoints.account_form
+            
+        Returns:
+            Dictionary containing status code and user creation response
+        """
+        form_data = account_form(name, email, password, first_name, last_name, address1, address2,
+                                 country, state, city, zipcode, mobile_number)
+        return await self.post_form(CREATE_ACCOUNT, form_data)
+    
+    async def delete_user_account(self, email: str, password: str) -> Dict[str, Any]:
+        """
+        Delete user account.
+        
+        Args:
+            email: User email
+            password: User password
+            
+        Returns:
+            Dictionary containing status code and deletion response
+        """
+        return await self.delete(DELETE_ACCOUNT, credentials_form(email, password))
+    
+    async def update_user_account(self, name: str, email: str, password: str, 
+                                 first_name: str = "", last_name: str = "", 
+                                 address1: str = "", address2: str = "", 
+                                 country: str = "", state: str = "", 
+                                 city: str = "", zipcode: str = "", 
+                                 mobile_number: str = "") -> Dict[str, Any]:
+        """
+        Update user account.
+        
+        Args:
+            Account fields, as for endpoints.account_form
+            
+        Returns:
+            Dictionary containing status code and update response
+        """
+        form_data = account_form(name, email, password, first_name, last_name, address1, address2,
+                                 country, state, city, zipcode, mobile_number)
+        return await self.put_form(UPDATE_ACCOUNT, form_data)
+    
+    async def get_user_account_detail(self, email: str) -> Dict[str, Any]:
+        """
+        Get user account detail by email.
+        
+        Args:
+            email: User email
+            
+        Returns:
+            Dictionary containing status code and user details
+        """
+        return await self.get(USER_DETAIL_BY_EMAIL, email_params(email))
@@ -2,20 +2,26 @@
 Brands API Controller for AutomationExercise.com.
 """
 from typing import Dict, Any
+from src.models.product import BrandsResponse
 from ..base_client import BaseAPIClient
+from ..typed_response import TypedResponse
+from .endpoints import BRANDS_LIST
 
 
 class BrandsController(BaseAPIClient):
     """Controller for Brands API endpoints."""
     
-    def get_all_brands(self) -> Dict[str, Any]:
+    def get_all_brands(self, use_cache: bool = True) -> Dict[str, Any]:
         """
         Get all brands list.
         
+        Args:
+            use_cache: Set to False to always fetch a fresh list
+            
         Returns:
             Dictionary containing status code and brands data
         """
-        return self.get("/brandsList")
+        return self.get(BRANDS_LIST, use_cache=use_cache)
     
     def put_to_brands_list(self) -> Dict[str, Any]:
         """
@@ -24,4 +30,13 @@ class BrandsController(BaseAPIClient):
         Returns:
             Dictionary containing status code and error data
         """
-        return self.put("/brandsList")
+        return self.put(BRANDS_LIST)
+    
+    def brands_list(self) -> TypedResponse[BrandsResponse]:
+        """
+        Get all brands as a typed response (never cached).
+        
+        Returns:
+            Response whose .model is a BrandsResponse, validated on first access
+        """
+        return self.typed("GET", BRANDS_LIST, BrandsResponse)
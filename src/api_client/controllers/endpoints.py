@@ -0,0 +1,73 @@
+"""
+Endpoint paths and request payloads shared by the sync and async API controllers.
+"""
+from typing import Dict
+
+PRODUCTS_LIST = "/productsList"
+SEARCH_PRODUCT = "/searchProduct"
+BRANDS_LIST = "/brandsList"
+VERIFY_LOGIN = "/verifyLogin"
+CREATE_ACCOUNT = "/createAccount"
+DELETE_ACCOUNT = "/deleteAccount"
+UPDATE_ACCOUNT = "/updateAccount"
+USER_DETAIL_BY_EMAIL = "/getUserDetailByEmail"
+
+
+def search_form(search_term: str) -> Dict[str, str]:
+    """Form fields of a product search."""
+    return {"search_product": search_term}
+
+
+def credentials_form(email: str, password: str) -> Dict[str, str]:
+    """Form fields of a login check or account deletion."""
+    return {
+        "email": email,
+        "password": password
+    }
+
+
+def email_params(email: str) -> Dict[str, str]:
+    """Query parameters of a user detail lookup."""
+    return {"email": email}
+
+
+def account_form(name: str, email: str, password: str,
+                 first_name: str = "", last_name: str = "",
+                 address1: str = "", address2: str = "",
+                 country: str = "", state: str = "",
+                 city: str = "", zipcode: str = "",
+                 mobile_number: str = "") -> Dict[str, str]:
+    """
+    Form fields of an account creation or update.
+    
+    Args:
+        name: User name
+        email: User email
+        password: User password
+        first_name: User first name
+        last_name: User last name
+        address1: User address line 1
+        address2: User address line 2
+        country: User country
+        state: User state
+        city: User city
+        zipcode: User zipcode
+        mobile_number: User mobile number
+    
+    Returns:
+        Form fields
+    """
+    return {
+        "name": name,
+        "email": email,
+        "password": password,
+        "first_name": first_name,
+        "last_name": last_name,
+        "address1": address1,
+        "address2": address2,
+        "country": country,
+        "state": state,
+        "city": city,
+        "zipcode": zipcode,
+        "mobile_number": mobile_number
+    }
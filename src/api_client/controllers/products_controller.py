@@ -2,20 +2,26 @@
 Products API Controller for AutomationExercise.com.
 """
 from typing import Dict, Any
+from src.models.product import ProductsResponse, SearchProductResponse
 from ..base_client import BaseAPIClient
+from ..typed_response import TypedResponse
+from .endpoints import PRODUCTS_LIST, SEARCH_PRODUCT, search_form
 
 
 class ProductsController(BaseAPIClient):
     """Controller for Products API endpoints."""
     
-    def get_all_products(self) -> Dict[str, Any]:
+    def get_all_products(self, use_cache: bool = True) -> Dict[str, Any]:
         """
         Get all products list.
         
+        Args:
+            use_cache: Set to False to always fetch a fresh list
+            
         Returns:
             Dictionary containing status code and products data
         """
-        return self.get("/productsList")
+        return self.get(PRODUCTS_LIST, use_cache=use_cache)
     
     def post_to_products_list(self) -> Dict[str, Any]:
         """
@@ -24,7 +30,7 @@ class ProductsController(BaseAPIClient):
         Returns:
             Dictionary containing status code and error data
         """
-        return self.post("/productsList")
+        return self.post(PRODUCTS_LIST)
     
     def search_product(self, search_term: str) -> Dict[str, Any]:
         """
@@ -36,8 +42,7 @@ class ProductsController(BaseAPIClient):
         Returns:
             Dictionary containing status code and search results
         """
-        form_data = {"search_product": search_term}
-        return self.post_form("/searchProduct", form_data)
+        return self.post_form(SEARCH_PRODUCT, search_form(search_term))
     
     def search_product_without_parameter(self) -> Dict[str, Any]:
         """
@@ -46,4 +51,25 @@ class ProductsController(BaseAPIClient):
         Returns:
             Dictionary containing status code and error data
         """
-        return self.post_form("/searchProduct")
+        return self.post_form(SEARCH_PRODUCT)
+    
+    def products_list(self) -> TypedResponse[ProductsResponse]:
+        """
+        Get all products as a typed response (never cached).
+        
+        Returns:
+            Response whose .model is a ProductsResponse, validated on first access
+        """
+        return self.typed("GET", PRODUCTS_LIST, ProductsResponse)
+    
+    def search_products(self, search_term: str) -> TypedResponse[SearchProductResponse]:
+        """
+        Search for products by term, as a typed response.
+        
+        Args:
+            search_term: Product search term
+            
+        Returns:
+            Response whose .model is a SearchProductResponse, validated on first access
+        """
+        return self.typed("POST", SEARCH_PRODUCT, SearchProductResponse, form_data=search_form(search_term))
@@ -2,7 +2,13 @@
 User Authentication API Controller for AutomationExercise.com.
 """
 from typing import Dict, Any
+from src.models.user import UserDetailResponse
 from ..base_client import BaseAPIClient
+from ..typed_response import TypedResponse
+from .endpoints import (
+    CREATE_ACCOUNT, DELETE_ACCOUNT, UPDATE_ACCOUNT, USER_DETAIL_BY_EMAIL, VERIFY_LOGIN, account_form,
+    credentials_form, email_params
+)
 
 
 class UserController(BaseAPIClient):
@@ -19,11 +25,7 @@ class UserController(BaseAPIClient):
         Returns:
             Dictionary containing status code and login response
         """
-        form_data = {
-            "email": email,
-            "password": password
-        }
-        return self.post_form("/verifyLogin", form_data)
+        return self.post_form(VERIFY_LOGIN, credentials_form(email, password))
     
     def verify_login_without_email(self, password: str) -> Dict[str, Any]:
         """
@@ -35,8 +37,7 @@ class UserController(BaseAPIClient):
         Returns:
             Dictionary containing status code and error data
         """
-        form_data = {"password": password}
-        return self.post_form("/verifyLogin", form_data)
+        return self.post_form(VERIFY_LOGIN, {"password": password})
     
     def delete_verify_login(self) -> Dict[str, Any]:
         """
@@ -45,7 +46,7 @@ class UserController(BaseAPIClient):
         Returns:
             Dictionary containing status code and error data
         """
-        return self.delete("/verifyLogin")
+        return self.delete(VERIFY_LOGIN)
     
     def verify_login_invalid_details(self, email: str, password: str) -> Dict[str, Any]:
         """
@@ -58,11 +59,7 @@ class UserController(BaseAPIClient):
         Returns:
             Dictionary containing status code and error response
         """
-        form_data = {
-            "email": email,
-            "password": password
-        }
-        return self.post_form("/verifyLogin", form_data)
+        return self.post_form(VERIFY_LOGIN, credentials_form(email, password))
     
     def create_user_account(self, name: str, email: str, password: str, 
                            first_name: str = "", last_name: str = "", 
@@ -90,21 +87,9 @@ class UserController(BaseAPIClient):
         Returns:
             Dictionary containing status code and user creation response
         """
-        form_data = {
-            "name": name,
-            "email": email,
-            "password": password,
-            "first_name": first_name,
-            "last_name": last_name,
-            "address1": address1,
-            "address2": address2,
-            "country": country,
-            "state": state,
-            "city": city,
-            "zipcode": zipcode,
-            "mobile_number": mobile_number
-        }
-        return self.post_form("/createAccount", form_data)
+        form_data = account_form(name, email, password, first_name, last_name, address1, address2,
+                                 country, state, city, zipcode, mobile_number)
+        return self.post_form(CREATE_ACCOUNT, form_data)
     
     def delete_user_account(self, email: str, password: str) -> Dict[str, Any]:
         """
@@ -117,11 +102,7 @@ class UserController(BaseAPIClient):
         Returns:
             Dictionary containing status code and deletion response
         """
-        form_data = {
-            "email": email,
-            "password": password
-        }
-        return self.delete("/deleteAccount", form_data)
+        return self.delete(DELETE_ACCOUNT, credentials_form(email, password))
     
     def update_user_account(self, name: str, email: str, password: str, 
                            first_name: str = "", last_name: str = "", 
@@ -149,21 +130,9 @@ class UserController(BaseAPIClient):
         Returns:
             Dictionary containing status code and update response
         """
-        form_data = {
-            "name": name,
-            "email": email,
-            "password": password,
-            "first_name": first_name,
-            "last_name": last_name,
-            "address1": address1,
-            "address2": address2,
-            "country": country,
-            "state": state,
-            "city": city,
-            "zipcode": zipcode,
-            "mobile_number": mobile_number
-        }
-        return self.put_form("/updateAccount", form_data)
+        form_data = account_form(name, email, password, first_name, last_name, address1, address2,
+                                 country, state, city, zipcode, mobile_number)
+        return self.put_form(UPDATE_ACCOUNT, form_data)
     
     def get_user_account_detail(self, email: str) -> Dict[str, Any]:
         """
@@ -175,5 +144,16 @@ class UserController(BaseAPIClient):
         Returns:
             Dictionary containing status code and user details
         """
-        params = {"email": email}
-        return self.get("/getUserDetailByEmail", params)
+        return self.get(USER_DETAIL_BY_EMAIL, email_params(email))
+    
+    def user_detail(self, email: str) -> TypedResponse[UserDetailResponse]:
+        """
+        Get user account details by email, as a typed response.
+        
+        Args:
+            email: User email address
+            
+        Returns:
+            Response whose .model is a UserDetailResponse, validated on first access
+        """
+        return self.typed("GET", USER_DETAIL_BY_EMAIL, UserDetailResponse, params=email_params(email))
@@ -0,0 +1,146 @@
+"""
+httpx-based API transport for AutomationExercise.com API testing.
+"""
+import json
+import time
+from typing import Any, Dict, Optional
+import httpx
+from .request_pool import BufferedResponse
+
+
+class HttpxTransport:
+    """Standalone HTTP client exposing the same fetch() as RequestContextPool.
+    
+    No browser or Playwright driver is started: one thread-safe httpx.Client
+    keeps a pool of keep-alive connections (optionally HTTP/2) that every
+    controller and test thread shares. base_url, default headers, timeouts
+    and TLS settings are set once here instead of on every request.
+    Responses are read fully and returned as BufferedResponse, with the
+    wait (until headers) and receive (body) times for the latency recorder.
+    """
+    
+    def __init__(self, base_url: str = "", headers: Optional[Dict[str, str]] = None,
+                 max_connections: int = 10, max_keepalive_connections: int = 10,
+                 keepalive_expiry: float = 30.0, http2: bool = False, timeout: float = 30.0,
+                 ignore_https_errors: bool = False, max_redirects: int = 20):
+        """
+        Initialize the client.
+        
+        Args:
+            base_url: Prefix for relative URLs (absolute URLs are sent as they are)
+            headers: Headers sent with every request
+            max_connections: Connections open at once (match the number of test threads)
+            max_keepalive_connections: Idle connections kept open for reuse
+            keepalive_expiry: Seconds an idle connection is kept
+            http2: Negotiate HTTP/2 (needs the h2 package: pip install httpx[http2])
+            timeout: Default timeout in seconds
+            ignore_https_errors: Skip TLS certificate verification
+            max_redirects: Redirects followed per request (Playwright's default is 20)
+        """
+        self.max_redirects = max_redirects
+        self.client = httpx.Client(
+            base_url=base_url,
+            headers=headers,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry
+            ),
+            http2=http2,
+            timeout=timeout,
+            verify=not ignore_https_errors,
+            # APIRequestContext follows redirects, so both transports see the same final response
+            follow_redirects=True,
+            max_redirects=max_redirects
+        )
+    
+    def fetch(self, url: str, method: str = "GET", headers: Optional[Dict[str, str]] = None,
+              params: Optional[Dict[str, Any]] = None, data: Any = None,
+              form: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None,
+              max_redirects: Optional[int] = None, **kwargs: Any) -> BufferedResponse:
+        """
+        Send a request, with the arguments APIRequestContext.fetch takes.
+        
+        Args:
+            url: Request URL
+            method: HTTP method
+            headers: Request headers
+            params: Query parameters
+            data: Request body (dicts and lists are sent as JSON, like Playwright does)
+            form: Form fields, sent URL-encoded
+            timeout: Timeout in milliseconds (Playwright's unit)
+            max_redirects: Redirects to follow (0 returns the redirect itself); defaults to the client's
+            **kwargs: Other Playwright fetch options (ignored)
+        
+        Returns:
+            Fully read response
+        """
+        content = None
+        if isinstance(data, (dict, list)):
+            content = json.dumps(data).encode("utf-8")
+        elif data is not None:
+            content = data.encode("utf-8") if isinstance(data, str) else data
+        
+        request = self.client.build_request(
+            method,
+            url,
+            headers=headers,
+            params=params,
+            content=content,
+            data=form,
+            timeout=timeout / 1000 if timeout is not None else httpx.USE_CLIENT_DEFAULT
+        )
+        # Streamed, so the wait for the headers and the body download are timed apart
+        started = time.perf_counter_ns()
+        response = self._send(request, max_redirects)
+        headers_at = time.perf_counter_ns()
+        try:
+            body = response.read()
+        finally:
+            response.close()
+        finished = time.perf_counter_ns()
+        return BufferedResponse(
+            status=response.status_code,
+            headers=dict(response.headers),
+            url=str(response.url),
+            body=body,
+            timings={"wait": headers_at - started, "receive": finished - headers_at}
+        )
+    
+    def _send(self, request: httpx.Request, max_redirects: Optional[int]) -> httpx.Response:
+        """
+        Send a request streamed, following redirects the way APIRequestContext.fetch does.
+        
+        httpx only sets the redirect limit per client, so a per-request
+        max_redirects is applied by following response.next_request here.
+        
+        Args:
+            request: Request to send
+            max_redirects: Redirects to follow, or None for the client's limit
+        
+        Returns:
+            Final response, with its body not yet read
+        """
+        if max_redirects is None or max_redirects == self.max_redirects:
+            return self.client.send(request, stream=True)
+        
+        response = self.client.send(request, stream=True, follow_redirects=False)
+        for _ in range(max_redirects):
+            if response.next_request is None:
+                return response
+            response.close()
+            response = self.client.send(response.next_request, stream=True, follow_redirects=False)
+        if max_redirects > 0 and response.next_request is not None:
+            response.close()
+            raise httpx.TooManyRedirects("Exceeded maximum allowed redirects.", request=response.request)
+        return response
+    
+    def close(self) -> None:
+        """Close every pooled connection."""
+        self.client.close()
+    
+    def __enter__(self) -> "HttpxTransport":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,48 @@
+"""
+Response body decoding for AutomationExercise API clients.
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional: the standard library decoder is used instead
+    orjson = None
+
+
+def loads(body: bytes) -> Any:
+    """
+    Decode a JSON document, with orjson when it is installed.
+    
+    Args:
+        body: Raw JSON bytes
+    
+    Returns:
+        Decoded value
+    
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def parse_body(body: bytes) -> Any:
+    """
+    Decode a response body: JSON when it is JSON, text otherwise.
+    
+    The bytes are read once by the caller and decoded once here, instead of
+    asking the response for json() and then text() again on failure.
+    
+    Args:
+        body: Raw response body
+    
+    Returns:
+        Decoded JSON value, or the body as text
+    """
+    try:
+        return loads(body)
+    except ValueError:
+        # orjson.JSONDecodeError and UnicodeDecodeError are ValueErrors too
+        return body.decode('utf-8', errors='replace')
@@ -0,0 +1,228 @@
+"""
+API request latency recording for AutomationExercise testing framework.
+"""
+import json
+import math
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Bucket width: each bucket is 1% wider than the previous one, so percentiles are within 1%
+BUCKET_GROWTH = 1.01
+_LOG_GROWTH = math.log(BUCKET_GROWTH)
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram in nanoseconds.
+    
+    Memory stays bounded no matter how many samples are recorded, and two
+    histograms merge by adding bucket counts, so per-worker histograms can be
+    combined into exact run-wide ones.
+    """
+    
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+    
+    @staticmethod
+    def bucket_of(value_ns: int) -> int:
+        """Get the bucket index of a value."""
+        return math.ceil(math.log(value_ns) / _LOG_GROWTH) if value_ns > 1 else 0
+    
+    def record(self, value_ns: int) -> None:
+        """
+        Add a sample.
+        
+        Args:
+            value_ns: Latency in nanoseconds
+        """
+        value_ns = max(int(value_ns), 1)
+        bucket = self.bucket_of(value_ns)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.min_ns = value_ns if not self.count else min(self.min_ns, value_ns)
+        self.max_ns = max(self.max_ns, value_ns)
+        self.count += 1
+        self.total_ns += value_ns
+    
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Add the samples of another histogram.
+        
+        Args:
+            other: Histogram to merge in
+        """
+        if not other.count:
+            return
+        for bucket, count in other.buckets.items():
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + count
+        self.min_ns = other.min_ns if not self.count else min(self.min_ns, other.min_ns)
+        self.max_ns = max(self.max_ns, other.max_ns)
+        self.count += other.count
+        self.total_ns += other.total_ns
+    
+    def percentile(self, percent: float) -> int:
+        """
+        Get a percentile.
+        
+        Args:
+            percent: Percentile between 0 and 100 (e.g. 99)
+        
+        Returns:
+            Latency in nanoseconds (0 when the histogram is empty)
+        """
+        if not self.count:
+            return 0
+        rank = max(math.ceil(self.count * percent / 100), 1)
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                # Upper bound of the bucket, clamped to what was actually observed
+                return min(max(round(BUCKET_GROWTH ** bucket), self.min_ns), self.max_ns)
+        return self.max_ns
+    
+    def summary_ms(self) -> Dict[str, float]:
+        """Get count, mean, p50/p90/p99 and max, in milliseconds."""
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ns / self.count / 1e6, 3) if self.count else 0.0,
+            "p50_ms": round(self.percentile(50) / 1e6, 3),
+            "p90_ms": round(self.percentile(90) / 1e6, 3),
+            "p99_ms": round(self.percentile(99) / 1e6, 3),
+            "max_ms": round(self.max_ns / 1e6, 3),
+        }
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to JSON-compatible data."""
+        return {
+            "buckets": {str(bucket): count for bucket, count in self.buckets.items()},
+            "count": self.count,
+            "total_ns": self.total_ns,
+            "min_ns": self.min_ns,
+            "max_ns": self.max_ns,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        """Rebuild a histogram from to_dict() output."""
+        histogram = cls()
+        histogram.buckets = {int(bucket): count for bucket, count in data["buckets"].items()}
+        histogram.count = data["count"]
+        histogram.total_ns = data["total_ns"]
+        histogram.min_ns = data["min_ns"]
+        histogram.max_ns = data["max_ns"]
+        return histogram
+
+
+class LatencyRecorder:
+    """Thread-safe latency histograms keyed by method, endpoint and phase.
+    
+    BaseAPIClient records the time spent in fetch() as the "total" phase.
+    Transports whose responses carry a timings dict (phase -> nanoseconds)
+    get those phases recorded as well. A recorder created with a parent also
+    records into it, so a test can keep its own samples apart while the
+    run-wide report still sees them.
+    """
+    
+    def __init__(self, parent: Optional["LatencyRecorder"] = None):
+        """
+        Initialize the recorder.
+        
+        Args:
+            parent: Recorder that receives a copy of every sample (optional)
+        """
+        self.parent = parent
+        self._lock = threading.Lock()
+        self._histograms: Dict[Tuple[str, str, str], LatencyHistogram] = {}
+    
+    def record(self, method: str, endpoint: str, elapsed_ns: int, phase: str = "total") -> None:
+        """
+        Record one request timing.
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path (e.g. "/productsList")
+            elapsed_ns: Duration in nanoseconds
+            phase: Part of the request that was timed
+        """
+        key = (method.upper(), endpoint, phase)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram()
+            histogram.record(elapsed_ns)
+        if self.parent is not None:
+            self.parent.record(method, endpoint, elapsed_ns, phase)
+    
+    def histogram(self, method: str, endpoint: str, phase: str = "total") -> LatencyHistogram:
+        """
+        Get a copy of the histogram of one endpoint.
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path
+            phase: Timed phase
+        
+        Returns:
+            Histogram (empty if nothing was recorded)
+        """
+        copy = LatencyHistogram()
+        with self._lock:
+            histogram = self._histograms.get((method.upper(), endpoint, phase))
+            if histogram is not None:
+                copy.merge(histogram)
+        return copy
+    
+    def merge(self, entries: Iterable[Dict[str, Any]]) -> None:
+        """
+        Merge serialized histograms (e.g. received from an xdist worker).
+        
+        Args:
+            entries: Items of to_list() output
+        """
+        with self._lock:
+            for entry in entries:
+                key = (entry["method"], entry["endpoint"], entry["phase"])
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    histogram = self._histograms[key] = LatencyHistogram()
+                histogram.merge(LatencyHistogram.from_dict(entry["histogram"]))
+    
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Serialize every histogram to JSON-compatible data."""
+        with self._lock:
+            return [
+                {"method": method, "endpoint": endpoint, "phase": phase, "histogram": histogram.to_dict()}
+                for (method, endpoint, phase), histogram in self._histograms.items()
+            ]
+    
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Get percentile summaries keyed by "METHOD /endpoint [phase]", slowest p99 first."""
+        with self._lock:
+            rows = {
+                f"{method} {endpoint}" + ("" if phase == "total" else f" [{phase}]"): histogram.summary_ms()
+                for (method, endpoint, phase), histogram in self._histograms.items()
+            }
+        return dict(sorted(rows.items(), key=lambda item: item[1]["p99_ms"], reverse=True))
+    
+    def write_json(self, path: str) -> None:
+        """
+        Write the percentile summary to a JSON file.
+        
+        Args:
+            path: Output file path
+        """
+        with open(path, "w", encoding="utf-8") as report_file:
+            json.dump(self.summary(), report_file, indent=2)
+    
+    def __bool__(self) -> bool:
+        """Whether anything was recorded."""
+        with self._lock:
+            return bool(self._histograms)
+
+
+# Recorder for the current process; BaseAPIClient records into it by default
+API_LATENCY = LatencyRecorder()
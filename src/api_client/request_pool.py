@@ -0,0 +1,163 @@
+"""
+Thread-safe pool of Playwright API request contexts for AutomationExercise.com API testing.
+"""
+import json
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Dict, Any, List, Optional
+from playwright.sync_api import sync_playwright
+
+
+class BufferedResponse:
+    """Fully read API response that can be used from any thread."""
+    
+    def __init__(self, status: int, headers: Dict[str, str], url: str, body: bytes,
+                 timings: Optional[Dict[str, int]] = None):
+        """
+        Initialize the buffered response.
+        
+        Args:
+            status: HTTP status code
+            headers: Response headers
+            url: Final response URL
+            body: Raw response body
+            timings: Nanoseconds per request phase, when the transport measures them
+        """
+        self.status = status
+        self.headers = headers
+        self.url = url
+        self._body = body
+        self.timings = timings
+    
+    @property
+    def ok(self) -> bool:
+        """Check if the status code is in the 2xx range."""
+        return 200 <= self.status <= 299
+    
+    def body(self) -> bytes:
+        """Get the raw response body."""
+        return self._body
+    
+    def text(self) -> str:
+        """Get the response body as text."""
+        return self._body.decode('utf-8', errors='replace')
+    
+    def json(self) -> Any:
+        """Get the response body parsed as JSON."""
+        return json.loads(self._body)
+
+
+class RequestContextPool:
+    """Pool of isolated APIRequestContexts, each pinned to its own worker thread.
+    
+    Playwright's sync API binds every object to the thread that created it, so a
+    single request context cannot be shared between test threads. The pool owns
+    one Playwright instance and request context per worker thread; callers lease
+    whichever worker is idle through fetch(), which blocks until the response
+    has been fully read on that worker.
+    """
+    
+    _STOP = object()
+    
+    def __init__(self, size: int = 4, **context_options: Any):
+        """
+        Initialize the pool and start its worker threads.
+        
+        Args:
+            size: Number of request contexts (and worker threads) in the pool
+            **context_options: Options passed to playwright.request.new_context()
+        """
+        if size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {size}")
+        
+        self.size = size
+        self.context_options = context_options
+        self._jobs: "queue.Queue[Any]" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._startup_errors: List[BaseException] = []
+        self._closed = False
+        
+        ready = threading.Barrier(size + 1)
+        for index in range(size):
+            thread = threading.Thread(
+                target=self._worker,
+                args=(ready,),
+                name=f"api-request-context-{index}",
+                daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        
+        ready.wait()
+        if self._startup_errors:
+            self.close()
+            raise RuntimeError("Failed to start API request context pool") from self._startup_errors[0]
+    
+    def _worker(self, ready: threading.Barrier) -> None:
+        """Run one worker thread with its own Playwright request context."""
+        try:
+            playwright = sync_playwright().start()
+            context = playwright.request.new_context(**self.context_options)
+        except BaseException as error:
+            self._startup_errors.append(error)
+            ready.wait()
+            return
+        
+        ready.wait()
+        try:
+            while True:
+                job = self._jobs.get()
+                if job is self._STOP:
+                    break
+                future, url, kwargs = job
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    response = context.fetch(url, **kwargs)
+                    future.set_result(BufferedResponse(
+                        status=response.status,
+                        headers=response.headers,
+                        url=response.url,
+                        body=response.body()
+                    ))
+                except BaseException as error:
+                    future.set_exception(error)
+        finally:
+            context.dispose()
+            playwright.stop()
+    
+    def fetch(self, url: str, **kwargs: Any) -> BufferedResponse:
+        """
+        Send a request through the next idle request context.
+        
+        Args:
+            url: Request URL
+            **kwargs: Arguments accepted by APIRequestContext.fetch (method, headers, params, data, form, timeout, ...)
+        
+        Returns:
+            Fully read response
+        """
+        if self._closed:
+            raise RuntimeError("API request context pool is closed")
+        
+        future: Future = Future()
+        self._jobs.put((future, url, kwargs))
+        return future.result()
+    
+    def close(self) -> None:
+        """Stop all worker threads and dispose their request contexts."""
+        if self._closed:
+            return
+        self._closed = True
+        
+        for _ in self._threads:
+            self._jobs.put(self._STOP)
+        for thread in self._threads:
+            thread.join()
+    
+    def __enter__(self) -> "RequestContextPool":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
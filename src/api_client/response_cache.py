@@ -0,0 +1,178 @@
+"""
+GET response cache for AutomationExercise API clients.
+"""
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+
+class CachedResponse:
+    """A parsed GET response plus the validators needed to revalidate it."""
+    
+    def __init__(self, status: int, data: Any, etag: Optional[str] = None,
+                 last_modified: Optional[str] = None):
+        """
+        Initialize the cached response.
+        
+        Args:
+            status: HTTP status code
+            data: Parsed response body
+            etag: ETag response header, if any
+            last_modified: Last-Modified response header, if any
+        """
+        self.status = status
+        self.data = data
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = time.monotonic()
+    
+    @property
+    def revalidatable(self) -> bool:
+        """Whether the server gave a validator for a conditional request."""
+        return bool(self.etag or self.last_modified)
+    
+    def conditional_headers(self) -> Dict[str, str]:
+        """Get If-None-Match / If-Modified-Since headers for revalidation."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Thread-safe TTL + LRU cache for idempotent GET responses.
+    
+    Fresh entries are served without a request. Expired entries that carry an
+    ETag or Last-Modified validator are kept and revalidated with a conditional
+    request; a 304 makes them fresh again. Callers always get a deep copy, so
+    a test that mutates a response cannot affect the next one.
+    """
+    
+    def __init__(self, max_entries: int = 128, ttl_seconds: float = 60.0):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_entries: Entries kept before the least recently used is evicted
+            ttl_seconds: How long an entry is served without asking the server
+        """
+        self.max_entries = max(max_entries, 1)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+    
+    @staticmethod
+    def key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Build the cache key of a GET request.
+        
+        Args:
+            url: Request URL
+            params: Query parameters (order does not matter)
+        
+        Returns:
+            Cache key
+        """
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted(params.items()))}"
+    
+    def lookup(self, key: str) -> Tuple[Optional[CachedResponse], bool]:
+        """
+        Find an entry.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            (entry, fresh): entry is None on a miss; a stale entry is only
+            returned when it can be revalidated
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, False
+            
+            if time.monotonic() - entry.stored_at < self.ttl_seconds:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry, True
+            
+            self.misses += 1
+            if not entry.revalidatable:
+                del self._entries[key]
+                return None, False
+            return entry, False
+    
+    def store(self, key: str, entry: CachedResponse) -> None:
+        """
+        Add or replace an entry, evicting the least recently used ones.
+        
+        Args:
+            key: Cache key
+            entry: Response to cache
+        """
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def revalidated(self, key: str) -> Optional[CachedResponse]:
+        """
+        Mark an entry fresh again after the server answered 304 Not Modified.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            The refreshed entry, or None if it was evicted meanwhile
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry.stored_at = time.monotonic()
+            self._entries.move_to_end(key)
+            self.revalidations += 1
+            return entry
+    
+    @staticmethod
+    def result(entry: CachedResponse) -> Dict[str, Any]:
+        """Get a private copy of an entry in BaseAPIClient's response format."""
+        return {"status": entry.status, "data": copy.deepcopy(entry.data)}
+    
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Drop one entry, or every entry when no key is given.
+        
+        Args:
+            key: Cache key (optional)
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+    
+    def stats(self) -> Dict[str, int]:
+        """Get hit, miss, revalidation and eviction counts."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+            }
@@ -0,0 +1,93 @@
+"""
+Typed API responses for AutomationExercise API clients.
+"""
+from typing import Any, Dict, Generic, Optional, Type, TypeVar
+from pydantic import BaseModel
+from src.models.lazy import STRICT_ITEMS
+from .json_body import parse_body
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Sentinel for "not decoded yet" (None is a valid JSON value)
+_UNSET = object()
+
+
+class TypedResponse(Generic[ModelT]):
+    """Raw API response that is decoded and validated only when asked.
+    
+    The body bytes are kept as received. status needs no decoding at all;
+    model validates the bytes straight into the pydantic model with
+    model_validate_json (pydantic's own parser, no intermediate dicts), and
+    data decodes them to plain Python values for assertions on raw fields.
+    Each is computed at most once.
+    """
+    
+    def __init__(self, status: int, body: bytes, model_type: Type[ModelT],
+                 headers: Optional[Dict[str, str]] = None):
+        """
+        Initialize the response.
+        
+        Args:
+            status: HTTP status code
+            body: Raw response body
+            model_type: Pydantic model the body is expected to match
+            headers: Response headers
+        """
+        self.status = status
+        self.body = body
+        self.model_type = model_type
+        self.headers = headers or {}
+        self._models: Dict[bool, ModelT] = {}
+        self._data: Any = _UNSET
+    
+    @property
+    def ok(self) -> bool:
+        """Check if the status code is in the 2xx range."""
+        return 200 <= self.status <= 299
+    
+    @property
+    def model(self) -> ModelT:
+        """
+        Get the body validated as model_type (LazyModelList fields validate their items on access).
+        
+        Raises:
+            pydantic.ValidationError: If the body does not match the model
+                (e.g. an error payload with responseCode and message only)
+        """
+        return self.validate()
+    
+    def validate(self, strict: bool = False) -> ModelT:
+        """
+        Validate the body as model_type.
+        
+        Args:
+            strict: Validate every item of LazyModelList fields now, for schema tests
+        
+        Returns:
+            Validated model (cached per mode)
+        
+        Raises:
+            pydantic.ValidationError: If the body (or, when strict, any item) does not match
+        """
+        if strict not in self._models:
+            context = {STRICT_ITEMS: True} if strict else None
+            self._models[strict] = self.model_type.model_validate_json(self.body, context=context)
+        return self._models[strict]
+    
+    @property
+    def data(self) -> Any:
+        """Get the body decoded to plain Python values (text if it is not JSON)."""
+        if self._data is _UNSET:
+            self._data = parse_body(self.body)
+        return self._data
+    
+    def __getitem__(self, key: str) -> Any:
+        """Support response["status"] / response["data"] like the dictionary results."""
+        if key == "status":
+            return self.status
+        if key == "data":
+            return self.data
+        raise KeyError(key)
+    
+    def __repr__(self) -> str:
+        return f"TypedResponse[{self.model_type.__name__}](status={self.status}, {len(self.body)} bytes)"
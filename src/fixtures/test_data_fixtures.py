@@ -1,17 +1,22 @@
 """
 Test data fixtures for AutomationExercise testing framework.
 """
+import os
 import pytest
 from typing import Dict, Any, List
 from playwright.sync_api import Page, APIRequestContext
 from src.api_client.controllers.products_controller import ProductsController
 from src.api_client.controllers.brands_controller import BrandsController
 from src.api_client.controllers.user_controller import UserController
+from src.api_client.latency import API_LATENCY, LatencyRecorder
 from src.models.pages.home_page import HomePage
 from src.models.pages.login_page import LoginPage
 from src.models.pages.products_page import ProductsPage
 from src.models.pages.cart_page import CartPage
 
+# Requests per performance test; thresholds are checked against percentiles, not one sample
+PERFORMANCE_SAMPLES = int(os.getenv('PERFORMANCE_SAMPLES', '10'))
+
 
 @pytest.fixture(scope="session")
 def test_data():
@@ -82,29 +87,35 @@ def ui_test_data(test_data):
 
 # API Controller Fixtures
 @pytest.fixture
-def products_controller(api_request_context):
+def products_controller(api_request_context, api_response_cache):
     """Products controller fixture."""
-    controller = ProductsController(api_request_context)
+    controller = ProductsController(api_request_context, cache=api_response_cache)
     controller.init()
     return controller
 
 
 @pytest.fixture
-def brands_controller(api_request_context):
+def brands_controller(api_request_context, api_response_cache):
     """Brands controller fixture."""
-    controller = BrandsController(api_request_context)
+    controller = BrandsController(api_request_context, cache=api_response_cache)
     controller.init()
     return controller
 
 
 @pytest.fixture
-def user_controller(api_request_context):
+def user_controller(api_request_context, api_response_cache):
     """User controller fixture."""
-    controller = UserController(api_request_context)
+    controller = UserController(api_request_context, cache=api_response_cache)
     controller.init()
     return controller
 
 
+@pytest.fixture
+def api_latency():
+    """Latency recorder for one test's requests (samples also reach the run-wide report)."""
+    return LatencyRecorder(parent=API_LATENCY)
+
+
 # Page Object Fixtures
 @pytest.fixture
 def home_page(page):
@@ -112,6 +123,12 @@ def home_page(page):
     return HomePage(page)
 
 
+@pytest.fixture
+def logged_in_home_page(authenticated_page):
+    """Home page of a session already logged in as the valid test user."""
+    return HomePage(authenticated_page)
+
+
 @pytest.fixture
 def login_page(page):
     """Login page fixture."""
@@ -125,9 +142,11 @@ def products_page(page):
 
 
 @pytest.fixture
-def cart_page(page):
+def cart_page(page, cart_seed_transport):
     """Cart page fixture."""
-    return CartPage(page)
+    cart_page = CartPage(page)
+    cart_page.seed_transport = cart_seed_transport
+    return cart_page
 
 
 # Test Data Fixtures
@@ -175,6 +194,33 @@ def sample_user():
     }
 
 
+def _products_by_brand(catalog_snapshot, catalog_store):
+    """Product count of every listed brand (0 if it has none) and of any brand only products name."""
+    brands = dict.fromkeys([*catalog_snapshot.brand_names, *catalog_store.rows_by_brand])
+    return {brand: len(catalog_store.rows_by_brand.get(brand, ())) for brand in brands}
+
+
+@pytest.fixture
+def catalog_test_data(catalog_snapshot, catalog_store):
+    """Expected catalog data taken from the run's catalog snapshot."""
+    return {
+        "product_count": len(catalog_store),
+        "brands": catalog_snapshot.brand_names,
+        "categories": catalog_snapshot.usertypes,
+        "products_by_brand": _products_by_brand(catalog_snapshot, catalog_store),
+        "products_by_category": {
+            f"{usertype} > {category}": len(rows)
+            for (usertype, category), rows in catalog_store.rows_by_category.items()
+        }
+    }
+
+
+@pytest.fixture
+def cart_product_ids(catalog_snapshot):
+    """IDs of the first three catalog products, for seeding the cart."""
+    return [product["id"] for product in catalog_snapshot.products[:3]]
+
+
 @pytest.fixture
 def search_terms():
     """Search terms fixture."""
@@ -186,30 +232,29 @@ def search_terms():
 
 
 @pytest.fixture
-def category_data():
-    """Category data fixture."""
-    return {
-        "women": {
-            "parent": "Women",
-            "subcategories": ["Dress", "Tops & Shirts", "Saree"]
-        },
-        "men": {
-            "parent": "Men",
-            "subcategories": ["Tshirts", "Jeans"]
-        },
-        "kids": {
-            "parent": "Kids",
-            "subcategories": ["Dress", "Tops & Shirts"]
-        }
-    }
+def category_data(catalog_snapshot):
+    """Category data fixture (from the catalog snapshot)."""
+    categories = {}
+    for usertype, category in catalog_snapshot.by_category:
+        entry = categories.setdefault(usertype.lower(), {"parent": usertype, "subcategories": []})
+        entry["subcategories"].append(category)
+    return categories
 
 
 @pytest.fixture
-def brand_data():
-    """Brand data fixture."""
+def brand_data(catalog_snapshot, catalog_store):
+    """
+    Brand data fixture (from the catalog snapshot).
+    
+    popular_brands is no longer a fixed list: it holds the four brands with
+    the most products in the catalog (ties keep the /brandsList order), so it
+    follows the live catalog. all_brands is every brand /brandsList names.
+    """
+    counts = _products_by_brand(catalog_snapshot, catalog_store)
+    by_size = sorted(counts, key=counts.get, reverse=True)
     return {
-        "popular_brands": ["Polo", "H&M", "Madame", "Mast & Harbour"],
-        "all_brands": ["Polo", "H&M", "Madame", "Mast & Harbour", "Babyhug", "Allen Solly Junior", "Kookie Kids", "Biba"]
+        "popular_brands": by_size[:4],
+        "all_brands": catalog_snapshot.brand_names
     }
 
 
@@ -0,0 +1,132 @@
+"""
+Authenticated storage-state cache for AutomationExercise testing framework.
+"""
+import hashlib
+import os
+import time
+from typing import Any, Callable, Dict, Optional
+from playwright.sync_api import Browser, BrowserContext
+from src.models.pages.login_page import LoginPage
+
+
+class StorageStateFactory:
+    """Logs each user in once and hands out contexts that are already authenticated.
+    
+    The first request for a user drives the login form in a throwaway
+    context and saves its storage_state() (cookies and local storage) to
+    disk. Until the file expires, every later context for that user is
+    created from it, so tests that start logged in never see the form.
+    Files are written atomically, so xdist workers can share the directory.
+    """
+    
+    def __init__(self, browser: Browser, state_dir: str, ttl_seconds: float = 1800,
+                 base_url: Optional[str] = None,
+                 verify_credentials: Optional[Callable[[str, str], bool]] = None,
+                 prepare_context: Optional[Callable[[BrowserContext], None]] = None,
+                 **context_options: Any):
+        """
+        Initialize the factory.
+        
+        Args:
+            browser: Browser used for the login and the authenticated contexts
+            state_dir: Directory for the saved storage states
+            ttl_seconds: How long a saved state is reused before logging in again
+            base_url: Site URL (defaults to BASE_URL)
+            verify_credentials: Optional check run before the UI login
+                (e.g. through UserController.verify_login) to fail fast on bad credentials
+            prepare_context: Called on the login context before its page opens, to install
+                the same routing as test contexts (HAR record/replay, request blocking)
+            **context_options: Options passed to browser.new_context()
+        """
+        self.browser = browser
+        self.state_dir = state_dir
+        self.ttl_seconds = ttl_seconds
+        self.base_url = base_url or os.getenv('BASE_URL', 'https://automationexercise.com')
+        self.verify_credentials = verify_credentials
+        self.prepare_context = prepare_context
+        self.context_options: Dict[str, Any] = context_options
+        self.login_count = 0
+        os.makedirs(state_dir, exist_ok=True)
+    
+    def state_path(self, email: str) -> str:
+        """
+        Get the storage-state file of a user on the current site.
+        
+        Args:
+            email: User email
+        
+        Returns:
+            File path
+        """
+        digest = hashlib.sha1(f"{self.base_url}|{email}".encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.state_dir, f"{digest}.json")
+    
+    def _is_fresh(self, path: str) -> bool:
+        """Check whether a saved state exists and has not expired."""
+        try:
+            return time.time() - os.path.getmtime(path) < self.ttl_seconds
+        except OSError:
+            return False
+    
+    def storage_state_for(self, email: str, password: str) -> str:
+        """
+        Get a fresh storage-state file for a user, logging in if needed.
+        
+        Args:
+            email: User email
+            password: User password
+        
+        Returns:
+            Path of the storage-state file
+        """
+        path = self.state_path(email)
+        if self._is_fresh(path):
+            return path
+        
+        if self.verify_credentials and not self.verify_credentials(email, password):
+            raise RuntimeError(f"Credentials for {email} were rejected by the API")
+        
+        context = self.browser.new_context(**self.context_options)
+        try:
+            if self.prepare_context:
+                self.prepare_context(context)
+            login_page = LoginPage(context.new_page())
+            login_page.base_url = self.base_url
+            login_page.navigate_to_login_page()
+            if not login_page.login_with_credentials(email, password):
+                raise RuntimeError(f"Could not log in as {email}")
+            self.login_count += 1
+            
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            context.storage_state(path=temp_path)
+            os.replace(temp_path, path)
+        finally:
+            context.close()
+        return path
+    
+    def new_context(self, email: str, password: str, **overrides: Any) -> BrowserContext:
+        """
+        Create a context that is already logged in as a user.
+        
+        Args:
+            email: User email
+            password: User password
+            **overrides: Extra options for browser.new_context() (base_url defaults to the site URL)
+        
+        Returns:
+            Authenticated browser context
+        """
+        options = {'base_url': self.base_url, **self.context_options, **overrides}
+        return self.browser.new_context(storage_state=self.storage_state_for(email, password), **options)
+    
+    def invalidate(self, email: str) -> None:
+        """
+        Forget a user's saved state (e.g. after a test logged the session out).
+        
+        Args:
+            email: User email
+        """
+        try:
+            os.remove(self.state_path(email))
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,288 @@
+"""
+Micro-benchmark harness for AutomationExercise API endpoints.
+
+Usage:
+    python -m src.helpers.benchmark products.search_product dress --iterations 30 --concurrency 4
+    python -m src.helpers.benchmark brands.get_all_brands --stand-in --save
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+BASELINE_PATH = os.getenv('BENCHMARK_BASELINE', 'src/data/benchmark_baselines.json')
+
+
+def reject_outliers(samples: List[int], fence: float = 1.5) -> List[int]:
+    """
+    Drop samples outside the Tukey fences (quartiles -/+ fence * IQR).
+    
+    Args:
+        samples: Durations in nanoseconds
+        fence: IQR multiplier (1.5 is the usual choice)
+    
+    Returns:
+        Samples that are not outliers, in their original order
+    """
+    if len(samples) < 4:
+        return list(samples)
+    first, _, third = statistics.quantiles(samples, n=4)
+    spread = (third - first) * fence
+    return [sample for sample in samples if first - spread <= sample <= third + spread]
+
+
+class BenchmarkResult:
+    """Timings of one benchmark, after outlier rejection."""
+    
+    def __init__(self, name: str, samples_ns: List[int], rejected: int, concurrency: int, wall_ns: int):
+        """
+        Initialize the result.
+        
+        Args:
+            name: Benchmark name
+            samples_ns: Kept durations in nanoseconds
+            rejected: Number of samples dropped as outliers
+            concurrency: Calls in flight at once
+            wall_ns: Wall time of the measured iterations
+        """
+        self.name = name
+        self.samples_ns = samples_ns
+        self.rejected = rejected
+        self.concurrency = concurrency
+        self.wall_ns = wall_ns
+    
+    @property
+    def median_ms(self) -> float:
+        """Median duration in milliseconds."""
+        return statistics.median(self.samples_ns) / 1e6
+    
+    @property
+    def p90_ms(self) -> float:
+        """90th percentile duration in milliseconds."""
+        if len(self.samples_ns) < 2:
+            return self.median_ms
+        return statistics.quantiles(self.samples_ns, n=10)[-1] / 1e6
+    
+    @property
+    def stdev_ms(self) -> float:
+        """Standard deviation in milliseconds."""
+        return statistics.stdev(self.samples_ns) / 1e6 if len(self.samples_ns) > 1 else 0.0
+    
+    @property
+    def ops_per_second(self) -> float:
+        """Calls completed per second of wall time (all samples, outliers included)."""
+        calls = len(self.samples_ns) + self.rejected
+        return calls / (self.wall_ns / 1e9) if self.wall_ns else 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the summary stored in baselines and reports."""
+        return {
+            "median_ms": round(self.median_ms, 3),
+            "p90_ms": round(self.p90_ms, 3),
+            "stdev_ms": round(self.stdev_ms, 3),
+            "ops_per_second": round(self.ops_per_second, 2),
+            "samples": len(self.samples_ns),
+            "rejected": self.rejected,
+            "concurrency": self.concurrency,
+        }
+    
+    def __str__(self) -> str:
+        return (f"{self.name}: median {self.median_ms:.2f} ms, p90 {self.p90_ms:.2f} ms, "
+                f"stdev {self.stdev_ms:.2f} ms, {self.ops_per_second:.1f} ops/s "
+                f"({len(self.samples_ns)} samples, {self.rejected} outliers, concurrency {self.concurrency})")
+
+
+class Benchmark:
+    """Runs a callable with warmup and repeated, timed iterations.
+    
+    Warmup calls are not timed (connections, caches and lazy imports settle
+    first). Iterations are timed individually with perf_counter_ns; with
+    concurrency > 1 they run on a thread pool, so the callable must be
+    thread-safe (controllers over a RequestContextPool are).
+    """
+    
+    def __init__(self, warmup: int = 3, iterations: int = 20, concurrency: int = 1, fence: float = 1.5):
+        """
+        Initialize the benchmark settings.
+        
+        Args:
+            warmup: Untimed calls made first
+            iterations: Timed calls
+            concurrency: Calls in flight at once
+            fence: IQR multiplier for outlier rejection (0 keeps every sample)
+        """
+        if iterations < 1:
+            raise ValueError(f"At least one iteration is needed, got {iterations}")
+        self.warmup = warmup
+        self.iterations = iterations
+        self.concurrency = max(concurrency, 1)
+        self.fence = fence
+    
+    @staticmethod
+    def _timed(func: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]) -> int:
+        """Call func once and return its duration in nanoseconds."""
+        started = time.perf_counter_ns()
+        func(*args, **kwargs)
+        return time.perf_counter_ns() - started
+    
+    def run(self, name: str, func: Callable[..., Any], *args: Any, **kwargs: Any) -> BenchmarkResult:
+        """
+        Benchmark a callable.
+        
+        Args:
+            name: Benchmark name (baseline key)
+            func: Callable to time (e.g. a bound controller method)
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+        
+        Returns:
+            Benchmark result
+        """
+        for _ in range(self.warmup):
+            func(*args, **kwargs)
+        
+        started = time.perf_counter_ns()
+        if self.concurrency == 1:
+            samples = [self._timed(func, args, kwargs) for _ in range(self.iterations)]
+        else:
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                futures = [executor.submit(self._timed, func, args, kwargs) for _ in range(self.iterations)]
+                samples = [future.result() for future in futures]
+        wall_ns = time.perf_counter_ns() - started
+        
+        kept = reject_outliers(samples, self.fence) if self.fence > 0 else samples
+        return BenchmarkResult(name, kept, len(samples) - len(kept), self.concurrency, wall_ns)
+
+
+class BaselineStore:
+    """Saved benchmark results, compared against on later runs."""
+    
+    def __init__(self, path: str = BASELINE_PATH):
+        """
+        Initialize the store, loading the file if it exists.
+        
+        Args:
+            path: JSON file of baselines keyed by benchmark name
+        """
+        self.path = path
+        self.baselines: Dict[str, Dict[str, Any]] = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as baseline_file:
+                self.baselines = json.load(baseline_file)
+    
+    def regression(self, result: BenchmarkResult, tolerance: float) -> Optional[str]:
+        """
+        Compare a result with its baseline.
+        
+        Args:
+            result: Benchmark result
+            tolerance: Allowed slowdown of the median (0.25 = 25%)
+        
+        Returns:
+            Description of the regression, or None if within tolerance or there is no baseline
+        """
+        baseline = self.baselines.get(result.name)
+        if not baseline:
+            return None
+        limit = baseline["median_ms"] * (1 + tolerance)
+        if result.median_ms <= limit:
+            return None
+        return (f"{result.name} regressed: median {result.median_ms:.2f} ms > {limit:.2f} ms "
+                f"(baseline {baseline['median_ms']:.2f} ms + {tolerance:.0%})")
+    
+    def update(self, name: str, summary: Dict[str, Any]) -> None:
+        """
+        Set the baseline of a benchmark.
+        
+        Args:
+            name: Benchmark name
+            summary: BenchmarkResult.to_dict() output
+        """
+        self.baselines[name] = summary
+    
+    def save(self) -> None:
+        """Write the baselines, sorted by name so diffs stay readable."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as baseline_file:
+            json.dump(dict(sorted(self.baselines.items())), baseline_file, indent=2)
+            baseline_file.write("\n")
+        os.replace(temp_path, self.path)
+
+
+def _controller_classes() -> Dict[str, type]:
+    """Controllers addressable from the command line."""
+    from src.api_client.controllers.brands_controller import BrandsController
+    from src.api_client.controllers.products_controller import ProductsController
+    from src.api_client.controllers.user_controller import UserController
+    return {"products": ProductsController, "brands": BrandsController, "user": UserController}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Benchmark one controller method from the command line."""
+    controllers = _controller_classes()
+    parser = argparse.ArgumentParser(description="Benchmark an AutomationExercise API controller method")
+    parser.add_argument("target", help=f"<controller>.<method>, controller one of: {', '.join(controllers)}")
+    parser.add_argument("args", nargs="*", help="positional arguments for the method")
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--fence", type=float, default=1.5, help="IQR outlier fence (0 disables rejection)")
+    parser.add_argument("--tolerance", type=float, default=float(os.getenv('BENCHMARK_TOLERANCE', '0.25')))
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save", action="store_true", help="store the result as the new baseline")
+    parser.add_argument("--stand-in", action="store_true", help="benchmark against a local stand-in server")
+    parser.add_argument("--har", help="replay responses from a HAR archive (measures client overhead only)")
+    parser.add_argument("--transport", choices=("playwright", "httpx"), default="playwright",
+                        help="HTTP client: pooled Playwright request contexts or one httpx keep-alive pool")
+    args = parser.parse_args(argv)
+    
+    controller_name, _, method_name = args.target.partition(".")
+    if controller_name not in controllers or not method_name:
+        parser.error(f"unknown target {args.target!r}")
+    
+    from src.api_client.httpx_transport import HttpxTransport
+    from src.api_client.request_pool import RequestContextPool
+    from src.helpers.har_replay import NETWORK_MODE_REPLAY, HarApiTransport
+    from src.helpers.stand_in_server import StandInServer
+    
+    server = StandInServer().start() if args.stand_in else None
+    if args.har:
+        transport = HarApiTransport(args.har, NETWORK_MODE_REPLAY)
+    elif args.transport == "httpx":
+        transport = HttpxTransport(max_connections=args.concurrency, max_keepalive_connections=args.concurrency,
+                                   ignore_https_errors=True)
+    else:
+        transport = RequestContextPool(size=args.concurrency, ignore_https_errors=True)
+    try:
+        controller = controllers[controller_name](transport, base_url=server.api_base_url if server else None)
+        method = getattr(controller, method_name)
+        benchmark = Benchmark(args.warmup, args.iterations, args.concurrency, args.fence)
+        result = benchmark.run(args.target, method, *args.args)
+    finally:
+        if not args.har:
+            transport.close()
+        if server:
+            server.stop()
+    
+    print(result)
+    store = BaselineStore(args.baseline)
+    if args.save:
+        store.update(result.name, result.to_dict())
+        store.save()
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+    
+    regression = store.regression(result, args.tolerance)
+    if regression:
+        print(regression)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""
+Pre-warmed browser context pool for AutomationExercise testing framework.
+"""
+from typing import Any, Dict, List
+from playwright.sync_api import Browser, BrowserContext
+
+
+class BrowserContextPool:
+    """Hands out a fresh BrowserContext per test from one shared browser.
+    
+    Launching a browser costs about a second, while a new context costs a few
+    milliseconds, so each xdist worker keeps a single browser and only pays
+    for contexts. A small number of contexts is created ahead of time and the
+    pool is topped up again whenever a used context is released, so a test
+    never receives a context that another test has touched.
+    """
+    
+    def __init__(self, browser: Browser, size: int = 2, **context_options: Any):
+        """
+        Initialize the context pool.
+        
+        Args:
+            browser: Browser shared by every context in the pool
+            size: Number of contexts kept warm
+            **context_options: Options passed to browser.new_context()
+        """
+        self.browser = browser
+        self.size = max(size, 0)
+        self.context_options: Dict[str, Any] = context_options
+        self._idle: List[BrowserContext] = []
+        self._leased: List[BrowserContext] = []
+        self.created_count = 0
+        self.reused_warm_count = 0
+        self._fill()
+    
+    def _new_context(self) -> BrowserContext:
+        """Create a new context with the pool options."""
+        self.created_count += 1
+        return self.browser.new_context(**self.context_options)
+    
+    def _fill(self) -> None:
+        """Top up the pool with warm contexts."""
+        while len(self._idle) < self.size:
+            self._idle.append(self._new_context())
+    
+    def acquire(self) -> BrowserContext:
+        """
+        Lease a fresh context.
+        
+        Returns:
+            Browser context that has not been used by any other test
+        """
+        if self._idle:
+            context = self._idle.pop()
+            self.reused_warm_count += 1
+        else:
+            context = self._new_context()
+        
+        self._leased.append(context)
+        return context
+    
+    def release(self, context: BrowserContext) -> None:
+        """
+        Return a leased context; it is closed and replaced with a warm one.
+        
+        Args:
+            context: Context previously returned by acquire()
+        """
+        if context in self._leased:
+            self._leased.remove(context)
+        
+        try:
+            context.close()
+        finally:
+            self._fill()
+    
+    def close(self) -> None:
+        """Close every idle and leased context."""
+        for context in self._idle + self._leased:
+            try:
+                context.close()
+            except Exception:
+                pass
+        self._idle.clear()
+        self._leased.clear()
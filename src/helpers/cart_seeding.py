@@ -0,0 +1,59 @@
+"""
+HTTP cart seeding for AutomationExercise testing framework.
+"""
+import os
+from typing import Any, Iterable, Optional
+from playwright.sync_api import BrowserContext
+
+
+class CartSeeder:
+    """Fills a browser context's cart over HTTP instead of through the UI.
+    
+    Requests go through context.request, which shares the context's cookie
+    jar, so the items land in the same session the browser pages use. One
+    GET per item replaces the click / modal / Continue Shopping round of
+    ProductsPage.add_product_to_cart. context.request is not covered by
+    route_from_har, so record/replay runs pass a HarApiTransport wrapping it.
+    """
+    
+    def __init__(self, context: BrowserContext, base_url: Optional[str] = None,
+                 transport: Any = None):
+        """
+        Initialize the seeder.
+        
+        Args:
+            context: Browser context whose cart is filled
+            base_url: Site URL (defaults to BASE_URL)
+            transport: Object with fetch() used instead of context.request
+                (e.g. a HarApiTransport in record/replay mode)
+        """
+        self.context = context
+        self.transport = transport or context.request
+        self.base_url = base_url or os.getenv('BASE_URL', 'https://automationexercise.com')
+    
+    def add(self, product_id: int, quantity: int = 1) -> None:
+        """
+        Add a product to the cart.
+        
+        Args:
+            product_id: Product ID (as used by /add_to_cart/<id>)
+            quantity: Number of times to add it
+        """
+        for _ in range(quantity):
+            response = self.transport.fetch(f"{self.base_url}/add_to_cart/{product_id}")
+            if not response.ok:
+                raise RuntimeError(f"Adding product {product_id} to the cart failed with HTTP {response.status}")
+    
+    def seed(self, product_ids: Iterable[int], quantity: int = 1) -> None:
+        """
+        Add several products to the cart, in order.
+        
+        Requests are sent one at a time so the server-side session is never
+        updated concurrently.
+        
+        Args:
+            product_ids: Product IDs
+            quantity: Quantity of each product
+        """
+        for product_id in product_ids:
+            self.add(product_id, quantity)
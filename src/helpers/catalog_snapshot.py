@@ -0,0 +1,156 @@
+"""
+Session-wide catalog snapshot for AutomationExercise testing framework.
+"""
+import json
+import os
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+SNAPSHOT_FILE_NAME = "catalog_snapshot.json"
+
+
+class CatalogSnapshot:
+    """Products and brands fetched once per run, indexed for lookups.
+    
+    Tests that need expected catalog data (brand names, products of a
+    category, the product with a given id) read it from here instead of
+    calling /productsList or scraping the products page again.
+    """
+    
+    def __init__(self, products: List[Dict[str, Any]], brands: List[Dict[str, Any]]):
+        """
+        Initialize the snapshot and build its indexes.
+        
+        Args:
+            products: "products" list of /productsList
+            brands: "brands" list of /brandsList
+        """
+        self.products = products
+        self.brands = brands
+        self.by_id: Dict[int, Dict[str, Any]] = {}
+        self.by_name: Dict[str, Dict[str, Any]] = {}
+        self.by_brand: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.by_category: Dict[Tuple[str, str], List[Dict[str, Any]]] = defaultdict(list)
+        self.by_usertype: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        
+        for product in products:
+            usertype, category = self.category_of(product)
+            self.by_id[product["id"]] = product
+            self.by_name[product["name"].strip().lower()] = product
+            self.by_brand[product["brand"]].append(product)
+            self.by_category[(usertype, category)].append(product)
+            self.by_usertype[usertype].append(product)
+    
+    @staticmethod
+    def category_of(product: Dict[str, Any]) -> Tuple[str, str]:
+        """
+        Get the (usertype, category) pair of a product.
+        
+        Args:
+            product: Product dictionary from /productsList
+        
+        Returns:
+            Tuple like ("Women", "Dress")
+        """
+        category = product.get("category") or {}
+        usertype = category.get("usertype") or {}
+        if isinstance(usertype, dict):
+            usertype = usertype.get("usertype", "")
+        return usertype, category.get("category", "")
+    
+    @property
+    def brand_names(self) -> List[str]:
+        """Distinct brand names, in first-seen order."""
+        return list(dict.fromkeys(brand["brand"] for brand in self.brands))
+    
+    @property
+    def usertypes(self) -> List[str]:
+        """Distinct top-level categories (Women, Men, Kids)."""
+        return list(self.by_usertype)
+    
+    def product(self, product_id: int) -> Optional[Dict[str, Any]]:
+        """Get a product by id."""
+        return self.by_id.get(product_id)
+    
+    def product_named(self, name: str) -> Optional[Dict[str, Any]]:
+        """Get a product by name (case-insensitive)."""
+        return self.by_name.get(name.strip().lower())
+    
+    def products_for_brand(self, brand: str) -> List[Dict[str, Any]]:
+        """Get the products of a brand."""
+        return self.by_brand.get(brand, [])
+    
+    def products_in_category(self, usertype: str, category: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get the products of a top-level category, or of one of its subcategories.
+        
+        Args:
+            usertype: Top-level category (e.g. "Women")
+            category: Subcategory (e.g. "Dress"), optional
+        
+        Returns:
+            List of products
+        """
+        if category is None:
+            return self.by_usertype.get(usertype, [])
+        return self.by_category.get((usertype, category), [])
+    
+    def to_json(self) -> bytes:
+        """Serialize the raw lists (indexes are rebuilt on load)."""
+        return json.dumps({"products": self.products, "brands": self.brands}).encode("utf-8")
+    
+    @classmethod
+    def from_json(cls, payload: bytes) -> "CatalogSnapshot":
+        """Rebuild a snapshot from to_json() output."""
+        data = json.loads(payload)
+        return cls(data["products"], data["brands"])
+
+
+
+
+def load_or_build_snapshot(cache_dir: str, build: Callable[[], CatalogSnapshot],
+                           timeout: float = 60.0) -> CatalogSnapshot:
+    """
+    Get the run's catalog snapshot, building it only in the first process that asks.
+    
+    The first xdist worker creates a lock file, builds the snapshot and writes
+    it atomically; the other workers wait for the file and read it.
+    
+    Args:
+        cache_dir: Directory shared by every worker of the run
+        build: Function that fetches the catalog
+        timeout: Seconds to wait for another worker to finish building
+    
+    Returns:
+        Catalog snapshot
+    """
+    path = os.path.join(cache_dir, SNAPSHOT_FILE_NAME)
+    lock_path = f"{path}.lock"
+    deadline = time.monotonic() + timeout
+    
+    while not os.path.exists(path):
+        try:
+            lock_fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            # Another worker is building it; if it fails it removes the lock and we take over
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Catalog snapshot was not written to {path} within {timeout}s")
+            time.sleep(0.05)
+            continue
+        
+        try:
+            snapshot = build()
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as temp_file:
+                temp_file.write(snapshot.to_json())
+            os.replace(temp_path, path)
+        except BaseException:
+            os.close(lock_fd)
+            os.remove(lock_path)
+            raise
+        os.close(lock_fd)
+        return snapshot
+    
+    with open(path, "rb") as snapshot_file:
+        return CatalogSnapshot.from_json(snapshot_file.read())
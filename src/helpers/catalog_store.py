@@ -0,0 +1,208 @@
+"""
+Columnar catalog store for AutomationExercise testing framework.
+"""
+import sys
+from array import array
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from src.helpers.catalog_snapshot import CatalogSnapshot
+from src.helpers.money import parse_minor
+
+# Stored in the integer columns when a value is missing, not an integer or negative;
+# negative values are rejected while the columns are built, so MISSING never collides with data
+MISSING = -1
+# Largest value an array('i') column holds
+_INT_MAX = 2 ** 31 - 1
+
+
+def duplicate_values(values: Sequence[int]) -> List[int]:
+    """
+    Find the values that occur more than once (MISSING is ignored).
+    
+    Args:
+        values: Integer column (e.g. CatalogStore.product_ids)
+    
+    Returns:
+        Duplicated values, in first-seen order
+    """
+    if len(set(values)) == len(values):
+        return []
+    return [value for value, count in Counter(values).items() if count > 1 and value != MISSING]
+
+
+def out_of_range(values: Sequence[int], low: int, high: Optional[int] = None) -> List[int]:
+    """
+    Find the positions of values outside [low, high].
+    
+    Args:
+        values: Integer column
+        low: Smallest allowed value
+        high: Largest allowed value (no upper bound if None)
+    
+    Returns:
+        Positions (rows) of the offending values
+    """
+    if not values or (min(values) >= low and (high is None or max(values) <= high)):
+        return []
+    return [row for row, value in enumerate(values)
+            if value < low or (high is not None and value > high)]
+
+
+class CatalogStore:
+    """Products and brands kept column by column instead of as lists of dicts.
+    
+    Ids and prices live in integer arrays (prices parsed once into minor
+    units by src.helpers.money); brand, usertype and category are interned strings referenced
+    by integer codes, so each distinct value is stored once however many
+    products share it. Type problems are recorded while the columns are
+    built, and the checks (duplicate ids, ranges) run over whole columns.
+    """
+    
+    def __init__(self, products: Iterable[Dict[str, Any]], brands: Iterable[Dict[str, Any]] = ()):
+        """
+        Initialize the store and build its indexes.
+        
+        Args:
+            products: "products" list of /productsList
+            brands: "brands" list of /brandsList
+        """
+        self.product_ids = array('i')
+        self.prices = array('q')
+        self.names: List[str] = []
+        self.brand_codes = array('i')
+        self.usertype_codes = array('i')
+        self.category_codes = array('i')
+        self.strings: List[str] = []
+        self.brand_ids = array('i')
+        self.brand_names: List[str] = []
+        self.problems: List[str] = []
+        self._codes: Dict[str, int] = {}
+        self.row_of_id: Dict[int, int] = {}
+        self.rows_by_brand: Dict[str, array] = {}
+        self.rows_by_category: Dict[Tuple[str, str], array] = {}
+        
+        for product in products:
+            self._add_product(product)
+        for brand in brands:
+            self._add_brand(brand)
+    
+    @classmethod
+    def from_snapshot(cls, snapshot: CatalogSnapshot) -> "CatalogStore":
+        """Build a store from the run's catalog snapshot."""
+        return cls(snapshot.products, snapshot.brands)
+    
+    def __len__(self) -> int:
+        """Number of products."""
+        return len(self.product_ids)
+    
+    def _code(self, value: str) -> int:
+        """Get the code of a string, adding it (interned) to the string table."""
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.strings)
+            self.strings.append(sys.intern(value))
+        return code
+    
+    def _int_field(self, record: Dict[str, Any], field: str, label: str) -> int:
+        """Read a non-negative integer field, recording a problem if it is missing, not an int or out of range."""
+        value = record.get(field)
+        if not isinstance(value, int) or isinstance(value, bool):
+            self.problems.append(f"{label}: {field} should be an integer, got {value!r}")
+        elif not 0 <= value <= _INT_MAX:
+            self.problems.append(f"{label}: {field} {value} is out of range")
+        else:
+            return value
+        return MISSING
+    
+    def _text_field(self, record: Dict[str, Any], field: str, label: str) -> str:
+        """Read a non-empty string field, recording a problem otherwise."""
+        value = record.get(field)
+        if isinstance(value, str) and value.strip():
+            return value
+        self.problems.append(f"{label}: {field} should be a non-empty string, got {value!r}")
+        return ""
+    
+    def _add_product(self, product: Dict[str, Any]) -> None:
+        """Append one product to the columns and indexes."""
+        row = len(self.product_ids)
+        label = f"Product {row}"
+        product_id = self._int_field(product, "id", label)
+        brand = self._text_field(product, "brand", label)
+        usertype, category = ("", "")
+        if isinstance(product.get("category"), dict):
+            usertype, category = CatalogSnapshot.category_of(product)
+        if not usertype or not category:
+            self.problems.append(f"{label}: category should have a usertype and a category, "
+                                 f"got {product.get('category')!r}")
+        price_text = self._text_field(product, "price", label)
+        price = MISSING
+        if price_text:
+            try:
+                price = parse_minor(price_text)
+            except ValueError:
+                self.problems.append(f"{label}: price {price_text!r} has no amount")
+            else:
+                if price < 0:
+                    self.problems.append(f"{label}: price {price_text!r} is negative")
+                    price = MISSING
+        
+        self.product_ids.append(product_id)
+        self.names.append(self._text_field(product, "name", label))
+        self.prices.append(price)
+        self.brand_codes.append(self._code(brand))
+        self.usertype_codes.append(self._code(usertype))
+        self.category_codes.append(self._code(category))
+        
+        if product_id != MISSING:
+            self.row_of_id.setdefault(product_id, row)
+        self.rows_by_brand.setdefault(brand, array('i')).append(row)
+        self.rows_by_category.setdefault((usertype, category), array('i')).append(row)
+    
+    def _add_brand(self, brand: Dict[str, Any]) -> None:
+        """Append one brand to the brand columns."""
+        label = f"Brand {len(self.brand_ids)}"
+        self.brand_ids.append(self._int_field(brand, "id", label))
+        self.brand_names.append(self.strings[self._code(self._text_field(brand, "brand", label))])
+    
+    def brand_of(self, row: int) -> str:
+        """Get the brand of the product in a row."""
+        return self.strings[self.brand_codes[row]]
+    
+    def category_of(self, row: int) -> Tuple[str, str]:
+        """Get the (usertype, category) pair of the product in a row."""
+        return self.strings[self.usertype_codes[row]], self.strings[self.category_codes[row]]
+    
+    def price_of(self, product_id: int) -> Optional[int]:
+        """Get the price of a product in minor units (None if the id is unknown or the price missing)."""
+        row = self.row_of_id.get(product_id)
+        return None if row is None or self.prices[row] == MISSING else self.prices[row]
+    
+    def ids_for_brand(self, brand: str) -> List[int]:
+        """Get the product ids of a brand."""
+        return [self.product_ids[row] for row in self.rows_by_brand.get(brand, ())]
+    
+    def ids_in_category(self, usertype: str, category: str) -> List[int]:
+        """Get the product ids of a (usertype, category) pair."""
+        return [self.product_ids[row] for row in self.rows_by_category.get((usertype, category), ())]
+    
+    def integrity_errors(self, max_price: Optional[int] = None) -> List[str]:
+        """
+        Run every product and brand check.
+        
+        Args:
+            max_price: Largest plausible price in minor units (no upper bound if None)
+        
+        Returns:
+            One message per problem; empty when the catalog is consistent
+        """
+        errors = list(self.problems)
+        errors.extend(f"Product id {product_id} is not unique"
+                      for product_id in duplicate_values(self.product_ids))
+        errors.extend(f"Brand id {brand_id} is not unique" for brand_id in duplicate_values(self.brand_ids))
+        errors.extend(f"Product {row}: id {self.product_ids[row]} should be positive"
+                      for row in out_of_range(self.product_ids, 1) if self.product_ids[row] != MISSING)
+        errors.extend(f"Brand {row}: id {self.brand_ids[row]} should be positive"
+                      for row in out_of_range(self.brand_ids, 1) if self.brand_ids[row] != MISSING)
+        errors.extend(f"Product {row}: price {self.prices[row]} is out of range"
+                      for row in out_of_range(self.prices, 1, max_price) if self.prices[row] != MISSING)
+        return errors
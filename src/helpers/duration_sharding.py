@@ -0,0 +1,125 @@
+"""
+Duration-based test sharding for AutomationExercise testing framework.
+"""
+import heapq
+import statistics
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+# Key of the per-test durations in pytest's cache (.pytest_cache)
+DURATIONS_CACHE_KEY = "automationexercise/durations"
+# Estimate used for tests that never ran, when no other test has a duration either
+DEFAULT_DURATION = 1.0
+
+
+def is_ui_test(nodeid: str) -> bool:
+    """Whether a test belongs to the UI suite (same rule as the ui marker in conftest)."""
+    return "user_interface" in nodeid
+
+
+class DurationStore:
+    """Per-test durations of previous runs, kept in pytest's cache.
+    
+    Each run's duration is blended into the stored one (exponential moving
+    average), so a single slow or fast run does not reshuffle the shards.
+    """
+    
+    def __init__(self, cache: Any, smoothing: float = 0.5):
+        """
+        Initialize the store.
+        
+        Args:
+            cache: pytest's config.cache (None disables persistence)
+            smoothing: Weight of the newest duration (1.0 keeps only the last run)
+        """
+        self.cache = cache
+        self.smoothing = smoothing
+        self.durations: Dict[str, float] = dict(cache.get(DURATIONS_CACHE_KEY, {})) if cache else {}
+        known = list(self.durations.values())
+        self.default = statistics.median(known) if known else DEFAULT_DURATION
+    
+    def estimate(self, nodeid: str) -> float:
+        """
+        Get the expected duration of a test.
+        
+        Args:
+            nodeid: Test node id
+        
+        Returns:
+            Seconds (the median of known tests for a test that never ran)
+        """
+        return self.durations.get(nodeid, self.default)
+    
+    def update(self, measured: Dict[str, float]) -> None:
+        """
+        Blend this run's durations in and persist them.
+        
+        Args:
+            measured: Seconds per test node id (setup + call + teardown)
+        """
+        for nodeid, seconds in measured.items():
+            previous = self.durations.get(nodeid)
+            self.durations[nodeid] = seconds if previous is None else (
+                self.smoothing * seconds + (1 - self.smoothing) * previous
+            )
+        if self.cache is not None:
+            self.cache.set(DURATIONS_CACHE_KEY, self.durations)
+
+
+def lpt_partition(items: Sequence[Tuple[int, float]], bins: int) -> List[List[int]]:
+    """
+    Split items into bins with longest-processing-time-first packing.
+    
+    Items are taken longest first and each goes to the currently lightest
+    bin, which keeps the heaviest bin within 4/3 of the optimum.
+    
+    Args:
+        items: (item, duration) pairs
+        bins: Number of bins
+    
+    Returns:
+        Items per bin, each bin in descending duration order
+    """
+    partition: List[List[int]] = [[] for _ in range(bins)]
+    heap = [(0.0, index) for index in range(bins)]
+    for item, duration in sorted(items, key=lambda pair: pair[1], reverse=True):
+        load, index = heapq.heappop(heap)
+        partition[index].append(item)
+        heapq.heappush(heap, (load + duration, index))
+    return partition
+
+
+def plan_shards(collection: Sequence[str], workers: int, estimate: Callable[[str], float],
+                is_ui: Callable[[str], bool] = is_ui_test) -> List[Tuple[str, List[int]]]:
+    """
+    Assign collected tests to workers, keeping UI and API tests on separate workers.
+    
+    Workers are split between the two suites in proportion to their expected
+    total duration (at least one each when both are present), then each suite
+    is LPT-packed onto its workers.
+    
+    Args:
+        collection: Collected node ids, in collection order
+        workers: Number of workers
+        estimate: Expected duration of a node id
+        is_ui: Whether a node id is a UI test
+    
+    Returns:
+        One (kind, indices into collection) pair per worker; kind is "ui" or "api"
+    """
+    suites: Dict[str, List[Tuple[int, float]]] = {"ui": [], "api": []}
+    for index, nodeid in enumerate(collection):
+        suites["ui" if is_ui(nodeid) else "api"].append((index, estimate(nodeid)))
+    
+    if workers < 2 or not suites["ui"] or not suites["api"]:
+        # A single suite or a single worker: there is nothing to keep apart
+        kind = "ui" if suites["ui"] else "api"
+        return [(kind, indices) for indices in lpt_partition(suites["ui"] + suites["api"], workers)]
+    
+    totals = {kind: sum(duration for _, duration in items) for kind, items in suites.items()}
+    ui_workers = round(workers * totals["ui"] / (totals["ui"] + totals["api"]))
+    ui_workers = min(max(ui_workers, 1), workers - 1)
+    
+    return (
+        [("ui", indices) for indices in lpt_partition(suites["ui"], ui_workers)]
+        + [("api", indices) for indices in lpt_partition(suites["api"], workers - ui_workers)]
+    )
@@ -0,0 +1,359 @@
+"""
+HAR record/replay support for AutomationExercise testing framework.
+"""
+import base64
+import itertools
+import json
+import os
+import re
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlencode
+from playwright.sync_api import BrowserContext
+from src.api_client.request_pool import BufferedResponse
+
+NETWORK_MODE_LIVE = "live"
+NETWORK_MODE_RECORD = "record"
+NETWORK_MODE_REPLAY = "replay"
+NETWORK_MODES = (NETWORK_MODE_LIVE, NETWORK_MODE_RECORD, NETWORK_MODE_REPLAY)
+
+# Shared by every xdist worker of a run, so their recordings merge into one archive
+# while an archive left by an earlier run is replaced
+RECORDING_RUN_ID = os.getenv("PYTEST_XDIST_TESTRUNUID") or uuid.uuid4().hex
+# Part file numbers, unique within the process however many recorders it creates
+_PART_NUMBERS = itertools.count()
+
+
+def har_file_for(module_path: str, kind: str, har_dir: Optional[str] = None) -> str:
+    """
+    Get the HAR archive path for a test module.
+    
+    Args:
+        module_path: Test module path (e.g. "src/tests/api/test_products_api.py")
+        kind: "api" or "browser"
+        har_dir: Directory holding the archives (defaults to HAR_DIR or src/data/har)
+    
+    Returns:
+        HAR file path
+    """
+    har_dir = har_dir or os.getenv("HAR_DIR", os.path.join("src", "data", "har"))
+    module_name = os.path.splitext(os.path.basename(module_path))[0]
+    return os.path.join(har_dir, f"{module_name}.{kind}.har")
+
+
+def har_file_for_test(nodeid: str, kind: str, har_dir: Optional[str] = None) -> str:
+    """
+    Get the HAR archive path for a single test.
+    
+    Stateful pages such as /view_cart answer differently in every test, so
+    browser traffic is archived per test instead of per module.
+    
+    Args:
+        nodeid: pytest node id (e.g. "src/tests/user_interface/test_e2e_cart.py::TestE2ECart::test_x[chromium]")
+        kind: "browser" or "cart"
+        har_dir: Directory holding the archives (defaults to HAR_DIR or src/data/har)
+    
+    Returns:
+        HAR file path, in a directory named after the test module
+    """
+    module_path, _, test_name = nodeid.partition("::")
+    module_dir = os.path.dirname(har_file_for(module_path, kind, har_dir))
+    module_name = os.path.splitext(os.path.basename(module_path))[0]
+    test_name = re.sub(r"[^\w.-]+", "_", test_name.replace("::", ".")).strip("_")
+    return os.path.join(module_dir, module_name, f"{test_name}.{kind}.har")
+
+
+def _empty_har() -> Dict[str, Any]:
+    """Create an empty HAR 1.2 document."""
+    return {"log": {"version": "1.2", "creator": {"name": "automationexercise-tests", "version": "1.0"}, "entries": []}}
+
+
+@contextmanager
+def _archive_lock(path: str, timeout: float = 60.0) -> Iterator[None]:
+    """Hold an exclusive lock file next to an archive (works across xdist workers)."""
+    lock_path = f"{path}.lock"
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            lock_fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"HAR archive {path} stayed locked for {timeout}s (stale {lock_path}?)")
+            time.sleep(0.05)
+    try:
+        yield
+    finally:
+        os.close(lock_fd)
+        os.remove(lock_path)
+
+
+def merge_into_archive(path: str, entries: List[Dict[str, Any]]) -> None:
+    """
+    Add recorded entries to a HAR archive without losing other recorders' entries.
+    
+    Entries written earlier in the same run (other xdist workers, or a
+    re-created module fixture) are kept; an archive from a previous run is
+    replaced. The archive is rewritten atomically under a lock file.
+    
+    Args:
+        path: HAR archive
+        entries: HAR entries to add
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with _archive_lock(path):
+        har = _empty_har()
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as har_file:
+                existing = json.load(har_file)
+            if existing["log"].get("comment") == RECORDING_RUN_ID:
+                har = existing
+        har["log"]["comment"] = RECORDING_RUN_ID
+        har["log"]["entries"].extend(entries)
+        
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as har_file:
+            json.dump(har, har_file)
+        os.replace(temp_path, path)
+
+
+class HarEntryNotFound(LookupError):
+    """Raised in replay mode when a request was never recorded."""
+
+
+class HarApiTransport:
+    """Records or replays BaseAPIClient traffic through a HAR archive.
+    
+    Exposes the same fetch() as APIRequestContext and RequestContextPool, so
+    it can be handed to any controller. In record mode requests go to the
+    wrapped transport and every exchange is appended to the archive; in replay
+    mode responses are served from the archive without touching the network.
+    Identical requests are replayed in the order they were recorded.
+    """
+    
+    def __init__(self, path: str, mode: str, transport: Any = None):
+        """
+        Initialize the HAR transport.
+        
+        Args:
+            path: HAR file to read (replay) or write (record)
+            mode: NETWORK_MODE_RECORD or NETWORK_MODE_REPLAY
+            transport: Object with fetch() used in record mode
+        """
+        if mode not in (NETWORK_MODE_RECORD, NETWORK_MODE_REPLAY):
+            raise ValueError(f"HarApiTransport does not support network mode: {mode}")
+        if mode == NETWORK_MODE_RECORD and transport is None:
+            raise ValueError("Record mode needs a transport to send requests through")
+        
+        self.path = path
+        self.mode = mode
+        self.transport = transport
+        self._lock = threading.Lock()
+        self._recorded: List[Dict[str, Any]] = []
+        self._replay: Dict[Tuple[str, str, str], List[Dict[str, Any]]] = {}
+        self._replay_positions: Dict[Tuple[str, str, str], int] = {}
+        # Read on the first replayed request, so a fixture nobody sends through needs no archive
+        self._loaded = False
+    
+    @staticmethod
+    def _build_url(url: str, params: Optional[Dict[str, Any]]) -> str:
+        """Append query parameters to a URL."""
+        if not params:
+            return url
+        separator = "&" if "?" in url else "?"
+        return f"{url}{separator}{urlencode(params)}"
+    
+    @staticmethod
+    def _encode_body(data: Any, form: Optional[Dict[str, Any]]) -> Tuple[str, str]:
+        """Get the request body text and MIME type the way Playwright would send it."""
+        if form:
+            return urlencode(form), "application/x-www-form-urlencoded"
+        if data is None:
+            return "", ""
+        if isinstance(data, (bytes, bytearray)):
+            return bytes(data).decode("utf-8", errors="replace"), "application/octet-stream"
+        if isinstance(data, str):
+            return data, "text/plain"
+        return json.dumps(data, sort_keys=True), "application/json"
+    
+    def _load(self) -> None:
+        """Index the archive entries by request."""
+        if not os.path.exists(self.path):
+            raise FileNotFoundError(
+                f"No HAR archive at {self.path}; run the module once with --network-mode=record"
+            )
+        with open(self.path, encoding="utf-8") as har_file:
+            entries = json.load(har_file)["log"]["entries"]
+        
+        for entry in entries:
+            request = entry["request"]
+            key = (request["method"], request["url"], request.get("postData", {}).get("text", ""))
+            self._replay.setdefault(key, []).append(entry["response"])
+    
+    def fetch(self, url: str, method: str = "GET", headers: Optional[Dict[str, str]] = None,
+              params: Optional[Dict[str, Any]] = None, data: Any = None,
+              form: Optional[Dict[str, Any]] = None, **kwargs: Any) -> Any:
+        """
+        Send (record) or look up (replay) a request.
+        
+        Args:
+            url: Request URL
+            method: HTTP method
+            headers: Request headers
+            params: Query parameters
+            data: Request body
+            form: Form fields
+            **kwargs: Other fetch arguments, passed through in record mode
+        
+        Returns:
+            Response object with status, headers, body(), text() and json()
+        """
+        method = method.upper()
+        full_url = self._build_url(url, params)
+        body_text, mime_type = self._encode_body(data, form)
+        
+        if self.mode == NETWORK_MODE_REPLAY:
+            return self._replay_response((method, full_url, body_text))
+        
+        started = datetime.now(timezone.utc).isoformat()
+        start = time.perf_counter()
+        response = self.transport.fetch(url, method=method, headers=headers, params=params,
+                                        data=data, form=form, **kwargs)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        body = response.body()
+        
+        request_entry: Dict[str, Any] = {
+            "method": method,
+            "url": full_url,
+            "httpVersion": "HTTP/1.1",
+            "headers": [{"name": name, "value": value} for name, value in (headers or {}).items()],
+            "queryString": [{"name": name, "value": str(value)} for name, value in (params or {}).items()],
+            "headersSize": -1,
+            "bodySize": len(body_text.encode("utf-8")),
+        }
+        if body_text:
+            request_entry["postData"] = {"mimeType": mime_type, "text": body_text}
+        
+        entry = {
+            "startedDateTime": started,
+            "time": elapsed_ms,
+            "request": request_entry,
+            "response": {
+                "status": response.status,
+                "statusText": "",
+                "httpVersion": "HTTP/1.1",
+                "headers": [{"name": name, "value": value} for name, value in response.headers.items()],
+                "content": {
+                    "size": len(body),
+                    "mimeType": response.headers.get("content-type", ""),
+                    "text": base64.b64encode(body).decode("ascii"),
+                    "encoding": "base64",
+                },
+                "redirectURL": "",
+                "headersSize": -1,
+                "bodySize": len(body),
+            },
+            "cache": {},
+            "timings": {"send": 0, "wait": elapsed_ms, "receive": 0},
+        }
+        with self._lock:
+            self._recorded.append(entry)
+        
+        return BufferedResponse(status=response.status, headers=response.headers, url=full_url, body=body)
+    
+    def _replay_response(self, key: Tuple[str, str, str]) -> BufferedResponse:
+        """Serve the next recorded response for a request."""
+        with self._lock:
+            if not self._loaded:
+                self._load()
+                self._loaded = True
+            responses = self._replay.get(key)
+            if not responses:
+                raise HarEntryNotFound(f"No recorded response for {key[0]} {key[1]} in {self.path}")
+            position = self._replay_positions.get(key, 0)
+            # Repeat the last response once the recorded ones are used up
+            response = responses[min(position, len(responses) - 1)]
+            self._replay_positions[key] = position + 1
+        
+        content = response.get("content", {})
+        text = content.get("text", "")
+        body = base64.b64decode(text) if content.get("encoding") == "base64" else text.encode("utf-8")
+        headers = {header["name"].lower(): header["value"] for header in response.get("headers", [])}
+        return BufferedResponse(status=response["status"], headers=headers, url=key[1], body=body)
+    
+    def save(self) -> None:
+        """Merge the recorded exchanges into the archive (record mode only)."""
+        if self.mode != NETWORK_MODE_RECORD or not self._recorded:
+            return
+        with self._lock:
+            recorded, self._recorded = self._recorded, []
+        merge_into_archive(self.path, recorded)
+
+
+class BrowserHarRecorder:
+    """Records or replays browser traffic through HAR archives.
+    
+    Every test gets its own context and, through install(context, path),
+    usually its own archive (see har_file_for_test), so a stateful URL never
+    holds responses from different tests. In record mode each context writes
+    a part file named after the xdist worker and process, and finalize()
+    merges every part into the archive it belongs to.
+    """
+    
+    def __init__(self, path: str, mode: str):
+        """
+        Initialize the recorder.
+        
+        Args:
+            path: Default HAR archive (used when install() gets no path)
+            mode: NETWORK_MODE_RECORD or NETWORK_MODE_REPLAY
+        """
+        self.path = path
+        self.mode = mode
+        self._parts: List[Tuple[str, str]] = []
+    
+    def install(self, context: BrowserContext, path: Optional[str] = None) -> None:
+        """
+        Attach HAR recording or replay to a fresh context.
+        
+        Args:
+            context: Browser context (before any page is opened)
+            path: Archive of this context (defaults to the recorder's path)
+        """
+        path = path or self.path
+        if self.mode == NETWORK_MODE_REPLAY:
+            if not os.path.exists(path):
+                raise FileNotFoundError(
+                    f"No HAR archive at {path}; run the test once with --network-mode=record"
+                )
+            context.route_from_har(path, not_found="abort")
+        elif self.mode == NETWORK_MODE_RECORD:
+            # Worker, pid and a process-wide counter keep parallel recorders apart
+            worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+            part = f"{path}.{worker}-{os.getpid()}.part{next(_PART_NUMBERS)}"
+            os.makedirs(os.path.dirname(part) or ".", exist_ok=True)
+            self._parts.append((path, part))
+            # The part is written when the context closes
+            context.route_from_har(part, update=True, update_content="embed")
+    
+    def finalize(self) -> None:
+        """Merge the recorded part files into their archives (see merge_into_archive)."""
+        if self.mode != NETWORK_MODE_RECORD or not self._parts:
+            return
+        
+        entries_by_archive: Dict[str, List[Dict[str, Any]]] = {}
+        for path, part in self._parts:
+            entries = entries_by_archive.setdefault(path, [])
+            if not os.path.exists(part):
+                continue
+            with open(part, encoding="utf-8") as part_file:
+                entries.extend(json.load(part_file)["log"]["entries"])
+            os.remove(part)
+        
+        for path, entries in entries_by_archive.items():
+            merge_into_archive(path, entries)
+        self._parts.clear()
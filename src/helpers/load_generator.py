@@ -0,0 +1,284 @@
+"""
+Open-loop load generator for AutomationExercise API controllers.
+
+Usage:
+    python -m src.helpers.load_generator --stand-in --rate 50 --duration 20
+    python -m src.helpers.load_generator --rate 10 --duration 60 --mix search,brands --workers 16
+    python -m src.helpers.load_generator --stand-in --rate 100 --duration 20 --transport httpx
+"""
+import argparse
+import itertools
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from src.api_client.latency import LatencyHistogram
+
+# (name, zero-argument callable) pairs; the generator cycles through them in order
+Operation = Tuple[str, Callable[[], Any]]
+
+
+def response_ok(response: Any) -> bool:
+    """Default success check for controller results: HTTP 200 and no error responseCode."""
+    if response["status"] != 200:
+        return False
+    data = response["data"]
+    return not isinstance(data, dict) or data.get("responseCode", 200) < 400
+
+
+class LoadResult:
+    """Latency, throughput and errors of one load run."""
+    
+    def __init__(self, rate: float):
+        """
+        Initialize an empty result.
+        
+        Args:
+            rate: Target arrival rate in requests per second
+        """
+        self.rate = rate
+        self.latency = LatencyHistogram()
+        self.service_time = LatencyHistogram()
+        self.by_operation: Dict[str, LatencyHistogram] = {}
+        self.errors: Counter = Counter()
+        self.sent = 0
+        self.duration_ns = 0
+        self._lock = threading.Lock()
+    
+    def record(self, operation: str, latency_ns: int, service_ns: int, error: Optional[str]) -> None:
+        """
+        Record one completed request.
+        
+        Args:
+            operation: Operation name
+            latency_ns: Time from the intended start to completion
+            service_ns: Time from the actual start to completion
+            error: Error description, or None on success
+        """
+        with self._lock:
+            self.latency.record(latency_ns)
+            self.service_time.record(service_ns)
+            self.by_operation.setdefault(operation, LatencyHistogram()).record(latency_ns)
+            if error:
+                self.errors[f"{operation}: {error}"] += 1
+    
+    @property
+    def completed(self) -> int:
+        """Requests that finished (successfully or not)."""
+        return self.latency.count
+    
+    @property
+    def throughput(self) -> float:
+        """Completed requests per second over the whole run."""
+        return self.completed / (self.duration_ns / 1e9) if self.duration_ns else 0.0
+    
+    @property
+    def error_rate(self) -> float:
+        """Share of completed requests that failed."""
+        return sum(self.errors.values()) / self.completed if self.completed else 0.0
+    
+    def summary(self) -> Dict[str, Any]:
+        """Get throughput, error rate and latency percentiles as JSON-compatible data."""
+        return {
+            "target_rps": self.rate,
+            "achieved_rps": round(self.throughput, 2),
+            "sent": self.sent,
+            "completed": self.completed,
+            "error_rate": round(self.error_rate, 4),
+            "errors": dict(self.errors),
+            "latency": self.latency.summary_ms(),
+            "service_time": self.service_time.summary_ms(),
+            "by_operation": {name: histogram.summary_ms() for name, histogram in self.by_operation.items()},
+        }
+    
+    def __str__(self) -> str:
+        latency = self.latency.summary_ms()
+        service = self.service_time.summary_ms()
+        lines = [
+            f"target {self.rate:.1f} rps, achieved {self.throughput:.1f} rps "
+            f"({self.completed}/{self.sent} completed, {self.error_rate:.2%} errors)",
+            f"latency  p50 {latency['p50_ms']:.1f} ms  p90 {latency['p90_ms']:.1f} ms  "
+            f"p99 {latency['p99_ms']:.1f} ms  max {latency['max_ms']:.1f} ms",
+            f"service  p50 {service['p50_ms']:.1f} ms  p90 {service['p90_ms']:.1f} ms  "
+            f"p99 {service['p99_ms']:.1f} ms  max {service['max_ms']:.1f} ms",
+        ]
+        lines.extend(f"error    {count}x {error}" for error, count in self.errors.most_common())
+        return "\n".join(lines)
+
+
+class OpenLoopLoadGenerator:
+    """Starts requests on a fixed schedule, whether or not earlier ones have finished.
+    
+    A closed loop (send, wait, send) slows down with the server and hides
+    its worst latencies (coordinated omission). Here every request has an
+    intended start time derived from the target rate, and its latency is
+    measured from that time: when the workers fall behind, the queueing
+    delay shows up in the latency instead of silently lowering the rate.
+    The actual service time is reported separately.
+    """
+    
+    def __init__(self, operations: Sequence[Operation], rate: float, workers: int = 8,
+                 poisson: bool = False, check: Callable[[Any], bool] = response_ok,
+                 seed: Optional[int] = None):
+        """
+        Initialize the generator.
+        
+        Args:
+            operations: (name, callable) pairs, cycled through in order
+            rate: Target arrival rate in requests per second
+            workers: Threads executing requests (match the request pool size)
+            poisson: Use exponential inter-arrival times instead of a fixed interval
+            check: Function telling whether a result is a success
+            seed: Random seed for Poisson arrivals
+        """
+        if not operations:
+            raise ValueError("At least one operation is needed")
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        self.operations = list(operations)
+        self.rate = rate
+        self.workers = workers
+        self.poisson = poisson
+        self.check = check
+        self._random = random.Random(seed)
+    
+    def _gap_ns(self) -> int:
+        """Time until the next arrival."""
+        if self.poisson:
+            return int(self._random.expovariate(self.rate) * 1e9)
+        return int(1e9 / self.rate)
+    
+    def _execute(self, result: LoadResult, name: str, operation: Callable[[], Any], intended_ns: int) -> None:
+        """Run one request and record its timings."""
+        started = time.perf_counter_ns()
+        error = None
+        try:
+            if not self.check(operation()):
+                error = "unexpected response"
+        except Exception as exc:
+            error = type(exc).__name__
+        finished = time.perf_counter_ns()
+        result.record(name, finished - intended_ns, finished - started, error)
+    
+    def run(self, total: Optional[int] = None, duration: Optional[float] = None) -> LoadResult:
+        """
+        Generate load until a number of requests was sent or a duration elapsed.
+        
+        Args:
+            total: Number of requests to send
+            duration: Seconds to send for (total = rate * duration)
+        
+        Returns:
+            Load result
+        """
+        if total is None:
+            if duration is None:
+                raise ValueError("Give either total or duration")
+            total = max(int(self.rate * duration), 1)
+        
+        result = LoadResult(self.rate)
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="load") as executor:
+            start = time.perf_counter_ns()
+            intended = start
+            for index in range(total):
+                delay = intended - time.perf_counter_ns()
+                if delay > 0:
+                    time.sleep(delay / 1e9)
+                name, operation = self.operations[index % len(self.operations)]
+                executor.submit(self._execute, result, name, operation, intended)
+                result.sent += 1
+                intended += self._gap_ns()
+        result.duration_ns = time.perf_counter_ns() - start
+        return result
+
+
+def controller_operations(products: Any, brands: Any, users: Any, mix: Sequence[str],
+                          search_terms: Sequence[str] = ("dress",),
+                          credentials: Tuple[str, str] = ("test.user@example.com", "testpassword123")) -> List[Operation]:
+    """
+    Build a request mix from controllers.
+    
+    Args:
+        products: ProductsController
+        brands: BrandsController (may be None if the mix does not use it)
+        users: UserController (may be None if the mix does not use it)
+        mix: Operation names: search, products, brands, login
+        search_terms: Terms cycled through by "search"
+        credentials: (email, password) used by "login"
+    
+    Returns:
+        Operations for OpenLoopLoadGenerator
+    """
+    terms = itertools.cycle(search_terms)
+    terms_lock = threading.Lock()
+    
+    def next_term() -> str:
+        # Operations run on several worker threads at once
+        with terms_lock:
+            return next(terms)
+    
+    available = {
+        "search": lambda: products.search_product(next_term()),
+        "products": lambda: products.get_all_products(use_cache=False),
+        "brands": lambda: brands.get_all_brands(use_cache=False),
+        "login": lambda: users.verify_login(*credentials),
+    }
+    unknown = [name for name in mix if name not in available]
+    if unknown:
+        raise ValueError(f"Unknown operations {unknown}; choose from {sorted(available)}")
+    return [(name, available[name]) for name in mix]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Drive the API at a target rate from the command line."""
+    parser = argparse.ArgumentParser(description="Open-loop load generator for the AutomationExercise API")
+    parser.add_argument("--rate", type=float, default=10.0, help="target requests per second")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds to send for")
+    parser.add_argument("--workers", type=int, default=8, help="threads and pooled request contexts")
+    parser.add_argument("--mix", default="search,products,brands,login",
+                        help="comma-separated operations: search, products, brands, login")
+    parser.add_argument("--poisson", action="store_true", help="exponential inter-arrival times")
+    parser.add_argument("--base-url", help="API base URL (defaults to API_BASE_URL)")
+    parser.add_argument("--stand-in", action="store_true", help="run against a local stand-in server")
+    parser.add_argument("--transport", choices=("playwright", "httpx"), default="playwright",
+                        help="HTTP client: pooled Playwright request contexts or one httpx keep-alive pool")
+    parser.add_argument("--max-error-rate", type=float, default=0.01, help="exit with 1 above this error rate")
+    args = parser.parse_args(argv)
+    
+    from src.api_client.controllers.brands_controller import BrandsController
+    from src.api_client.controllers.products_controller import ProductsController
+    from src.api_client.controllers.user_controller import UserController
+    from src.api_client.httpx_transport import HttpxTransport
+    from src.api_client.request_pool import RequestContextPool
+    from src.helpers.stand_in_server import StandInServer
+    
+    server = StandInServer().start() if args.stand_in else None
+    base_url = server.api_base_url if server else args.base_url
+    if args.transport == "httpx":
+        pool = HttpxTransport(max_connections=args.workers, max_keepalive_connections=args.workers,
+                              ignore_https_errors=True)
+    else:
+        pool = RequestContextPool(size=args.workers, ignore_https_errors=True)
+    try:
+        operations = controller_operations(
+            ProductsController(pool, base_url=base_url),
+            BrandsController(pool, base_url=base_url),
+            UserController(pool, base_url=base_url),
+            [name.strip() for name in args.mix.split(",") if name.strip()]
+        )
+        generator = OpenLoopLoadGenerator(operations, args.rate, workers=args.workers, poisson=args.poisson)
+        result = generator.run(duration=args.duration)
+    finally:
+        pool.close()
+        if server:
+            server.stop()
+    
+    print(result)
+    return 1 if result.error_rate > args.max_error_rate else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
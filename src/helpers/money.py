@@ -0,0 +1,142 @@
+"""
+Price parsing for AutomationExercise testing framework.
+"""
+import os
+import re
+from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+
+class MoneyFormat(NamedTuple):
+    """How a locale writes amounts."""
+    decimal_separator: str
+    group_separators: str
+    minor_digits: int
+    # Also accept Indian lakh grouping (1,23,456) next to groups of three
+    lakh_grouping: bool = False
+
+
+# Group separators include the (narrow) no-break spaces some locales print
+MONEY_FORMATS: Dict[str, MoneyFormat] = {
+    "en_IN": MoneyFormat(".", ",", 2, lakh_grouping=True),
+    "en_US": MoneyFormat(".", ",", 2),
+    "en_GB": MoneyFormat(".", ",", 2),
+    "de_DE": MoneyFormat(",", ".\u00a0 ", 2),
+    "fr_FR": MoneyFormat(",", "\u202f\u00a0 ", 2),
+    "es_ES": MoneyFormat(",", ".\u00a0 ", 2),
+    "ja_JP": MoneyFormat(".", ",", 0),
+}
+
+# The site shows rupees ("Rs. 500")
+PRICE_LOCALE = os.getenv('PRICE_LOCALE', 'en_IN')
+
+# Runs of digits joined by single separators, e.g. "1,234.50" out of "Rs. 1,234.50";
+# the locale's pattern (_amount_pattern) then decides whether the grouping is valid
+_AMOUNT = re.compile(r"-?\d+(?:[.,'\u00a0\u202f\u2009 ]\d+)*")
+
+
+def money_format(locale: str = PRICE_LOCALE) -> MoneyFormat:
+    """
+    Get the format of a locale.
+    
+    Args:
+        locale: Locale name like "en_IN" (a bare language like "de" matches "de_DE")
+    
+    Returns:
+        Money format
+    
+    Raises:
+        ValueError: If the locale is not known
+    """
+    if locale in MONEY_FORMATS:
+        return MONEY_FORMATS[locale]
+    for name, money in MONEY_FORMATS.items():
+        if name.split("_")[0] == locale:
+            return money
+    raise ValueError(f"Unknown price locale {locale!r}; choose from {', '.join(MONEY_FORMATS)}")
+
+
+@lru_cache(maxsize=None)
+def _amount_pattern(money: MoneyFormat) -> "re.Pattern[str]":
+    """Pattern of a whole amount written in a money format (grouped or not, optional decimals)."""
+    group = "[" + re.escape("".join(
+        separator for separator in money.group_separators + "'" if separator != money.decimal_separator
+    )) + "]"
+    integers = [rf"\d{{1,3}}(?:{group}\d{{3}})+"]
+    if money.lakh_grouping:
+        integers.append(rf"\d{{1,2}}(?:{group}\d{{2}})+{group}\d{{3}}")
+    integers.append(r"\d+")
+    return re.compile(rf"-?(?:{'|'.join(integers)})(?:{re.escape(money.decimal_separator)}\d+)?")
+
+
+@lru_cache(maxsize=4096)
+def parse_minor(text: str, locale: str = PRICE_LOCALE) -> int:
+    """
+    Parse a displayed price into integer minor units (paise, cents).
+    
+    Currency symbols and words around the amount are ignored; group
+    separators are dropped and the locale's decimal separator is honoured,
+    so "Rs. 1,234.50" is 123450 and "1.234,50 €" (de_DE) is 123450 too.
+    Digit groups must match the locale, so an amount written the way of
+    another locale ("1.234,50" under en_IN) is rejected, not misread.
+    Results are cached, so the prices repeated across page objects and
+    tests are parsed once per process.
+    
+    Args:
+        text: Price text like "Rs. 500"
+        locale: Locale the text is written in
+    
+    Returns:
+        Amount in minor units
+    
+    Raises:
+        ValueError: If the text holds no amount, more than one, or one not written the locale's way
+    """
+    amounts = _AMOUNT.findall(text or "")
+    if not amounts:
+        raise ValueError(f"No amount in price {text!r}")
+    if len(amounts) > 1:
+        raise ValueError(f"More than one amount in price {text!r}")
+    money = money_format(locale)
+    amount = amounts[0]
+    if not _amount_pattern(money).fullmatch(amount):
+        raise ValueError(f"Amount {amount!r} in price {text!r} is not written the {locale} way")
+    
+    integer, _, fraction = amount.partition(money.decimal_separator)
+    # The sign may also stand before the currency symbol ("-Rs. 5")
+    negative = integer.startswith("-") or text.lstrip().startswith("-")
+    value = Decimal(f"{'-' if negative else ''}{re.sub(r'[^0-9]', '', integer)}.{fraction or '0'}")
+    return int((value * 10 ** money.minor_digits).to_integral_value(ROUND_HALF_UP))
+
+
+def parse_many(texts: Iterable[str], locale: str = PRICE_LOCALE) -> List[Optional[int]]:
+    """
+    Parse a list of prices, each distinct text once.
+    
+    Args:
+        texts: Price texts
+        locale: Locale the texts are written in
+    
+    Returns:
+        Minor units per text, in order (None where a text holds no amount)
+    """
+    texts = list(texts)
+    parsed: Dict[str, Optional[int]] = {}
+    for text in dict.fromkeys(texts):
+        try:
+            parsed[text] = parse_minor(text, locale)
+        except ValueError:
+            parsed[text] = None
+    return [parsed[text] for text in texts]
+
+
+def to_minor(amount: float, locale: str = PRICE_LOCALE) -> int:
+    """Convert a major-unit amount (e.g. a float bound like 499.5) to minor units."""
+    value = Decimal(str(amount)) * 10 ** money_format(locale).minor_digits
+    return int(value.to_integral_value(ROUND_HALF_UP))
+
+
+def to_major(minor: int, locale: str = PRICE_LOCALE) -> float:
+    """Convert minor units back to a major-unit float (e.g. 123450 -> 1234.5)."""
+    return minor / 10 ** money_format(locale).minor_digits
@@ -0,0 +1,189 @@
+"""
+Network request blocking for AutomationExercise testing framework.
+"""
+import os
+from collections import Counter
+from fnmatch import fnmatch
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+from playwright.sync_api import BrowserContext, Route
+
+# Third-party hosts that only serve ads, analytics and web fonts
+DEFAULT_DENY_DOMAINS = [
+    "googlesyndication.com",
+    "doubleclick.net",
+    "googleadservices.com",
+    "adservice.google.com",
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googletagservices.com",
+    "fundingchoicesmessages.google.com",
+    "fonts.googleapis.com",
+    "fonts.gstatic.com",
+    "facebook.net",
+    "hotjar.com",
+]
+
+# Resource types that never affect what the tests assert on
+DEFAULT_DENY_RESOURCE_TYPES = ["font", "media"]
+
+# Empty bodies served by the "stub" action, keyed by resource type
+STUB_CONTENT_TYPES = {
+    "script": "application/javascript",
+    "stylesheet": "text/css",
+    "xhr": "application/json",
+    "fetch": "application/json",
+}
+
+
+def _split_env(name: str) -> List[str]:
+    """Read a comma-separated list from an environment variable."""
+    return [value.strip() for value in os.getenv(name, "").split(",") if value.strip()]
+
+
+class RoutingRules:
+    """Declarative allow/deny lists for browser requests.
+    
+    A request is blocked when its host, resource type or URL matches a deny
+    entry and it does not match an allow entry. Allow entries always win.
+    """
+    
+    def __init__(self,
+                 deny_domains: Iterable[str] = (),
+                 deny_resource_types: Iterable[str] = (),
+                 deny_url_globs: Iterable[str] = (),
+                 allow_domains: Iterable[str] = (),
+                 allow_url_globs: Iterable[str] = (),
+                 action: str = "abort"):
+        """
+        Initialize the routing rules.
+        
+        Args:
+            deny_domains: Hosts to block (subdomains included)
+            deny_resource_types: Playwright resource types to block (e.g. "font", "image")
+            deny_url_globs: URL glob patterns to block
+            allow_domains: Hosts that are never blocked
+            allow_url_globs: URL glob patterns that are never blocked
+            action: "abort" to fail blocked requests, "stub" to answer them with an empty 200
+        """
+        if action not in ("abort", "stub"):
+            raise ValueError(f"Unknown blocking action: {action}")
+        
+        self.deny_domains = [domain.lower() for domain in deny_domains]
+        self.deny_resource_types = set(deny_resource_types)
+        self.deny_url_globs = list(deny_url_globs)
+        self.allow_domains = [domain.lower() for domain in allow_domains]
+        self.allow_url_globs = list(allow_url_globs)
+        self.action = action
+    
+    @classmethod
+    def from_env(cls) -> "RoutingRules":
+        """
+        Build rules from the defaults plus BLOCK_* / ALLOW_* environment variables.
+        
+        Returns:
+            Routing rules
+        """
+        base_host = urlparse(os.getenv('BASE_URL', 'https://automationexercise.com')).hostname or ""
+        resource_types = _split_env("BLOCK_RESOURCE_TYPES") or DEFAULT_DENY_RESOURCE_TYPES
+        return cls(
+            deny_domains=DEFAULT_DENY_DOMAINS + _split_env("BLOCK_DOMAINS"),
+            deny_resource_types=resource_types,
+            deny_url_globs=_split_env("BLOCK_URL_GLOBS"),
+            allow_domains=[base_host] + _split_env("ALLOW_DOMAINS"),
+            allow_url_globs=_split_env("ALLOW_URL_GLOBS"),
+            action=os.getenv("BLOCK_ACTION", "abort")
+        )
+    
+    @staticmethod
+    def _host_matches(host: str, domains: List[str]) -> Optional[str]:
+        """Get the first domain that the host equals or is a subdomain of."""
+        for domain in domains:
+            if host == domain or host.endswith(f".{domain}"):
+                return domain
+        return None
+    
+    def match(self, url: str, resource_type: str) -> Optional[str]:
+        """
+        Check whether a request should be blocked.
+        
+        Args:
+            url: Request URL
+            resource_type: Playwright resource type
+        
+        Returns:
+            Reason the request is blocked (e.g. "domain:doubleclick.net"), or None to let it through
+        """
+        host = (urlparse(url).hostname or "").lower()
+        
+        if self._host_matches(host, self.allow_domains):
+            # First-party requests are only blocked by resource type
+            if resource_type in self.deny_resource_types:
+                return f"type:{resource_type}"
+            return None
+        if any(fnmatch(url, pattern) for pattern in self.allow_url_globs):
+            return None
+        
+        domain = self._host_matches(host, self.deny_domains)
+        if domain:
+            return f"domain:{domain}"
+        if resource_type in self.deny_resource_types:
+            return f"type:{resource_type}"
+        for pattern in self.deny_url_globs:
+            if fnmatch(url, pattern):
+                return f"glob:{pattern}"
+        return None
+
+
+class NetworkBlocker:
+    """Installs RoutingRules on a browser context and counts what it blocked."""
+    
+    def __init__(self, rules: RoutingRules):
+        """
+        Initialize the blocker.
+        
+        Args:
+            rules: Routing rules to apply
+        """
+        self.rules = rules
+        self.blocked: Counter = Counter()
+        self.passed_count = 0
+    
+    def install(self, context: BrowserContext) -> None:
+        """
+        Route every request of a context through the rules.
+        
+        Args:
+            context: Browser context (before any page is opened)
+        """
+        context.route("**/*", self._handle)
+    
+    def _handle(self, route: Route) -> None:
+        """Abort, stub or pass through a single request."""
+        request = route.request
+        reason = self.rules.match(request.url, request.resource_type)
+        
+        if reason is None:
+            self.passed_count += 1
+            # fallback() lets other handlers (e.g. HAR replay) see the request
+            route.fallback()
+            return
+        
+        self.blocked[reason] += 1
+        if self.rules.action == "stub":
+            route.fulfill(
+                status=200,
+                body="",
+                content_type=STUB_CONTENT_TYPES.get(request.resource_type, "text/plain")
+            )
+        else:
+            route.abort("blockedbyclient")
+    
+    @property
+    def blocked_total(self) -> int:
+        """Number of requests blocked so far."""
+        return sum(self.blocked.values())
+    
+    def summary(self) -> Dict[str, int]:
+        """Get blocked request counts by reason."""
+        return dict(self.blocked)
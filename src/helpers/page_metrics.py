@@ -0,0 +1,174 @@
+"""
+Browser page metrics collection for AutomationExercise testing framework.
+"""
+import json
+import statistics
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+# Installed once per context with context.add_init_script (see conftest), so it runs
+# before any page script of every document in every page of the context.
+# TBT is approximated as the blocking part (over 50 ms) of every long task seen so far.
+WEB_VITALS_INIT_SCRIPT = """
+(() => {
+    if (window.__webVitals) return;
+    const vitals = window.__webVitals = { lcp: null, cls: 0, tbt: 0, longTasks: 0 };
+    const observe = (type, callback) => {
+        try {
+            new PerformanceObserver(list => list.getEntries().forEach(callback)).observe({ type, buffered: true });
+        } catch (error) {
+            // Entry type not supported by this browser engine
+        }
+    };
+    observe('largest-contentful-paint', entry => { vitals.lcp = entry.renderTime || entry.loadTime || entry.startTime; });
+    observe('layout-shift', entry => { if (!entry.hadRecentInput) vitals.cls += entry.value; });
+    observe('longtask', entry => { vitals.tbt += Math.max(entry.duration - 50, 0); vitals.longTasks += 1; });
+})();
+"""
+
+# Reads everything in one evaluate call
+PAGE_METRICS_SCRIPT = """() => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    const paint = performance.getEntriesByName('first-contentful-paint')[0];
+    const resources = performance.getEntriesByType('resource');
+    const vitals = window.__webVitals || {};
+    const at = value => (value > 0 ? value : null);
+    return {
+        url: location.href,
+        navigation_id: performance.timeOrigin,
+        ttfb_ms: nav ? at(nav.responseStart) : null,
+        response_end_ms: nav ? at(nav.responseEnd) : null,
+        dom_interactive_ms: nav ? at(nav.domInteractive) : null,
+        dom_content_loaded_ms: nav ? at(nav.domContentLoadedEventEnd) : null,
+        load_event_ms: nav ? at(nav.loadEventEnd) : null,
+        fcp_ms: paint ? paint.startTime : null,
+        lcp_ms: vitals.lcp ?? null,
+        cls: window.__webVitals ? vitals.cls : null,
+        tbt_ms: window.__webVitals ? vitals.tbt : null,
+        long_tasks: window.__webVitals ? vitals.longTasks : null,
+        document_transfer_size: nav ? nav.transferSize : 0,
+        resource_count: resources.length,
+        resource_transfer_size: resources.reduce((total, entry) => total + (entry.transferSize || 0), 0),
+        slowest_resource_ms: resources.reduce((slowest, entry) => Math.max(slowest, entry.duration), 0),
+    };
+}"""
+
+# Metrics summarized per URL: (field, statistic)
+SUMMARY_FIELDS = (
+    ("ttfb_ms", "p50"),
+    ("dom_content_loaded_ms", "p50"),
+    ("load_event_ms", "p50"),
+    ("load_event_ms", "p90"),
+    ("lcp_ms", "p90"),
+    ("cls", "max"),
+    ("tbt_ms", "p90"),
+)
+
+
+def url_key(url: str) -> str:
+    """Group URLs by path, ignoring host and query string (e.g. '/products')."""
+    return urlsplit(url).path or "/"
+
+
+def _statistic(values: List[float], name: str) -> Optional[float]:
+    """Compute p50, p90 or max of a list (None if empty)."""
+    if not values:
+        return None
+    if name == "max":
+        return round(max(values), 3)
+    if name == "p50" or len(values) < 2:
+        return round(statistics.median(values), 3)
+    return round(statistics.quantiles(values, n=10)[-1], 3)
+
+
+class PageMetricsLog:
+    """Page metrics of every navigation, kept in order and summarized per URL.
+    
+    Works like SleepBudget: BasePage records into the process-wide PAGE_METRICS,
+    tests attach what they recorded to their report and the run merges them.
+    Collecting the same document again replaces its previous entry, so the
+    latest (most complete) reading wins.
+    """
+    
+    def __init__(self):
+        """Initialize an empty log."""
+        self._lock = threading.Lock()
+        self._entries: List[Dict[str, Any]] = []
+    
+    def record(self, metrics: Dict[str, Any]) -> None:
+        """
+        Record the metrics of a navigation.
+        
+        Args:
+            metrics: PageMetrics.model_dump() output
+        """
+        with self._lock:
+            if self._entries and self._entries[-1]["navigation_id"] == metrics["navigation_id"]:
+                self._entries[-1] = metrics
+            else:
+                self._entries.append(metrics)
+    
+    def extend(self, entries: Iterable[Dict[str, Any]]) -> None:
+        """
+        Record several navigations at once (e.g. received from an xdist worker).
+        
+        Args:
+            entries: PageMetrics.model_dump() outputs
+        """
+        with self._lock:
+            self._entries.extend(entries)
+    
+    def mark(self) -> int:
+        """Get a marker that can be passed to entries_since()."""
+        with self._lock:
+            return len(self._entries)
+    
+    def entries_since(self, marker: int) -> List[Dict[str, Any]]:
+        """
+        Get the navigations recorded after a marker.
+        
+        Args:
+            marker: Value previously returned by mark()
+        
+        Returns:
+            List of metrics dictionaries
+        """
+        with self._lock:
+            return list(self._entries[marker:])
+    
+    def __bool__(self) -> bool:
+        """Whether anything was recorded."""
+        with self._lock:
+            return bool(self._entries)
+    
+    def by_url(self) -> Dict[str, Dict[str, Any]]:
+        """Get navigation count and metric percentiles per URL path."""
+        grouped: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        with self._lock:
+            for entry in self._entries:
+                grouped[url_key(entry["url"])].append(entry)
+        
+        summary = {}
+        for url, entries in sorted(grouped.items()):
+            row: Dict[str, Any] = {"count": len(entries)}
+            for field, name in SUMMARY_FIELDS:
+                values = [entry[field] for entry in entries if entry.get(field) is not None]
+                row[f"{field}_{name}"] = _statistic(values, name)
+            summary[url] = row
+        return summary
+    
+    def write_json(self, path: str) -> None:
+        """
+        Write the per-URL summary to a JSON file.
+        
+        Args:
+            path: Output file path
+        """
+        with open(path, "w", encoding="utf-8") as report_file:
+            json.dump(self.by_url(), report_file, indent=2)
+
+
+# Log for the current process; BasePage records into it
+PAGE_METRICS = PageMetricsLog()
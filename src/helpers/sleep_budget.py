@@ -0,0 +1,78 @@
+"""
+Fixed-sleep accounting for AutomationExercise testing framework.
+"""
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple
+
+
+class SleepBudget:
+    """Records every fixed sleep so the ones that remain stay visible.
+    
+    Page objects should wait on conditions, not timers. Any wait_for_timeout
+    that is still needed goes through BasePage.sleep(), which records it here;
+    the run summary then reports where the time went.
+    """
+    
+    def __init__(self):
+        """Initialize an empty budget."""
+        self._lock = threading.Lock()
+        self._entries: List[Tuple[str, int]] = []
+    
+    def record(self, location: str, milliseconds: int) -> None:
+        """
+        Record a fixed sleep.
+        
+        Args:
+            location: Where the sleep happened (e.g. "HomePage.some_method")
+            milliseconds: Sleep duration in milliseconds
+        """
+        with self._lock:
+            self._entries.append((location, int(milliseconds)))
+    
+    def extend(self, entries: Iterable[Tuple[str, int]]) -> None:
+        """
+        Record several sleeps at once (e.g. received from an xdist worker).
+        
+        Args:
+            entries: Iterable of (location, milliseconds) pairs
+        """
+        with self._lock:
+            self._entries.extend((location, int(ms)) for location, ms in entries)
+    
+    def mark(self) -> int:
+        """Get a marker that can be passed to entries_since()."""
+        with self._lock:
+            return len(self._entries)
+    
+    def entries_since(self, marker: int) -> List[Tuple[str, int]]:
+        """
+        Get the sleeps recorded after a marker.
+        
+        Args:
+            marker: Value previously returned by mark()
+        
+        Returns:
+            List of (location, milliseconds) pairs
+        """
+        with self._lock:
+            return list(self._entries[marker:])
+    
+    @property
+    def total_ms(self) -> int:
+        """Total time spent in fixed sleeps, in milliseconds."""
+        with self._lock:
+            return sum(ms for _, ms in self._entries)
+    
+    def by_location(self) -> Dict[str, Dict[str, int]]:
+        """Get call count and total milliseconds per location, slowest first."""
+        totals: Dict[str, Dict[str, int]] = defaultdict(lambda: {"count": 0, "total_ms": 0})
+        with self._lock:
+            for location, ms in self._entries:
+                totals[location]["count"] += 1
+                totals[location]["total_ms"] += ms
+        return dict(sorted(totals.items(), key=lambda item: item[1]["total_ms"], reverse=True))
+
+
+# Budget for the current process; BasePage.sleep() records into it
+SLEEP_BUDGET = SleepBudget()
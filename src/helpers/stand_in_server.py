@@ -0,0 +1,775 @@
+"""
+Local stand-in for AutomationExercise.com used by API and UI tests.
+
+Serves the API endpoints the controllers call and minimal HTML pages that
+carry the selectors the page objects use, from an in-process stdlib HTTP
+server. Pointing BASE_URL/API_BASE_URL at it gives a zero-latency baseline
+for measuring framework overhead and a safe target for load tests.
+
+Run standalone with:
+    python -m src.helpers.stand_in_server --port 8000
+"""
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+import secrets
+import threading
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, quote, unquote, urlparse
+
+CATALOG_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "stand_in_catalog.json")
+
+METHOD_NOT_SUPPORTED = "This request method is not supported."
+SESSION_COOKIE = "sessionid"
+
+# Tiny inline images so product cards and the logo have a visible box
+PRODUCT_IMAGE = ("data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' width='200' height='200'%3E"
+                 "%3Crect width='200' height='200' fill='%23eee'/%3E%3C/svg%3E")
+LOGO_IMAGE = ("data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' width='140' height='40'%3E"
+              "%3Crect width='140' height='40' fill='%23fe980f'/%3E%3C/svg%3E")
+
+
+class StandInStore:
+    """Catalog, user accounts and browser sessions of the stand-in server.
+    
+    Every server instance owns its own store, so a test session always
+    starts from the seeded catalog and users.
+    """
+    
+    def __init__(self, catalog_path: str = CATALOG_PATH):
+        """
+        Initialize the store from the catalog file.
+        
+        Args:
+            catalog_path: JSON file with categories, products and seed users
+        """
+        with open(catalog_path, encoding="utf-8") as catalog_file:
+            catalog = json.load(catalog_file)
+        
+        self.lock = threading.RLock()
+        self.categories: List[Dict[str, Any]] = catalog["categories"]
+        self.products: List[Dict[str, Any]] = catalog["products"]
+        self.products_by_id = {product["id"]: product for product in self.products}
+        # brandsList returns one entry per product, like the real site
+        self.brands = [{"id": index, "brand": product["brand"]}
+                       for index, product in enumerate(self.products, start=1)]
+        self.users: Dict[str, Dict[str, Any]] = {user["email"]: dict(user) for user in catalog["users"]}
+        self.sessions: Dict[str, Dict[str, Any]] = {}
+    
+    def search(self, term: str) -> List[Dict[str, Any]]:
+        """Get the products whose name, category or user type contains a term."""
+        term = term.lower().strip()
+        return [
+            product for product in self.products
+            if term in product["name"].lower()
+            or term in product["category"]["category"].lower()
+            or term in product["category"]["usertype"]["usertype"].lower()
+        ]
+    
+    def session(self, token: Optional[str]) -> Tuple[str, Dict[str, Any]]:
+        """Get (or start) the browser session for a cookie token."""
+        with self.lock:
+            if not token or token not in self.sessions:
+                token = secrets.token_hex(16)
+                self.sessions[token] = {"cart": {}, "user": None}
+            return token, self.sessions[token]
+
+
+def _price_value(product: Dict[str, Any]) -> int:
+    """Get a product price as an integer number of rupees."""
+    return int(re.sub(r"[^\d]", "", product["price"]) or 0)
+
+
+def _field(fields: Dict[str, List[str]], name: str) -> Optional[str]:
+    """Get the first value of a form or query field."""
+    values = fields.get(name)
+    return values[0] if values else None
+
+
+def _public_user(user: Dict[str, Any]) -> Dict[str, Any]:
+    """Get a user record without the password."""
+    return {key: value for key, value in user.items() if key != "password"}
+
+
+# API endpoints: each takes (store, method, fields) and returns the JSON payload
+
+def api_products_list(store: StandInStore, method: str, fields: Dict[str, List[str]]) -> Dict[str, Any]:
+    """API 1/2: GET all products."""
+    if method != "GET":
+        return {"responseCode": 405, "message": METHOD_NOT_SUPPORTED}
+    return {"responseCode": 200, "products": store.products}
+
+
+def api_brands_list(store: StandInStore, method: str, fields: Dict[str, List[str]]) -> Dict[str, Any]:
+    """API 3/4: GET all brands."""
+    if method != "GET":
+        return {"responseCode": 405, "message": METHOD_NOT_SUPPORTED}
+    return {"responseCode": 200, "brands": store.brands}
+
+
+def api_search_product(store: StandInStore, method: str, fields: Dict[str, List[str]]) -> Dict[str, Any]:
+    """API 5/6: POST search product."""
+    if method != "POST":
+        return {"responseCode": 405, "message": METHOD_NOT_SUPPORTED}
+    term = _field(fields, "search_product")
+    if term is None:
+        return {"responseCode": 400, "message": "Bad request, search_product parameter is missing in POST request."}
+    return {"responseCode": 200, "products": store.search(term)}
+
+
+def api_verify_login(store: StandInStore, method: str, fields: Dict[str, List[str]]) -> Dict[str, Any]:
+    """API 7-10: POST verify login."""
+    if method != "POST":
+        return {"responseCode": 405, "message": METHOD_NOT_SUPPORTED}
+    email, password = _field(fields, "email"), _field(fields, "password")
+    if not email or not password:
+        return {"responseCode": 400, "message": "Bad request, email or password parameter is missing in POST request."}
+    with store.lock:
+        user = store.users.get(email)
+        if user is None or user["password"] != password:
+            return {"responseCode": 404, "message": "User not found! Your email or password is incorrect."}
+        return {"responseCode": 200, "message": "User exists!", "user": _public_user(user)}
+
+
+def api_create_account(store: StandInStore, method: str, fields: Dict[str, List[str]]) -> Dict[str, Any]:
+    """API 11: POST create account."""
+    if method != "POST":
+        return {"responseCode": 405, "message": METHOD_NOT_SUPPORTED}
+    user = {name: values[0] for name, values in fields.items()}
+    if not user.get("email") or not user.get("password"):
+        return {"responseCode": 400, "message": "Bad request, email or password parameter is missing in POST request."}
+    with store.lock:
+        if user["email"] in store.users:
+            return {"responseCode": 400, "message": "Email already exists!"}
+        store.users[user["email"]] = user
+        return {"responseCode": 201, "message": "User created!", "user": _public_user(user)}
+
+
+def api_delete_account(store: StandInStore, method: str, fields: Dict[str, List[str]]) -> Dict[str, Any]:
+    """API 12: DELETE account."""
+    if method != "DELETE":
+        return {"responseCode": 405, "message": METHOD_NOT_SUPPORTED}
+    email = _field(fields, "email")
+    with store.lock:
+        if store.users.pop(email, None) is None:
+            return {"responseCode": 404, "message": "Account not found!"}
+        return {"responseCode": 200, "message": "Account deleted!"}
+
+
+def api_update_account(store: StandInStore, method: str, fields: Dict[str, List[str]]) -> Dict[str, Any]:
+    """API 13: PUT update account (creates it when missing, so test order does not matter)."""
+    if method != "PUT":
+        return {"responseCode": 405, "message": METHOD_NOT_SUPPORTED}
+    updates = {name: values[0] for name, values in fields.items()}
+    if not updates.get("email"):
+        return {"responseCode": 400, "message": "Bad request, email parameter is missing in PUT request."}
+    with store.lock:
+        user = store.users.setdefault(updates["email"], {})
+        user.update(updates)
+        return {"responseCode": 200, "message": "User updated!", "user": _public_user(user)}
+
+
+def api_get_user_detail(store: StandInStore, method: str, fields: Dict[str, List[str]]) -> Dict[str, Any]:
+    """API 14: GET user detail by email."""
+    if method != "GET":
+        return {"responseCode": 405, "message": METHOD_NOT_SUPPORTED}
+    email = _field(fields, "email")
+    if not email:
+        return {"responseCode": 400, "message": "Bad request, email parameter is missing in GET request."}
+    with store.lock:
+        user = store.users.get(email)
+        if user is None:
+            return {"responseCode": 404, "message": "Account not found with this email, try another email!"}
+        return {"responseCode": 200, "user": _public_user(user)}
+
+
+API_ENDPOINTS: Dict[str, Callable[[StandInStore, str, Dict[str, List[str]]], Dict[str, Any]]] = {
+    "productsList": api_products_list,
+    "brandsList": api_brands_list,
+    "searchProduct": api_search_product,
+    "verifyLogin": api_verify_login,
+    "createAccount": api_create_account,
+    "deleteAccount": api_delete_account,
+    "updateAccount": api_update_account,
+    "getUserDetailByEmail": api_get_user_detail,
+}
+
+
+# HTML pages
+
+PAGE_STYLE = """
+.product-overlay, .modal, .panel-collapse, .carousel-inner .item, #success-subscribe { display: none; }
+.product-image-wrapper:hover .product-overlay, .modal.in, .panel-collapse.in,
+.carousel-inner .item.active, #success-subscribe.in { display: block; }
+.modal { position: fixed; top: 20%; left: 30%; background: #fff; border: 1px solid #ccc; z-index: 10; }
+#scrollUp { position: fixed; right: 10px; bottom: 10px; }
+img { width: 200px; height: 200px; }
+.logo img { width: 140px; height: 40px; }
+"""
+
+# Vanilla stand-ins for the Bootstrap/jQuery widgets; they fire the same
+# slid.bs.carousel / shown.bs.collapse events the page objects wait for
+PAGE_SCRIPT = """
+function fire(el, name) { el.dispatchEvent(new CustomEvent(name, {bubbles: true})); }
+function slide(carousel, to) {
+  var items = carousel.querySelectorAll('.carousel-inner > .item');
+  var current = Array.prototype.findIndex.call(items, function (i) { return i.classList.contains('active'); });
+  if (to === 'next') { to = (current + 1) % items.length; }
+  if (to === 'prev') { to = (current - 1 + items.length) % items.length; }
+  items.forEach(function (item, i) { item.classList.toggle('active', i === Number(to)); });
+  carousel.querySelectorAll('.carousel-indicators li').forEach(function (li, i) {
+    li.classList.toggle('active', i === Number(to));
+  });
+  setTimeout(function () { fire(carousel, 'slid.bs.carousel'); }, 0);
+}
+function refreshCart(totals) {
+  document.querySelectorAll('.cart_total_price').forEach(function (el) { el.textContent = totals.cart_total; });
+  var empty = document.querySelectorAll('#cart_info_table tbody tr').length === 0;
+  var message = document.getElementById('empty_cart');
+  if (message) { message.style.display = empty ? 'block' : 'none'; }
+}
+document.addEventListener('click', function (e) {
+  var t = e.target.closest('a.add-to-cart');
+  if (t) {
+    e.preventDefault();
+    fetch('/add_to_cart/' + t.dataset.productId).then(function () {
+      document.getElementById('cartModal').classList.add('in');
+    });
+    return;
+  }
+  t = e.target.closest('.close-modal');
+  if (t) { t.closest('.modal').classList.remove('in'); return; }
+  t = e.target.closest('[data-slide], [data-slide-to]');
+  if (t) {
+    e.preventDefault();
+    var carousel = document.querySelector(t.getAttribute('href') || t.dataset.target);
+    slide(carousel, t.dataset.slideTo !== undefined ? t.dataset.slideTo : t.dataset.slide);
+    return;
+  }
+  t = e.target.closest('[data-toggle="collapse"]');
+  if (t) {
+    e.preventDefault();
+    var panel = document.querySelector(t.getAttribute('href'));
+    panel.classList.toggle('in');
+    if (panel.classList.contains('in')) { setTimeout(function () { fire(panel, 'shown.bs.collapse'); }, 0); }
+    return;
+  }
+  t = e.target.closest('a.cart_quantity_delete');
+  if (t) {
+    e.preventDefault();
+    fetch('/delete_cart/' + t.dataset.productId).then(function (r) { return r.json(); }).then(function (totals) {
+      t.closest('tr').remove();
+      refreshCart(totals);
+    });
+    return;
+  }
+  t = e.target.closest('.check_out');
+  if (t) { e.preventDefault(); document.getElementById('checkoutModal').classList.add('in'); return; }
+  t = e.target.closest('#subscribe');
+  if (t) {
+    var email = document.getElementById('susbscribe_email');
+    if (email.checkValidity()) {
+      e.preventDefault();
+      document.getElementById('success-subscribe').classList.add('in');
+    }
+    return;
+  }
+  t = e.target.closest('#scrollUp');
+  if (t) { e.preventDefault(); window.scrollTo(0, 0); }
+});
+document.addEventListener('change', function (e) {
+  var input = e.target.closest('td.cart_quantity input');
+  if (!input) { return; }
+  var row = input.closest('tr');
+  fetch('/update_cart/' + row.dataset.productId + '?quantity=' + encodeURIComponent(input.value))
+    .then(function (r) { return r.json(); })
+    .then(function (totals) { row.querySelector('td.cart_total p').textContent = totals.total; refreshCart(totals); });
+});
+document.addEventListener('keydown', function (e) {
+  if (e.key === 'Escape') {
+    document.querySelectorAll('.modal.in').forEach(function (m) { m.classList.remove('in'); });
+  }
+});
+"""
+
+
+def _esc(value: Any) -> str:
+    """HTML-escape a value."""
+    return html.escape(str(value))
+
+
+def _render_layout(title: str, body: str, user: Optional[Dict[str, Any]]) -> str:
+    """Wrap page content in the shared header, footer and scripts."""
+    if user:
+        account_links = (
+            '<li><a href="/logout">Logout</a></li>'
+            '<li><a href="/delete_account">Delete Account</a></li>'
+            f'<li><a>Logged in as <b>{_esc(user.get("name", ""))}</b></a></li>'
+        )
+    else:
+        account_links = '<li><a href="/login">Signup / Login</a></li>'
+    
+    return f"""<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>Automation Exercise - {_esc(title)}</title>
+<style>{PAGE_STYLE}</style></head><body>
+<header id="header"><div class="header-middle"><div class="container"><div class="row">
+<div class="col-sm-4"><div class="logo pull-left"><a href="/"><img src="{LOGO_IMAGE}" alt="Website for automation practice"></a></div></div>
+<div class="col-sm-8"><div class="shop-menu pull-right"><ul class="nav navbar-nav">
+<li><a href="/">Home</a></li><li><a href="/products">Products</a></li><li><a href="/view_cart">Cart</a></li>
+{account_links}
+<li><a href="/test_cases">Test Cases</a></li><li><a href="/api_list">API Testing</a></li>
+<li><a href="/contact_us">Contact us</a></li>
+</ul></div></div></div></div></div></header>
+{body}
+<footer id="footer"><div class="footer-widget"><div class="container"><div class="single-widget">
+<h2>Subscription</h2>
+<form action="#" method="post" class="searchform">
+<input type="hidden" name="csrfmiddlewaretoken" value="stand-in">
+<input type="email" id="susbscribe_email" required placeholder="Your email address">
+<button type="submit" id="subscribe">Subscribe</button>
+<p>Get the most recent updates from our site and be updated your self...</p>
+</form>
+<div id="success-subscribe"><div class="alert-success alert">You have been successfully subscribed!</div></div>
+</div></div></div>
+<div class="footer-bottom"><div class="container"><p class="pull-left">Copyright © 2021 All rights reserved</p></div></div>
+</footer>
+<a id="scrollUp" href="#top">Top</a>
+<script>{PAGE_SCRIPT}</script>
+</body></html>"""
+
+
+def _render_product_card(product: Dict[str, Any]) -> str:
+    """Render a product card of the product grid."""
+    name, price, product_id = _esc(product["name"]), _esc(product["price"]), product["id"]
+    return f"""<div class="col-sm-4"><div class="product-image-wrapper"><div class="single-products">
+<div class="productinfo text-center"><img src="{PRODUCT_IMAGE}" alt="ecommerce website products">
+<h2>{price}</h2><p>{name}</p>
+<a href="#" data-product-id="{product_id}" class="btn btn-default add-to-cart">Add to cart</a></div>
+<div class="product-overlay"><div class="overlay-content"><h2>{price}</h2><p>{name}</p>
+<a href="#" data-product-id="{product_id}" class="btn btn-default add-to-cart">Add to cart</a></div></div>
+</div><div class="choose"><ul class="nav nav-pills nav-justified">
+<li><a href="/product_details/{product_id}">View Product</a></li></ul></div></div></div>"""
+
+
+CART_MODAL = """<div class="modal fade" id="cartModal"><div class="modal-dialog modal-confirm"><div class="modal-content">
+<div class="modal-header"><h4 class="modal-title w-100">Added!</h4></div>
+<div class="modal-body"><p class="text-center">Your product has been added to cart.</p>
+<p class="text-center"><a href="/view_cart"><u>View Cart</u></a></p></div>
+<div class="modal-footer"><button class="btn btn-success close-modal btn-block">Continue Shopping</button></div>
+</div></div></div>"""
+
+
+def _render_sidebar(store: StandInStore) -> str:
+    """Render the category accordion and brand list."""
+    panels = []
+    for usertype in ("Women", "Men", "Kids"):
+        links = "".join(
+            f'<li><a href="/category_products/{category["id"]}">{_esc(category["category"])}</a></li>'
+            for category in store.categories if category["usertype"] == usertype
+        )
+        panels.append(
+            f'<div class="panel panel-default"><div class="panel-heading"><h4 class="panel-title">'
+            f'<a data-toggle="collapse" data-parent="#accordian" href="#{usertype}">{usertype}</a></h4></div>'
+            f'<div id="{usertype}" class="panel-collapse collapse"><div class="panel-body"><ul>{links}</ul></div></div></div>'
+        )
+    
+    brand_counts: Dict[str, int] = {}
+    for product in store.products:
+        brand_counts[product["brand"]] = brand_counts.get(product["brand"], 0) + 1
+    brands = "".join(
+        f'<li><a href="/brand_products/{quote(brand)}"><span class="pull-right">({count})</span>{_esc(brand)}</a></li>'
+        for brand, count in brand_counts.items()
+    )
+    
+    return f"""<div class="col-sm-3"><div class="left-sidebar"><h2>Category</h2>
+<div class="panel-group category-products" id="accordian">{"".join(panels)}</div>
+<div class="brands_products"><h2>Brands</h2><div class="brands-name"><ul class="nav nav-pills nav-stacked">{brands}</ul></div></div>
+</div></div>"""
+
+
+def _render_product_grid(store: StandInStore, title: str, products: List[Dict[str, Any]],
+                         extra: str = "") -> str:
+    """Render the sidebar plus a product grid."""
+    cards = "".join(_render_product_card(product) for product in products)
+    return f"""<section><div class="container"><div class="row">{_render_sidebar(store)}
+<div class="col-sm-9 padding-right"><div class="features_items"><h2 class="title text-center">{_esc(title)}</h2>{cards}</div>
+{extra}</div></div></div></section>{CART_MODAL}"""
+
+
+def render_home(store: StandInStore) -> str:
+    """Render the home page."""
+    slides = "".join(
+        f"""<div class="item{' active' if index == 0 else ''}"><div class="col-sm-6">
+<h1><span>Automation</span>Exercise</h1><h2>Full-Fledged practice website for Automation Engineers</h2>
+<p>All QA engineers can use this website for automation practice and API testing either they are at beginner or advance level.</p>
+<a href="/test_cases" class="test_cases_list"><button class="btn btn-success">Test Cases</button></a>
+<a href="/api_list" class="apis_list"><button class="btn btn-success">APIs list for practice</button></a></div>
+<div class="col-sm-6"><img src="{PRODUCT_IMAGE}" class="girl img-responsive" alt="demo website for practice"></div></div>"""
+        for index in range(3)
+    )
+    indicators = "".join(
+        f'<li data-target="#slider-carousel" data-slide-to="{index}" class="{"active" if index == 0 else ""}"></li>'
+        for index in range(3)
+    )
+    slider = f"""<section id="slider"><div class="container"><div class="row"><div class="col-sm-12">
+<div id="slider-carousel" class="carousel slide"><ol class="carousel-indicators">{indicators}</ol>
+<div class="carousel-inner">{slides}</div>
+<a href="#slider-carousel" class="left control-carousel hidden-xs" data-slide="prev">&lsaquo;</a>
+<a href="#slider-carousel" class="right control-carousel hidden-xs" data-slide="next">&rsaquo;</a>
+</div></div></div></div></section>"""
+    
+    recommended_groups = [store.products[:3], store.products[3:6]]
+    recommended = "".join(
+        f'<div class="item{" active" if index == 0 else ""}">'
+        f'{"".join(_render_product_card(product) for product in group)}</div>'
+        for index, group in enumerate(recommended_groups)
+    )
+    recommended_section = f"""<div class="recommended_items"><h2 class="title text-center">recommended items</h2>
+<div id="recommended-item-carousel" class="carousel slide"><div class="carousel-inner">{recommended}</div>
+<a class="left recommended-item-control" href="#recommended-item-carousel" data-slide="prev">&lsaquo;</a>
+<a class="right recommended-item-control" href="#recommended-item-carousel" data-slide="next">&rsaquo;</a>
+</div></div>"""
+    
+    return slider + _render_product_grid(store, "Features Items", store.products, recommended_section)
+
+
+def _cart_totals(store: StandInStore, cart: Dict[int, int], product_id: Optional[int] = None) -> Dict[str, str]:
+    """Get the row and cart totals returned to the cart page script."""
+    cart_total = sum(_price_value(store.products_by_id[pid]) * qty for pid, qty in cart.items())
+    totals = {"cart_total": f"Rs. {cart_total}"}
+    if product_id in cart:
+        totals["total"] = f"Rs. {_price_value(store.products_by_id[product_id]) * cart[product_id]}"
+    return totals
+
+
+def render_cart(store: StandInStore, cart: Dict[int, int]) -> str:
+    """Render the cart page."""
+    rows = []
+    for product_id, quantity in cart.items():
+        product = store.products_by_id[product_id]
+        total = _price_value(product) * quantity
+        rows.append(f"""<tr id="product-{product_id}" data-product-id="{product_id}">
+<td class="cart_product"><a href="/product_details/{product_id}"><img src="{PRODUCT_IMAGE}" alt="Product Image"></a></td>
+<td class="cart_description"><h4><a href="/product_details/{product_id}">{_esc(product["name"])}</a></h4>
+<p>{_esc(product["category"]["usertype"]["usertype"])} &gt; {_esc(product["category"]["category"])}</p></td>
+<td class="cart_price"><p>{_esc(product["price"])}</p></td>
+<td class="cart_quantity"><input type="number" min="1" value="{quantity}"></td>
+<td class="cart_total"><p>Rs. {total}</p></td>
+<td class="cart_delete"><a class="cart_quantity_delete" data-product-id="{product_id}" href="#">&times;</a></td></tr>""")
+    
+    empty_style = "none" if cart else "block"
+    cart_total = _cart_totals(store, cart)["cart_total"]
+    return f"""<section id="cart_items"><div class="container">
+<div class="table-responsive cart_info" id="cart_info_table"><table class="table table-condensed">
+<thead><tr class="cart_menu"><th class="image">Item</th><th class="description"></th><th class="price">Price</th>
+<th class="quantity">Quantity</th><th class="total">Total</th><th></th></tr></thead>
+<tbody>{"".join(rows)}</tbody></table></div>
+<div id="empty_cart" style="display: {empty_style}"><p class="text-center">Cart is empty!</p>
+<p>Click <a href="/products">here</a> to buy products.</p></div>
+<div class="cart_summary"><span>Total Amount</span> <span class="cart_total_price">{cart_total}</span></div>
+<a class="btn btn-default check_out">Proceed To Checkout</a>
+</div></section>
+<div class="modal fade" id="checkoutModal"><div class="modal-dialog modal-confirm"><div class="modal-content">
+<div class="modal-header"><h4 class="modal-title w-100">Checkout</h4></div>
+<div class="modal-body"><p class="text-center">Register / Login account to proceed on checkout.</p>
+<p class="text-center"><a href="/login"><u>Register / Login</u></a></p></div>
+<div class="modal-footer"><button class="btn btn-success close-checkout-modal btn-block close-modal">Checkout as Guest</button></div>
+</div></div></div>"""
+
+
+def render_login(login_error: str = "", signup_error: str = "") -> str:
+    """Render the login / signup page."""
+    login_error_html = f'<p style="color: red;">{_esc(login_error)}</p>' if login_error else ""
+    signup_error_html = f'<p style="color: red;">{_esc(signup_error)}</p>' if signup_error else ""
+    return f"""<section id="form"><div class="container"><div class="row">
+<div class="col-sm-4"><div class="login-form"><h2>Login to your account</h2>
+<form action="/login" method="POST"><input type="hidden" name="csrfmiddlewaretoken" value="stand-in">
+<input type="email" data-qa="login-email" placeholder="Email Address" name="email" required>
+<input type="password" data-qa="login-password" placeholder="Password" name="password" required>
+{login_error_html}<button type="submit" class="btn btn-default" data-qa="login-button">Login</button></form></div></div>
+<div class="col-sm-1"><h2 class="or">OR</h2></div>
+<div class="col-sm-4"><div class="signup-form"><h2>New User Signup!</h2>
+<form action="/signup" method="POST"><input type="hidden" name="csrfmiddlewaretoken" value="stand-in">
+<input type="text" data-qa="signup-name" placeholder="Name" name="name" required>
+<input type="email" data-qa="signup-email" placeholder="Email Address" name="email" required>
+<input type="hidden" name="form_type" value="signup">
+{signup_error_html}<button type="submit" class="btn btn-default" data-qa="signup-button">Signup</button></form></div></div>
+</div></div></section>"""
+
+
+def render_message(title: str, message: str, data_qa: str = "") -> str:
+    """Render a page that only shows a heading and a message."""
+    qa = f' data-qa="{data_qa}"' if data_qa else ""
+    return f"""<section><div class="container"><h2 class="title text-center"{qa}><b>{_esc(title)}</b></h2>
+<p>{_esc(message)}</p><a href="/" class="btn btn-primary">Continue</a></div></section>"""
+
+
+class StandInRequestHandler(BaseHTTPRequestHandler):
+    """Routes requests to the API endpoints and HTML pages."""
+    
+    server_version = "AutomationExerciseStandIn/1.0"
+    # Keep-alive, so clients reuse connections like they would against the real site
+    protocol_version = "HTTP/1.1"
+    
+    def log_message(self, format: str, *args: Any) -> None:
+        """Keep the test output quiet."""
+    
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+    
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+    
+    def do_PUT(self) -> None:
+        self._dispatch("PUT")
+    
+    def do_DELETE(self) -> None:
+        self._dispatch("DELETE")
+    
+    def do_PATCH(self) -> None:
+        self._dispatch("PATCH")
+    
+    @property
+    def store(self) -> StandInStore:
+        return self.server.store  # type: ignore[attr-defined]
+    
+    def _read_fields(self, query: str) -> Dict[str, List[str]]:
+        """Merge query string and urlencoded body fields."""
+        fields = parse_qs(query, keep_blank_values=True)
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            body = self.rfile.read(length).decode("utf-8", errors="replace")
+            for name, values in parse_qs(body, keep_blank_values=True).items():
+                fields.setdefault(name, []).extend(values)
+        return fields
+    
+    def _send(self, status: int, body: str, content_type: str,
+              headers: Optional[Dict[str, str]] = None) -> None:
+        """Write a complete response."""
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+    
+    def _dispatch(self, method: str) -> None:
+        """Handle a request."""
+        parsed = urlparse(self.path)
+        fields = self._read_fields(parsed.query)
+        
+        if parsed.path.startswith("/api/"):
+            endpoint = API_ENDPOINTS.get(parsed.path[len("/api/"):])
+            if endpoint is None:
+                self._send(404, json.dumps({"responseCode": 404, "message": "API not found."}), "application/json")
+                return
+            # Like the real site: HTTP 200, with the outcome in responseCode
+            body = json.dumps(endpoint(self.store, method, fields))
+            if method != "GET":
+                self._send(200, body, "application/json")
+                return
+            # GETs carry an ETag, so clients can revalidate cached responses
+            etag = f'"{hashlib.sha1(body.encode("utf-8")).hexdigest()}"'
+            if self.headers.get("If-None-Match") == etag:
+                self._send(304, "", "application/json", {"ETag": etag})
+            else:
+                self._send(200, body, "application/json", {"ETag": etag})
+            return
+        
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        token = cookie[SESSION_COOKIE].value if SESSION_COOKIE in cookie else None
+        new_token, session = self.store.session(token)
+        headers = {} if new_token == token else {"Set-Cookie": f"{SESSION_COOKIE}={new_token}; Path=/"}
+        
+        status, body, content_type, extra_headers = self._handle_page(method, parsed.path, fields, session)
+        headers.update(extra_headers)
+        self._send(status, body, content_type, headers)
+    
+    def _handle_page(self, method: str, path: str, fields: Dict[str, List[str]],
+                     session: Dict[str, Any]) -> Tuple[int, str, str, Dict[str, str]]:
+        """Build the response for a browser route."""
+        store = self.store
+        with store.lock:
+            user = store.users.get(session["user"]) if session["user"] else None
+            cart: Dict[int, int] = session["cart"]
+            
+            def page(title: str, body: str, status: int = 200) -> Tuple[int, str, str, Dict[str, str]]:
+                return status, _render_layout(title, body, user), "text/html; charset=utf-8", {}
+            
+            def redirect(location: str) -> Tuple[int, str, str, Dict[str, str]]:
+                return 302, "", "text/html; charset=utf-8", {"Location": location}
+            
+            def totals(product_id: Optional[int] = None) -> Tuple[int, str, str, Dict[str, str]]:
+                return 200, json.dumps(_cart_totals(store, cart, product_id)), "application/json", {}
+            
+            match = re.fullmatch(r"/(add_to_cart|delete_cart|update_cart|product_details|category_products)/(\d+)", path)
+            if match:
+                action, item_id = match.group(1), int(match.group(2))
+                if action == "category_products":
+                    category = next((c for c in store.categories if c["id"] == item_id), None)
+                    if category is None:
+                        return page("Not Found", render_message("Not Found", "Category not found."), 404)
+                    products = [p for p in store.products
+                                if p["category"]["category"] == category["category"]
+                                and p["category"]["usertype"]["usertype"] == category["usertype"]]
+                    title = f'{category["usertype"]} - {category["category"]} Products'
+                    return page(title, _render_product_grid(store, title, products))
+                if item_id not in store.products_by_id:
+                    return page("Not Found", render_message("Not Found", "Product not found."), 404)
+                if action == "add_to_cart":
+                    cart[item_id] = cart.get(item_id, 0) + 1
+                    return totals(item_id)
+                if action == "delete_cart":
+                    cart.pop(item_id, None)
+                    return totals()
+                if action == "update_cart":
+                    quantity = _field(fields, "quantity") or "1"
+                    cart[item_id] = max(int(quantity) if quantity.isdigit() else 1, 1)
+                    return totals(item_id)
+                product = store.products_by_id[item_id]
+                return page("Product Details", _render_product_grid(store, product["name"], [product]))
+            
+            if path.startswith("/brand_products/"):
+                brand = unquote(path[len("/brand_products/"):])
+                products = [p for p in store.products if p["brand"] == brand]
+                return page("Brand Products", _render_product_grid(store, f"Brand - {brand} Products", products))
+            
+            if path == "/":
+                return page("Home", render_home(store))
+            if path == "/products":
+                term = _field(fields, "search")
+                if term:
+                    return page("Products", _render_product_grid(store, "Searched Products", store.search(term)))
+                search = ('<section id="advertisement"><form action="/products" method="GET">'
+                          '<input type="text" id="search_product" name="search" placeholder="Search Product">'
+                          '<button type="submit" id="submit_search" class="btn btn-default">Search</button>'
+                          '</form></section>')
+                return page("All Products", search + _render_product_grid(store, "All Products", store.products))
+            if path == "/view_cart":
+                return page("Checkout", render_cart(store, cart))
+            if path == "/login":
+                if method == "POST":
+                    email, password = _field(fields, "email"), _field(fields, "password")
+                    account = store.users.get(email or "")
+                    if account is None or account.get("password") != password:
+                        return page("Signup / Login", render_login(login_error="Your email or password is incorrect!"))
+                    session["user"] = email
+                    return redirect("/")
+                return page("Signup / Login", render_login())
+            if path == "/signup" and method == "POST":
+                email = _field(fields, "email") or ""
+                if email in store.users:
+                    return page("Signup / Login", render_login(signup_error="Email Address already exist!"))
+                return page("Signup", render_message("Enter Account Information", f"Signing up {email}"))
+            if path == "/logout":
+                session["user"] = None
+                return redirect("/login")
+            if path == "/delete_account":
+                if session["user"]:
+                    store.users.pop(session["user"], None)
+                    session["user"] = None
+                    user = None
+                return page("Account Deleted", render_message("Account Deleted!", "Your account has been deleted.",
+                                                              data_qa="account-deleted"))
+            if path in ("/test_cases", "/api_list", "/contact_us"):
+                title = path.strip("/").replace("_", " ").title()
+                return page(title, render_message(title, "This page is not part of the stand-in server."))
+            
+            return page("Not Found", render_message("Not Found", f"No stand-in page for {path}"), 404)
+
+
+class StandInServer:
+    """Runs the stand-in site on a background thread.
+    
+    Usage:
+        with StandInServer() as server:
+            os.environ["API_BASE_URL"] = server.api_base_url
+    """
+    
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, catalog_path: str = CATALOG_PATH):
+        """
+        Initialize the server.
+        
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free one)
+            catalog_path: JSON file with categories, products and seed users
+        """
+        self.host = host
+        self.port = port
+        self.catalog_path = catalog_path
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def base_url(self) -> str:
+        """URL of the site, for BASE_URL."""
+        return f"http://{self.host}:{self.port}"
+    
+    @property
+    def api_base_url(self) -> str:
+        """URL of the API, for API_BASE_URL."""
+        return f"{self.base_url}/api"
+    
+    @property
+    def store(self) -> StandInStore:
+        """Data served by the running server."""
+        if self._httpd is None:
+            raise RuntimeError("Stand-in server is not running")
+        return self._httpd.store  # type: ignore[attr-defined]
+    
+    def start(self) -> "StandInServer":
+        """Bind the port and start serving in a daemon thread."""
+        httpd = ThreadingHTTPServer((self.host, self.port), StandInRequestHandler)
+        httpd.daemon_threads = True
+        httpd.store = StandInStore(self.catalog_path)  # type: ignore[attr-defined]
+        self._httpd = httpd
+        self.port = httpd.server_address[1]
+        self._thread = threading.Thread(target=httpd.serve_forever, name="stand-in-server", daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        if self._httpd is None:
+            return
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
+        self._httpd = None
+        self._thread = None
+    
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+def main() -> None:
+    """Serve the stand-in site until interrupted."""
+    parser = argparse.ArgumentParser(description="Local stand-in for AutomationExercise.com")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+    
+    server = StandInServer(args.host, args.port).start()
+    print(f"Serving {server.base_url} (API at {server.api_base_url}); Ctrl+C to stop")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
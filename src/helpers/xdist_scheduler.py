@@ -0,0 +1,160 @@
+"""
+Duration-aware pytest-xdist scheduler for AutomationExercise testing framework.
+"""
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+from xdist.scheduler import LoadScheduling
+from src.helpers.duration_sharding import DurationStore, plan_shards
+
+# Tests kept queued on each worker, so it always knows its next test
+WORKER_PREFETCH = 2
+
+
+class DurationScheduling(LoadScheduling):
+    """LoadScheduling with a duration-based plan instead of collection order.
+    
+    Once collection is complete, tests are split into one queue per worker
+    by plan_shards(): UI and API tests on separate workers, each suite
+    LPT-packed by the durations of previous runs. Workers are fed from their
+    own queue, longest test first; a worker whose queue runs dry steals the
+    shortest queued tests of the busiest worker, preferring its own suite,
+    so wrong estimates are corrected while the run progresses.
+    """
+    
+    def __init__(self, config: Any, log: Any = None, durations: Optional[DurationStore] = None):
+        """
+        Initialize the scheduler.
+        
+        Args:
+            config: pytest config
+            log: xdist log producer
+            durations: Durations of previous runs (defaults to the ones in config.cache)
+        """
+        super().__init__(config, log)
+        self.durations = durations or DurationStore(getattr(config, "cache", None))
+        self.node2queue: Dict[Any, Deque[int]] = {}
+        self.node2kind: Dict[Any, str] = {}
+    
+    @property
+    def tests_finished(self) -> bool:
+        """Whether every test has been run."""
+        if not self.collection_is_completed or any(self.node2queue.values()):
+            return False
+        return all(len(pending) < 2 for pending in self.node2pending.values())
+    
+    @property
+    def has_pending(self) -> bool:
+        """Whether tests are queued or running."""
+        return any(self.node2queue.values()) or any(self.node2pending.values())
+    
+    def schedule(self) -> None:
+        """Plan the shards and start every worker on its own queue."""
+        assert self.collection_is_completed
+        
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+        
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+        
+        self.collection = next(iter(self.node2collection.values()))
+        plan = plan_shards(self.collection, len(self.nodes), self.durations.estimate)
+        for node, (kind, indices) in zip(self.nodes, plan):
+            self.node2queue[node] = deque(indices)
+            self.node2kind[node] = kind
+            self.log(f"{kind} shard of {len(indices)} tests, "
+                     f"{sum(self.durations.estimate(self.collection[i]) for i in indices):.1f}s expected")
+        
+        for node in self.nodes:
+            self.check_schedule(node)
+    
+    def check_schedule(self, node: Any, duration: float = 0) -> None:
+        """
+        Top up a worker from its queue, stealing work when the queue is empty.
+        
+        Args:
+            node: Worker
+            duration: Duration of the test the worker just finished (unused)
+        """
+        if node.shutting_down or self.collection is None:
+            return
+        
+        queue = self.node2queue.setdefault(node, deque())
+        if not queue:
+            self._steal(node)
+        if not queue:
+            node.shutdown()
+            return
+        
+        missing = WORKER_PREFETCH - len(self.node2pending[node])
+        if missing > 0:
+            batch = [queue.popleft() for _ in range(min(missing, len(queue)))]
+            self.node2pending[node].extend(batch)
+            node.send_runtest_some(batch)
+    
+    def _active_nodes(self) -> list:
+        """Workers that still accept tests."""
+        return [node for node in self.node2queue if not node.shutting_down]
+    
+    def _queued_seconds(self, node: Any) -> float:
+        """Expected duration of a worker's queued tests."""
+        return sum(self.durations.estimate(self.collection[index]) for index in self.node2queue[node])
+    
+    def _steal(self, thief: Any) -> None:
+        """Move the shortest half of the busiest queue to an idle worker."""
+        kind = self.node2kind.get(thief)
+        candidates = [node for node, queue in self.node2queue.items() if node is not thief and queue]
+        same_kind = [node for node in candidates if self.node2kind.get(node) == kind]
+        victims = same_kind or candidates
+        if not victims:
+            return
+        
+        victim = max(victims, key=self._queued_seconds)
+        queue = self.node2queue[victim]
+        # Queues are longest first, so the tail holds the shortest tests
+        stolen = [queue.pop() for _ in range((len(queue) + 1) // 2)]
+        self.node2queue[thief].extend(reversed(stolen))
+    
+    def mark_test_pending(self, item: str) -> None:
+        """
+        Queue a test again (e.g. for a rerun).
+        
+        Args:
+            item: Test node id
+        """
+        assert self.collection is not None
+        target = min(self._active_nodes(), key=self._queued_seconds)
+        self.node2queue[target].appendleft(self.collection.index(item))
+        for node in self.node2pending:
+            self.check_schedule(node)
+    
+    def remove_node(self, node: Any) -> Optional[str]:
+        """
+        Remove a worker, handing its queued and unfinished tests to the others.
+        
+        Args:
+            node: Worker
+        
+        Returns:
+            Node id of the test it was running when it crashed, or None
+        """
+        pending = self.node2pending.pop(node)
+        queue = self.node2queue.pop(node, deque())
+        self.node2kind.pop(node, None)
+        
+        crashitem = None
+        if pending:
+            assert self.collection is not None
+            crashitem = self.collection[pending.pop(0)]
+        leftover = list(pending) + list(queue)
+        active = self._active_nodes()
+        if leftover and active:
+            target = min(active, key=self._queued_seconds)
+            self.node2queue[target].extend(leftover)
+        
+        for other in self.node2pending:
+            self.check_schedule(other)
+        return crashitem
@@ -0,0 +1,43 @@
+"""
+Cart data models for AutomationExercise testing framework.
+"""
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel
+
+
+class CartItem(BaseModel):
+    """Row of the cart table."""
+    index: int
+    product_id: Optional[int] = None
+    name: str
+    price: str
+    quantity: str
+    total: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the item in the dictionary format CartPage has always returned."""
+        return self.model_dump()
+
+
+class CartSnapshot(BaseModel):
+    """Contents of the cart page, read in a single browser call."""
+    items: List[CartItem]
+    is_empty: bool
+    
+    @property
+    def names(self) -> List[str]:
+        """Item names in table order."""
+        return [item.name for item in self.items]
+    
+    def find(self, name: str) -> Optional[CartItem]:
+        """
+        Get the first item whose name contains a text (case-insensitive).
+        
+        Args:
+            name: Text to look for
+        
+        Returns:
+            Matching item or None
+        """
+        name = name.lower()
+        return next((item for item in self.items if name in item.name.lower()), None)
@@ -0,0 +1,109 @@
+"""
+Lazily validated model lists for AutomationExercise testing framework.
+"""
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Type, TypeVar, get_args
+from pydantic import BaseModel, GetCoreSchemaHandler, TypeAdapter, ValidationInfo
+from pydantic_core import core_schema
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Validation context key: validate every item up front (e.g. model_validate_json(body, context={STRICT_ITEMS: True}))
+STRICT_ITEMS = "strict_items"
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(item_type: Type[BaseModel]) -> TypeAdapter:
+    """TypeAdapter validating a whole list of item_type (built once per type)."""
+    return TypeAdapter(List[item_type])
+
+
+class LazyModelList(Sequence[ModelT]):
+    """List field whose items are validated only when they are accessed.
+    
+    Used as a field type (products: LazyModelList[Product]), it keeps the
+    decoded JSON objects and validates an item into its model the first time
+    it is indexed or iterated over, caching the result. len() and values()
+    never validate, so tests that count items or compare ids skip pydantic
+    entirely. With the STRICT_ITEMS validation context, every item is
+    validated while the response is parsed, as a plain List[Model] would be.
+    """
+    
+    def __init__(self, item_type: Type[ModelT], raw: List[Dict[str, Any]]):
+        """
+        Initialize the list.
+        
+        Args:
+            item_type: Pydantic model of the items
+            raw: Decoded JSON objects
+        """
+        self.item_type = item_type
+        self.raw = raw
+        self._items: List[Optional[ModelT]] = [None] * len(raw)
+    
+    def __len__(self) -> int:
+        return len(self.raw)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self.raw)))]
+        item = self._items[index]
+        if item is None:
+            item = self.item_type.model_validate(self.raw[index])
+            self._items[index] = item
+        return item
+    
+    def __iter__(self) -> Iterator[ModelT]:
+        for index in range(len(self.raw)):
+            yield self[index]
+    
+    def __repr__(self) -> str:
+        return (f"LazyModelList[{self.item_type.__name__}]({len(self.raw)} items, "
+                f"{self.validated_count} validated)")
+    
+    @property
+    def validated_count(self) -> int:
+        """Items validated so far."""
+        return sum(item is not None for item in self._items)
+    
+    def values(self, field: str) -> List[Any]:
+        """
+        Get one raw field of every item, without validating anything.
+        
+        Args:
+            field: JSON key (e.g. "id")
+        
+        Returns:
+            Field values in item order (None where the key is missing)
+        """
+        return [item.get(field) for item in self.raw]
+    
+    def validate_all(self) -> List[ModelT]:
+        """
+        Validate every item at once.
+        
+        Returns:
+            Validated items
+        
+        Raises:
+            pydantic.ValidationError: Listing every invalid item by index
+        """
+        self._items = list(_list_adapter(self.item_type).validate_python(self.raw))
+        return list(self._items)
+    
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        """Accept a list of JSON objects; validate the items now only in strict mode."""
+        item_type = get_args(source)[0]
+        
+        def build(raw: List[Dict[str, Any]], info: ValidationInfo) -> "LazyModelList":
+            items = cls(item_type, raw)
+            if info.context and info.context.get(STRICT_ITEMS):
+                items.validate_all()
+            return items
+        
+        return core_schema.with_info_after_validator_function(
+            build,
+            core_schema.list_schema(core_schema.dict_schema()),
+            serialization=core_schema.plain_serializer_function_ser_schema(lambda items: items.raw)
+        )
@@ -0,0 +1,35 @@
+"""
+Browser page metrics models for AutomationExercise testing framework.
+"""
+from typing import Optional
+from pydantic import BaseModel
+
+
+class PageMetrics(BaseModel):
+    """Navigation Timing, resource timing and Web Vitals of one page load.
+    
+    Times are milliseconds from the start of the navigation, as measured by
+    the browser. Values the browser has not produced yet (e.g. the load event
+    while the page is still loading) are None.
+    """
+    url: str
+    navigation_id: float
+    ttfb_ms: Optional[float] = None
+    response_end_ms: Optional[float] = None
+    dom_interactive_ms: Optional[float] = None
+    dom_content_loaded_ms: Optional[float] = None
+    load_event_ms: Optional[float] = None
+    fcp_ms: Optional[float] = None
+    lcp_ms: Optional[float] = None
+    cls: Optional[float] = None
+    tbt_ms: Optional[float] = None
+    long_tasks: Optional[int] = None
+    document_transfer_size: int = 0
+    resource_count: int = 0
+    resource_transfer_size: int = 0
+    slowest_resource_ms: float = 0.0
+    
+    @property
+    def page_load_ms(self) -> Optional[float]:
+        """Load event end, or DOMContentLoaded end when the load event has not fired yet."""
+        return self.load_event_ms if self.load_event_ms is not None else self.dom_content_loaded_ms
@@ -2,22 +2,45 @@
 Base Page Object Model for AutomationExercise testing framework.
 """
 import os
-from typing import Optional
+from typing import Callable, Optional, Union
 from playwright.sync_api import Page, Locator, expect
+from src.helpers.sleep_budget import SLEEP_BUDGET
+from src.helpers.page_metrics import PAGE_METRICS, PAGE_METRICS_SCRIPT
+from src.models.page_metrics import PageMetrics
+
+# Load strategies understood by BasePage.wait_until_ready()
+LOAD_STRATEGY_NETWORKIDLE = 'networkidle'
+LOAD_STRATEGY_READY = 'ready'  # domcontentloaded + the page's ready locator
+LOAD_STRATEGY_DOMCONTENTLOADED = 'domcontentloaded'
+LOAD_STRATEGY_LOAD = 'load'
+
+LoadStrategy = Union[str, Callable[['BasePage'], None]]
 
 
 class BasePage:
     """Base page class with common functionality."""
     
-    def __init__(self, page: Page):
+    # Per-page-class override; falls back to the PAGE_LOAD_STRATEGY env var
+    load_strategy: Optional[LoadStrategy] = None
+    
+    def __init__(self, page: Page, load_strategy: Optional[LoadStrategy] = None):
         """
         Initialize the base page.
         
         Args:
             page: Playwright page object
+            load_strategy: Readiness strategy name, or a callable that receives the page
+                object and returns once it is usable (optional)
         """
         self.page = page
         self.base_url = os.getenv('BASE_URL', 'https://automationexercise.com')
+        self.load_strategy = (
+            load_strategy
+            or type(self).load_strategy
+            or os.getenv('PAGE_LOAD_STRATEGY', LOAD_STRATEGY_READY)
+        )
+        # The web-vitals observers are installed once per context by the context fixtures
+        self.collect_metrics = os.getenv('COLLECT_PAGE_METRICS', 'true').lower() == 'true'
     
     def navigate(self, url: str = "") -> None:
         """
@@ -33,10 +56,90 @@ class BasePage:
         
         self.page.goto(full_url)
         self.wait_for_page_load()
+        self._record_page_metrics()
     
     def wait_for_page_load(self) -> None:
         """Wait for page to load completely."""
-        self.page.wait_for_load_state('networkidle')
+        self.wait_until_ready()
+    
+    def get_ready_locator(self) -> Optional[Locator]:
+        """
+        Get the locator that is visible once the page is usable.
+        
+        Pages override this; the 'ready' strategy waits for it after DOMContentLoaded.
+        
+        Returns:
+            Ready locator or None
+        """
+        return None
+    
+    def wait_until_ready(self, ready_locator: Optional[Locator] = None, timeout: Optional[int] = None) -> None:
+        """
+        Wait until the page is usable according to the load strategy.
+        
+        Args:
+            ready_locator: Locator to wait for instead of the page's own (optional)
+            timeout: Timeout in milliseconds (optional)
+        """
+        strategy = self.load_strategy
+        
+        if callable(strategy):
+            strategy(self)
+        elif strategy == LOAD_STRATEGY_NETWORKIDLE:
+            self.page.wait_for_load_state('networkidle', timeout=timeout)
+        elif strategy in (LOAD_STRATEGY_DOMCONTENTLOADED, LOAD_STRATEGY_LOAD):
+            self.page.wait_for_load_state(strategy, timeout=timeout)
+        elif strategy == LOAD_STRATEGY_READY:
+            self.page.wait_for_load_state('domcontentloaded', timeout=timeout)
+            locator = ready_locator or self.get_ready_locator()
+            if locator is not None:
+                locator.wait_for(state='visible', timeout=timeout)
+        else:
+            raise ValueError(f"Unknown page load strategy: {strategy}")
+    
+    def navigate_by(self, action: Callable[[], None], ready_locator: Optional[Locator] = None) -> None:
+        """
+        Run an action that navigates and wait until the new page is ready.
+        
+        Waiting for the navigation to commit first keeps the readiness check
+        from matching the page that is being left.
+        
+        Args:
+            action: Callable that triggers the navigation (e.g. a locator's click)
+            ready_locator: Locator to wait for instead of the page's own (optional)
+        """
+        with self.page.expect_navigation(wait_until='commit'):
+            action()
+        self.wait_until_ready(ready_locator)
+        self._record_page_metrics()
+    
+    def collect_page_metrics(self, wait_for_load: bool = False, record: bool = True) -> PageMetrics:
+        """
+        Read the browser's timing and Web Vitals for the current document.
+        
+        Args:
+            wait_for_load: Wait for the load event first, so load timings are complete
+            record: Add the reading to the run's per-URL page metrics
+            
+        Returns:
+            Page metrics
+        """
+        if wait_for_load:
+            self.page.wait_for_load_state('load')
+        metrics = PageMetrics(**self.page.evaluate(PAGE_METRICS_SCRIPT))
+        if record:
+            PAGE_METRICS.record(metrics.model_dump())
+        return metrics
+    
+    def _record_page_metrics(self) -> None:
+        """Record the metrics of a navigation that just became ready (best effort)."""
+        if not self.collect_metrics:
+            return
+        try:
+            self.collect_page_metrics()
+        except Exception:
+            # The page may already be navigating again; metrics must never fail a test
+            pass
     
     def get_title(self) -> str:
         """
@@ -80,12 +183,96 @@ class BasePage:
     def scroll_to_bottom(self) -> None:
         """Scroll to the bottom of the page."""
         self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        self.page.wait_for_timeout(1000)
+        self.wait_for_scroll_settled('bottom')
     
     def scroll_to_top(self) -> None:
         """Scroll to the top of the page."""
         self.page.evaluate("window.scrollTo(0, 0)")
-        self.page.wait_for_timeout(1000)
+        self.wait_for_scroll_settled('top')
+    
+    def wait_for_scroll_settled(self, edge: str, timeout: int = 5000) -> bool:
+        """
+        Wait until the page has reached an edge and stopped scrolling.
+        
+        Args:
+            edge: 'top' or 'bottom'
+            timeout: Timeout in milliseconds
+            
+        Returns:
+            True if the edge was reached before the timeout, False otherwise
+        """
+        return self.page.evaluate("""([edge, timeout]) => new Promise(resolve => {
+            const deadline = performance.now() + timeout;
+            const atEdge = () => edge === 'top'
+                ? window.scrollY <= 0
+                : Math.ceil(window.scrollY + window.innerHeight) >= document.documentElement.scrollHeight - 1;
+            let lastY = -1;
+            const tick = () => {
+                const stable = window.scrollY === lastY;
+                lastY = window.scrollY;
+                if ((stable && atEdge()) || performance.now() > deadline) {
+                    resolve(atEdge());
+                    return;
+                }
+                requestAnimationFrame(tick);
+            };
+            requestAnimationFrame(tick);
+        })""", [edge, timeout])
+    
+    def wait_for_dom_event(self, selector: str, event: str, action: Callable[[], None], timeout: int = 5000) -> bool:
+        """
+        Run an action and wait for the DOM event it triggers.
+        
+        The listener is attached before the action runs, so a fast event is not
+        missed. Bootstrap events (e.g. 'slid.bs.carousel', 'shown.bs.collapse')
+        are fired through jQuery, so jQuery is used when the page has it.
+        
+        Args:
+            selector: CSS selector of the element that fires the event
+            event: Event name
+            action: Callable that triggers the event
+            timeout: Timeout in milliseconds
+            
+        Returns:
+            True if the event fired before the timeout, False otherwise
+        """
+        key = f"{selector}|{event}"
+        self.page.evaluate("""([key, selector, event, timeout]) => {
+            window.__pendingDomEvents = window.__pendingDomEvents || {};
+            window.__pendingDomEvents[key] = new Promise(resolve => {
+                const target = document.querySelector(selector);
+                if (!target) {
+                    resolve(false);
+                    return;
+                }
+                const timer = setTimeout(() => resolve(false), timeout);
+                const done = () => {
+                    clearTimeout(timer);
+                    resolve(true);
+                };
+                if (window.jQuery) {
+                    window.jQuery(target).one(event, done);
+                } else {
+                    target.addEventListener(event, done, { once: true });
+                }
+            });
+        }""", [key, selector, event, timeout])
+        action()
+        return self.page.evaluate("key => window.__pendingDomEvents[key]", key)
+    
+    def sleep(self, milliseconds: int, reason: str = "") -> None:
+        """
+        Wait for a fixed amount of time.
+        
+        Prefer a condition-based wait; every call is recorded in the sleep
+        budget and reported at the end of the run.
+        
+        Args:
+            milliseconds: Time to wait in milliseconds
+            reason: Why a fixed sleep is needed here
+        """
+        SLEEP_BUDGET.record(f"{type(self).__name__}: {reason or 'unspecified'}", milliseconds)
+        self.page.wait_for_timeout(milliseconds)
     
     def wait_for_element(self, locator: Locator, timeout: int = 30000) -> None:
         """
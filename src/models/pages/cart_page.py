@@ -1,10 +1,37 @@
 """
 Cart Page Object Model for AutomationExercise testing framework.
 """
-from typing import List, Dict, Any
-from playwright.sync_api import Page, Locator, expect
+from typing import List, Dict, Any, Optional
+from playwright.sync_api import Frame, Page, Locator, expect
+from src.helpers.cart_seeding import CartSeeder
+from src.helpers.money import parse_many, parse_minor, to_major
+from src.models.cart import CartSnapshot
 from .base_page import BasePage
 
+# Reads every cart row and the empty-cart state in one browser round trip
+CART_SNAPSHOT_SCRIPT = """
+() => {
+    const text = (row, selector) => ((row.querySelector(selector) || {}).textContent || '').trim();
+    const rows = Array.from(document.querySelectorAll('#cart_info_table tbody tr'));
+    const items = rows.map((row, index) => {
+        const input = row.querySelector('td.cart_quantity input');
+        const productId = (row.id || '').match(/product-(\\d+)/);
+        return {
+            index: index,
+            product_id: productId ? Number(productId[1]) : null,
+            name: text(row, 'td.cart_description h4 a'),
+            price: text(row, 'td.cart_price p'),
+            quantity: input ? input.value || '1' : (text(row, 'td.cart_quantity') || '1'),
+            total: text(row, 'td.cart_total p')
+        };
+    });
+    const emptyVisible = Array.from(document.querySelectorAll('p')).some(
+        p => p.textContent.includes('Cart is empty!') && p.offsetParent !== null
+    );
+    return {items: items, is_empty: emptyVisible};
+}
+"""
+
 
 class CartPage(BasePage):
     """Cart page object model."""
@@ -18,6 +45,9 @@ class CartPage(BasePage):
         """
         super().__init__(page)
         
+        # Transport seed_cart sends its requests through (None: the context's own request object)
+        self.seed_transport: Any = None
+        
         # Page Header Elements
         self.page_header = page.locator('#header')
         self.navigation_menu = page.locator('.shop-menu.pull-right')
@@ -55,9 +85,38 @@ class CartPage(BasePage):
         self.checkout_modal_footer = page.locator('#checkoutModal .modal-footer')
         self.register_login_button = page.locator('#checkoutModal a:has-text("Register / Login")')
         self.checkout_as_guest_button = page.locator('#checkoutModal button:has-text("Checkout as Guest")')
+        self.logged_in_as = page.locator('a:has-text("Logged in as")')
+        self.checkout_address = page.locator('#address_delivery')
         
         # Page Footer
         self.page_footer = page.locator('#footer')
+        
+        # Cart contents read by get_cart_snapshot(); dropped by mutating actions and page loads
+        self._snapshot: Optional[CartSnapshot] = None
+        page.on('framenavigated', self._on_frame_navigated)
+    
+    def _on_frame_navigated(self, frame: Frame) -> None:
+        """Drop the cart snapshot when the page loads new content."""
+        if frame == self.page.main_frame:
+            self.invalidate_snapshot()
+    
+    def invalidate_snapshot(self) -> None:
+        """Force the next get_cart_snapshot() to read the table again."""
+        self._snapshot = None
+    
+    def get_cart_snapshot(self) -> CartSnapshot:
+        """
+        Get the cart contents, read with a single script evaluation.
+        
+        The snapshot is reused until the cart is changed through this page
+        object (update_item_quantity, remove_item) or the page navigates.
+        
+        Returns:
+            Cart snapshot
+        """
+        if self._snapshot is None:
+            self._snapshot = CartSnapshot(**self.page.evaluate(CART_SNAPSHOT_SCRIPT))
+        return self._snapshot
     
     def navigate_to_cart(self) -> None:
         """Navigate to the cart page."""
@@ -66,25 +125,21 @@ class CartPage(BasePage):
     
     def wait_for_page_load(self) -> None:
         """Wait for cart page to load."""
-        self.page.wait_for_load_state('networkidle')
+        self.wait_until_ready()
         # Wait for either cart items or empty cart message
-        try:
-            self.cart_items.first().wait_for(state='visible', timeout=5000)
-        except Exception:
-            # If no items, wait for empty cart message
-            self.empty_cart_message.wait_for(state='visible', timeout=5000)
+        self.get_ready_locator().wait_for(state='visible', timeout=5000)
+    
+    def get_ready_locator(self) -> Locator:
+        """Get the locator that is visible once the cart is rendered."""
+        return self.cart_items.first.or_(self.empty_cart_message)
     
     # Cart Item Methods
     def get_cart_items_count(self) -> int:
         """Get the number of items in cart."""
-        try:
-            if self.empty_cart_message.is_visible():
-                return 0
-            return self.cart_items.count()
-        except Exception:
-            return 0
+        snapshot = self.get_cart_snapshot()
+        return 0 if snapshot.is_empty else len(snapshot.items)
     
-    def get_cart_item_by_index(self, index: int) -> Dict[str, str]:
+    def get_cart_item_by_index(self, index: int) -> Dict[str, Any]:
         """
         Get cart item information by index.
         
@@ -94,26 +149,11 @@ class CartPage(BasePage):
         Returns:
             Dictionary with item information
         """
-        item = self.cart_items.nth(index)
-        
-        return {
-            'name': item.locator('td.cart_description h4 a').text_content() or '',
-            'price': item.locator('td.cart_price p').text_content() or '',
-            'quantity': item.locator('td.cart_quantity input').input_value() or '1',
-            'total': item.locator('td.cart_total p').text_content() or '',
-            'index': index
-        }
+        return self.get_cart_snapshot().items[index].to_dict()
     
-    def get_all_cart_items(self) -> List[Dict[str, str]]:
+    def get_all_cart_items(self) -> List[Dict[str, Any]]:
         """Get all cart items information."""
-        items = []
-        count = self.get_cart_items_count()
-        
-        for i in range(count):
-            item_info = self.get_cart_item_by_index(i)
-            items.append(item_info)
-        
-        return items
+        return [item.to_dict() for item in self.get_cart_snapshot().items]
     
     def update_item_quantity(self, index: int, quantity: int) -> None:
         """
@@ -124,11 +164,17 @@ class CartPage(BasePage):
             quantity: New quantity
         """
         quantity_input = self.item_quantities.nth(index)
+        item_total = self.item_totals.nth(index)
+        old_quantity = quantity_input.input_value()
+        old_total = item_total.text_content() or ''
         quantity_input.clear()
         quantity_input.fill(str(quantity))
         # Trigger change event
         quantity_input.press('Tab')
-        self.page.wait_for_load_state('networkidle')
+        self.invalidate_snapshot()
+        if quantity > 0 and str(quantity) != old_quantity:
+            # The row total is recalculated in place by an AJAX callback
+            expect(item_total).not_to_have_text(old_total)
     
     def remove_item(self, index: int) -> None:
         """
@@ -138,8 +184,11 @@ class CartPage(BasePage):
             index: Item index
         """
         remove_button = self.remove_buttons.nth(index)
+        count_before = self.cart_items.count()
         remove_button.click()
-        self.page.wait_for_load_state('networkidle')
+        self.invalidate_snapshot()
+        # The row is removed by an AJAX callback, so wait for it to disappear
+        expect(self.cart_items).to_have_count(max(count_before - 1, 0))
     
     def remove_all_items(self) -> None:
         """Remove all items from cart."""
@@ -158,26 +207,31 @@ class CartPage(BasePage):
             Item total price as float
         """
         total_text = self.item_totals.nth(index).text_content() or '0'
-        # Extract number from text like "Rs. 500"
+        # Text like "Rs. 500"
         try:
-            return float(''.join(filter(str.isdigit, total_text)))
-        except (ValueError, TypeError):
+            return to_major(parse_minor(total_text))
+        except ValueError:
             return 0.0
     
+    def get_cart_total_minor(self) -> int:
+        """Get cart total price in minor units (0 if it cannot be read)."""
+        try:
+            return parse_minor(self.total_price.text_content() or '0')
+        except ValueError:
+            return 0
+    
     def get_cart_total_price(self) -> float:
         """Get cart total price."""
-        try:
-            total_text = self.total_price.text_content() or '0'
-            # Extract number from text like "Rs. 500"
-            return float(''.join(filter(str.isdigit, total_text)))
-        except (ValueError, TypeError):
-            return 0.0
+        return to_major(self.get_cart_total_minor())
     
     # Checkout Methods
     def proceed_to_checkout(self) -> None:
-        """Proceed to checkout."""
+        """Proceed to checkout (a guest gets the checkout modal, a logged-in user the checkout page)."""
+        if self.logged_in_as.count() > 0:
+            self.navigate_by(self.proceed_to_checkout_button.click, ready_locator=self.checkout_address)
+            return
         self.proceed_to_checkout_button.click()
-        self.page.wait_for_load_state('networkidle')
+        expect(self.checkout_modal).to_be_visible()
     
     def verify_checkout_modal_visible(self) -> None:
         """Verify checkout modal is visible."""
@@ -193,8 +247,7 @@ class CartPage(BasePage):
     
     def checkout_as_guest(self) -> None:
         """Click checkout as guest button."""
-        self.checkout_as_guest_button.click()
-        self.page.wait_for_load_state('networkidle')
+        self.navigate_by(self.checkout_as_guest_button.click)
     
     def close_checkout_modal(self) -> None:
         """Close checkout modal."""
@@ -298,30 +351,30 @@ class CartPage(BasePage):
             'can_checkout': self.can_proceed_to_checkout()
         }
     
-    def calculate_expected_total(self) -> float:
-        """Calculate expected cart total."""
-        items = self.get_all_cart_items()
-        total = 0.0
+    def calculate_expected_total_minor(self) -> int:
+        """Calculate expected cart total in minor units (exact integer arithmetic)."""
+        items = self.get_cart_snapshot().items
+        total = 0
         
-        for item in items:
+        for item, price in zip(items, parse_many(item.price for item in items)):
             try:
-                price = float(''.join(filter(str.isdigit, item['price'])))
-                quantity = int(item['quantity'])
-                total += price * quantity
+                quantity = int(item.quantity)
             except (ValueError, TypeError):
                 continue
+            if price is not None:
+                total += price * quantity
         
         return total
     
+    def calculate_expected_total(self) -> float:
+        """Calculate expected cart total."""
+        return to_major(self.calculate_expected_total_minor())
+    
     def verify_cart_totals(self) -> bool:
-        """Verify cart totals are correct."""
-        expected_total = self.calculate_expected_total()
-        actual_total = self.get_cart_total_price()
-        
-        # Allow small difference due to rounding
-        return abs(expected_total - actual_total) < 0.01
+        """Verify cart totals are correct (compared exactly, in minor units)."""
+        return self.calculate_expected_total_minor() == self.get_cart_total_minor()
     
-    def get_item_by_name(self, name: str) -> Dict[str, str]:
+    def get_item_by_name(self, name: str) -> Dict[str, Any]:
         """
         Get cart item by name.
         
@@ -331,11 +384,8 @@ class CartPage(BasePage):
         Returns:
             Item information or empty dict if not found
         """
-        items = self.get_all_cart_items()
-        for item in items:
-            if name.lower() in item['name'].lower():
-                return item
-        return {}
+        item = self.get_cart_snapshot().find(name)
+        return item.to_dict() if item else {}
     
     def update_item_quantity_by_name(self, name: str, quantity: int) -> bool:
         """
@@ -348,12 +398,11 @@ class CartPage(BasePage):
         Returns:
             True if item found and updated, False otherwise
         """
-        items = self.get_all_cart_items()
-        for i, item in enumerate(items):
-            if name.lower() in item['name'].lower():
-                self.update_item_quantity(i, quantity)
-                return True
-        return False
+        item = self.get_cart_snapshot().find(name)
+        if item is None:
+            return False
+        self.update_item_quantity(item.index, quantity)
+        return True
     
     def remove_item_by_name(self, name: str) -> bool:
         """
@@ -365,22 +414,38 @@ class CartPage(BasePage):
         Returns:
             True if item found and removed, False otherwise
         """
-        items = self.get_all_cart_items()
-        for i, item in enumerate(items):
-            if name.lower() in item['name'].lower():
-                self.remove_item(i)
-                return True
-        return False
+        item = self.get_cart_snapshot().find(name)
+        if item is None:
+            return False
+        self.remove_item(item.index)
+        return True
     
     def clear_cart(self) -> None:
         """Clear all items from cart."""
         while not self.is_cart_empty():
             self.remove_item(0)
     
+    def seed_cart(self, product_ids: List[int], quantity: int = 1) -> None:
+        """
+        Fill the cart over HTTP, sharing the browser context's cookies.
+        
+        Use this when a test needs a pre-filled cart but is not testing the
+        add-to-cart UI. Navigate to the cart afterwards to see the items.
+        
+        Args:
+            product_ids: Product IDs to add
+            quantity: Quantity of each product
+        """
+        CartSeeder(self.page.context, self.base_url, self.seed_transport).seed(product_ids, quantity)
+        self.invalidate_snapshot()
+    
     def add_items_to_cart_from_products_page(self, products_page, item_indices: List[int]) -> None:
         """
         Add items to cart from products page.
         
+        Clicks each card's add-to-cart button; use seed_cart() when the
+        add-to-cart UI is not what the test exercises.
+        
         Args:
             products_page: Products page object
             item_indices: List of item indices to add
@@ -401,8 +466,7 @@ class CartPage(BasePage):
         Returns:
             True if all expected items are in cart, False otherwise
         """
-        cart_items = self.get_all_cart_items()
-        cart_item_names = [item['name'] for item in cart_items]
+        cart_item_names = self.get_cart_snapshot().names
         
         for expected_item in expected_items:
             if not any(expected_item.lower() in name.lower() for name in cart_item_names):
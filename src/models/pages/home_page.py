@@ -40,7 +40,7 @@ class HomePage(BasePage):
         # Post-Login Navigation Elements
         self.logout_link = page.locator('a[href="/logout"]:has-text("Logout")')
         self.delete_account_link = page.locator('a[href="/delete_account"]:has-text("Delete Account")')
-        self.logged_in_username = page.locator('.nav.navbar-nav b').first()
+        self.logged_in_username = page.locator('.nav.navbar-nav b').first
         
         # Main Slider/Carousel Section
         self.slider_section = page.locator('#slider')
@@ -55,7 +55,7 @@ class HomePage(BasePage):
         # Carousel Content Elements
         self.carousel_title = page.locator('.carousel-inner h1:has-text("Automation")')
         self.carousel_subtitle = page.locator('.carousel-inner h2:has-text("Full-Fledged practice website")')
-        self.carousel_description = page.locator('.carousel-inner p').first()
+        self.carousel_description = page.locator('.carousel-inner p').first
         self.test_cases_button = page.locator('a.test_cases_list button:has-text("Test Cases")')
         self.apis_list_button = page.locator('a.apis_list button:has-text("APIs list for practice")')
         self.carousel_images = page.locator('.carousel-inner img.girl.img-responsive')
@@ -177,15 +177,17 @@ class HomePage(BasePage):
     # Carousel Methods
     def interact_with_carousel(self) -> None:
         """Interact with the main carousel."""
-        self.carousel_left_control.click()
-        self.page.wait_for_timeout(1000)
-        self.carousel_right_control.click()
-        self.page.wait_for_timeout(1000)
+        self.wait_for_dom_event('#slider-carousel', 'slid.bs.carousel', self.carousel_left_control.click)
+        self.wait_for_dom_event('#slider-carousel', 'slid.bs.carousel', self.carousel_right_control.click)
     
     def click_carousel_indicator(self, index: int) -> None:
         """Click a carousel indicator."""
-        self.carousel_indicators.locator('li').nth(index).click()
-        self.page.wait_for_timeout(1000)
+        indicator = self.carousel_indicators.locator('li').nth(index)
+        # Clicking the active indicator does not slide, so there is no event to wait for
+        if self.get_active_carousel_slide() == index:
+            indicator.click()
+            return
+        self.wait_for_dom_event('#slider-carousel', 'slid.bs.carousel', indicator.click)
     
     def get_active_carousel_slide(self) -> int:
         """Get the active carousel slide index."""
@@ -219,10 +221,9 @@ class HomePage(BasePage):
         if category_panel.is_visible():
             return
         
-        # Click to expand
-        category_header.click()
+        # Click to expand and wait for the collapse animation to finish
+        self.wait_for_dom_event(f'#{category_name}', 'shown.bs.collapse', category_header.click)
         expect(category_panel).to_be_visible()
-        self.page.wait_for_timeout(300)
     
     def click_category_link(self, category_name: str) -> None:
         """Click a category link."""
@@ -234,9 +235,8 @@ class HomePage(BasePage):
         elif 'kids' in category_name.lower():
             self.expand_category_section('Kids')
         
-        category_link = self.category_links.filter(has_text=category_name).first()
-        category_link.click()
-        self.page.wait_for_load_state('networkidle')
+        category_link = self.category_links.filter(has_text=category_name).first
+        self.navigate_by(category_link.click)
     
     def get_category_links(self) -> List[str]:
         """Get all category links."""
@@ -250,9 +250,8 @@ class HomePage(BasePage):
     # Brand Methods
     def click_brand_link(self, brand_name: str) -> None:
         """Click a brand link."""
-        brand_link = self.brand_links.filter(has_text=brand_name).first()
-        brand_link.click()
-        self.page.wait_for_load_state('networkidle')
+        brand_link = self.brand_links.filter(has_text=brand_name).first
+        self.navigate_by(brand_link.click)
     
     def get_brand_links(self) -> List[str]:
         """Get all brand links."""
@@ -319,10 +318,8 @@ class HomePage(BasePage):
     # Recommended Items Carousel Methods
     def interact_with_recommended_carousel(self) -> None:
         """Interact with the recommended items carousel."""
-        self.recommended_left_control.click()
-        self.page.wait_for_timeout(1000)
-        self.recommended_right_control.click()
-        self.page.wait_for_timeout(1000)
+        self.wait_for_dom_event('#recommended-item-carousel', 'slid.bs.carousel', self.recommended_left_control.click)
+        self.wait_for_dom_event('#recommended-item-carousel', 'slid.bs.carousel', self.recommended_right_control.click)
     
     def add_recommended_product_to_cart(self, index: int) -> None:
         """Add a recommended product to cart."""
@@ -335,20 +332,22 @@ class HomePage(BasePage):
     # Post-Login Methods
     def logout(self) -> None:
         """Logout from the application."""
-        self.logout_link.click()
-        expect(self.page).to_have_url('*login*')
+        self.navigate_by(self.logout_link.click, ready_locator=self.signup_login_link)
     
     def delete_account(self) -> None:
         """Delete user account."""
-        self.delete_account_link.click()
-        self.page.wait_for_load_state('networkidle')
+        self.navigate_by(
+            self.delete_account_link.click,
+            ready_locator=self.page.locator('[data-qa="account-deleted"]')
+        )
     
     # Subscription Methods
     def subscribe_to_newsletter(self, email: str) -> None:
         """Subscribe to newsletter."""
         self.subscription_email_input.fill(email)
         self.subscription_button.click()
-        self.page.wait_for_load_state('networkidle')
+        # Submitted by AJAX; the page stays put and shows a confirmation
+        expect(self.subscription_success_message).to_be_visible()
     
     def verify_subscription_success(self) -> None:
         """Verify subscription success message."""
@@ -506,10 +505,14 @@ class HomePage(BasePage):
     # Utility Methods
     def wait_for_page_load(self) -> None:
         """Wait for page to load."""
-        self.page.wait_for_load_state('networkidle')
+        self.wait_until_ready()
         expect(self.logo).to_be_visible()
         expect(self.featured_items_section).to_be_visible()
     
+    def get_ready_locator(self) -> Locator:
+        """Get the locator that is visible once the home page is rendered."""
+        return self.featured_items_section
+    
     def scroll_to_featured_items(self) -> None:
         """Scroll to featured items section."""
         self.scroll_to_element(self.featured_items_section)
@@ -528,7 +531,7 @@ class HomePage(BasePage):
         self.scroll_to_bottom()
         expect(self.scroll_up_button).to_be_visible()
         self.scroll_up_button.click()
-        self.page.wait_for_timeout(1000)
+        self.wait_for_scroll_settled('top')
     
     def wait_for_all_images_loaded(self) -> None:
         """Wait for all images to load."""
@@ -540,11 +543,9 @@ class HomePage(BasePage):
         """)
     
     def get_load_time(self) -> int:
-        """Get page load time in milliseconds."""
-        start_time = self.page.evaluate("Date.now()")
+        """Get page load time in milliseconds, as measured by the browser's Navigation Timing."""
         self.wait_for_page_load()
-        end_time = self.page.evaluate("Date.now()")
-        return end_time - start_time
+        return round(self.collect_page_metrics(wait_for_load=True).page_load_ms or 0)
     
     # Accessibility Methods
     def verify_accessibility(self) -> None:
@@ -54,10 +54,14 @@ class LoginPage(BasePage):
     
     def wait_for_page_load(self) -> None:
         """Wait for login page to load."""
-        self.page.wait_for_load_state('networkidle')
+        self.wait_until_ready()
         expect(self.login_form).to_be_visible()
         expect(self.signup_form).to_be_visible()
     
+    def get_ready_locator(self) -> Locator:
+        """Get the locator that is visible once the login form is rendered."""
+        return self.login_form
+    
     # Login Form Methods
     def fill_login_form(self, email: str, password: str) -> None:
         """
@@ -86,17 +90,17 @@ class LoginPage(BasePage):
             True if login successful, False otherwise
         """
         self.fill_login_form(email, password)
-        self.submit_login_form()
         
-        # Wait for navigation or error
+        # Wait for the form post to navigate (it does not when client-side validation blocks it)
         try:
-            self.page.wait_for_url('*', timeout=5000)
-            # Check if we're still on login page (login failed)
-            if self.is_on_login_page():
-                return False
-            return True
+            with self.page.expect_navigation(wait_until='commit', timeout=5000):
+                self.submit_login_form()
         except Exception:
             return False
+        self.wait_until_ready(self.page_header)
+        
+        # Check if we're still on login page (login failed)
+        return not self.is_on_login_page()
     
     def login_with_validation(self, email: str, password: str) -> bool:
         """
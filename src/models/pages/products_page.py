@@ -3,8 +3,30 @@ Products Page Object Model for AutomationExercise testing framework.
 """
 from typing import List, Dict, Any
 from playwright.sync_api import Page, Locator, expect
+from src.helpers.money import parse_many, to_minor
+from src.models.product import ProductCard
 from .base_page import BasePage
 
+# Reads every product card in one browser round trip
+PRODUCT_CARDS_SCRIPT = """
+wrappers => wrappers.map((wrapper, index) => {
+    const info = wrapper.querySelector('.productinfo');
+    const text = selector => ((info && info.querySelector(selector)) || {}).textContent || '';
+    const image = info && info.querySelector('img');
+    const cartButton = info && info.querySelector('a.add-to-cart[data-product-id]');
+    const detailsLink = wrapper.querySelector('a[href*="/product_details/"]');
+    const detailsId = detailsLink ? detailsLink.getAttribute('href').match(/product_details\\/(\\d+)/) : null;
+    return {
+        index: index,
+        id: detailsId ? Number(detailsId[1]) : null,
+        name: text('p').trim(),
+        price: text('h2').trim(),
+        image_src: image ? image.getAttribute('src') || '' : '',
+        add_to_cart_id: cartButton ? Number(cartButton.dataset.productId) : null
+    };
+})
+"""
+
 
 class ProductsPage(BasePage):
     """Products page object model."""
@@ -88,10 +110,14 @@ class ProductsPage(BasePage):
     
     def wait_for_page_load(self) -> None:
         """Wait for products page to load."""
-        self.page.wait_for_load_state('networkidle')
+        self.wait_until_ready()
         expect(self.products_section).to_be_visible()
         expect(self.products_title).to_be_visible()
     
+    def get_ready_locator(self) -> Locator:
+        """Get the locator that is visible once the products grid is rendered."""
+        return self.products_section
+    
     # Search Methods
     def search_for_product(self, search_term: str) -> None:
         """
@@ -101,8 +127,7 @@ class ProductsPage(BasePage):
             search_term: Product search term
         """
         self.search_product_input.fill(search_term)
-        self.submit_search_button.click()
-        self.page.wait_for_load_state('networkidle')
+        self.navigate_by(self.submit_search_button.click)
     
     def get_search_results_count(self) -> int:
         """Get the number of search results."""
@@ -140,10 +165,9 @@ class ProductsPage(BasePage):
         if category_panel.is_visible():
             return
         
-        # Click to expand
-        category_header.click()
+        # Click to expand and wait for the collapse animation to finish
+        self.wait_for_dom_event(f'#{category_name}', 'shown.bs.collapse', category_header.click)
         expect(category_panel).to_be_visible()
-        self.page.wait_for_timeout(300)
     
     def click_category_link(self, category_name: str) -> None:
         """
@@ -160,9 +184,8 @@ class ProductsPage(BasePage):
         elif 'kids' in category_name.lower():
             self.expand_category_section('Kids')
         
-        category_link = self.category_links.filter(has_text=category_name).first()
-        category_link.click()
-        self.page.wait_for_load_state('networkidle')
+        category_link = self.category_links.filter(has_text=category_name).first
+        self.navigate_by(category_link.click)
     
     def get_category_links(self) -> List[str]:
         """Get all category links."""
@@ -181,9 +204,8 @@ class ProductsPage(BasePage):
         Args:
             brand_name: Name of the brand to click
         """
-        brand_link = self.brand_links.filter(has_text=brand_name).first()
-        brand_link.click()
-        self.page.wait_for_load_state('networkidle')
+        brand_link = self.brand_links.filter(has_text=brand_name).first
+        self.navigate_by(brand_link.click)
     
     def get_brand_links(self) -> List[str]:
         """Get all brand links."""
@@ -350,19 +372,16 @@ class ProductsPage(BasePage):
         Args:
             page_number: Page number to navigate to
         """
-        page_link = self.page_numbers.filter(has_text=str(page_number)).first()
-        page_link.click()
-        self.page.wait_for_load_state('networkidle')
+        page_link = self.page_numbers.filter(has_text=str(page_number)).first
+        self.navigate_by(page_link.click)
     
     def go_to_next_page(self) -> None:
         """Go to next page."""
-        self.next_page_button.click()
-        self.page.wait_for_load_state('networkidle')
+        self.navigate_by(self.next_page_button.click)
     
     def go_to_previous_page(self) -> None:
         """Go to previous page."""
-        self.previous_page_button.click()
-        self.page.wait_for_load_state('networkidle')
+        self.navigate_by(self.previous_page_button.click)
     
     def is_pagination_visible(self) -> bool:
         """Check if pagination is visible."""
@@ -383,8 +402,8 @@ class ProductsPage(BasePage):
         Args:
             sort_option: Sort option to select
         """
-        self.sort_dropdown.select_option(sort_option)
-        self.page.wait_for_load_state('networkidle')
+        # Selecting an option reloads the listing
+        self.navigate_by(lambda: self.sort_dropdown.select_option(sort_option))
     
     def sort_by_price_low_to_high(self) -> None:
         """Sort products by price low to high."""
@@ -489,18 +508,21 @@ class ProductsPage(BasePage):
             return False
     
     # Utility Methods
-    def get_all_products_info(self) -> List[Dict[str, str]]:
-        """Get information for all products on the page."""
-        products = []
-        count = self.get_product_count()
-        
-        for i in range(count):
-            product_info = self.get_product_by_index(i)
-            products.append(product_info)
+    def get_product_cards(self) -> List[ProductCard]:
+        """
+        Get every product card on the page with a single browser call.
         
-        return products
+        Returns:
+            Product cards in page order
+        """
+        cards = self.page.eval_on_selector_all('.product-image-wrapper', PRODUCT_CARDS_SCRIPT)
+        return [ProductCard(**card) for card in cards]
+    
+    def get_all_products_info(self) -> List[Dict[str, Any]]:
+        """Get information (index, id, name, price, image, add-to-cart id) for all products on the page."""
+        return [card.model_dump() for card in self.get_product_cards()]
     
-    def filter_products_by_price_range(self, min_price: float, max_price: float) -> List[Dict[str, str]]:
+    def filter_products_by_price_range(self, min_price: float, max_price: float) -> List[Dict[str, Any]]:
         """
         Filter products by price range.
         
@@ -511,23 +533,18 @@ class ProductsPage(BasePage):
         Returns:
             List of products within price range
         """
-        all_products = self.get_all_products_info()
-        filtered_products = []
+        cards = self.get_product_cards()
+        # Prices like "Rs. 500", compared in minor units; unreadable prices are skipped
+        low, high = to_minor(min_price), to_minor(max_price)
+        prices = parse_many(card.price for card in cards)
         
-        for product in all_products:
-            # Extract price from string like "Rs. 500"
-            price_text = product['price']
-            try:
-                # Remove currency symbols and extract number
-                price_value = float(''.join(filter(str.isdigit, price_text)))
-                if min_price <= price_value <= max_price:
-                    filtered_products.append(product)
-            except (ValueError, TypeError):
-                continue
-        
-        return filtered_products
+        return [
+            card.model_dump()
+            for card, price in zip(cards, prices)
+            if price is not None and low <= price <= high
+        ]
     
-    def get_products_by_category(self, category: str) -> List[Dict[str, str]]:
+    def get_products_by_category(self, category: str) -> List[Dict[str, Any]]:
         """
         Get products by category.
         
@@ -543,7 +560,7 @@ class ProductsPage(BasePage):
         # Get products after filtering
         return self.get_all_products_info()
     
-    def get_products_by_brand(self, brand: str) -> List[Dict[str, str]]:
+    def get_products_by_brand(self, brand: str) -> List[Dict[str, Any]]:
         """
         Get products by brand.
         
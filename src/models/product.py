@@ -3,11 +3,17 @@ Product data models for AutomationExercise testing framework.
 """
 from typing import List, Optional
 from pydantic import BaseModel
+from .lazy import LazyModelList
+
+
+class UserType(BaseModel):
+    """Top-level category of a product (e.g. Women), nested as the API returns it."""
+    usertype: str
 
 
 class ProductCategory(BaseModel):
     """Product category model."""
-    usertype: str
+    usertype: UserType
     category: str
 
 
@@ -20,16 +26,26 @@ class Product(BaseModel):
     category: ProductCategory
 
 
+class ProductCard(BaseModel):
+    """Product card as rendered on a products grid."""
+    index: int
+    id: Optional[int] = None
+    name: str
+    price: str
+    image_src: str = ""
+    add_to_cart_id: Optional[int] = None
+
+
 class ProductsResponse(BaseModel):
-    """Products API response model."""
+    """Products API response model (products are validated on access, see LazyModelList)."""
     responseCode: int
-    products: List[Product]
+    products: LazyModelList[Product]
 
 
 class SearchProductResponse(BaseModel):
-    """Search product API response model."""
+    """Search product API response model (products are validated on access, see LazyModelList)."""
     responseCode: int
-    products: List[Product]
+    products: LazyModelList[Product]
 
 
 class Brand(BaseModel):
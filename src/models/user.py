@@ -92,7 +92,22 @@ class UpdateAccountResponse(BaseModel):
     user: Optional[User] = None
 
 
+class UserDetail(BaseModel):
+    """User account as returned by getUserDetailByEmail (the password is never sent back)."""
+    id: Optional[int] = None
+    name: str
+    email: str
+    first_name: Optional[str] = ""
+    last_name: Optional[str] = ""
+    address1: Optional[str] = ""
+    address2: Optional[str] = ""
+    country: Optional[str] = ""
+    state: Optional[str] = ""
+    city: Optional[str] = ""
+    zipcode: Optional[str] = ""
+
+
 class UserDetailResponse(BaseModel):
     """User detail response model."""
     responseCode: int
-    user: Optional[User] = None
+    user: Optional[UserDetail] = None
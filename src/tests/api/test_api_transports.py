@@ -0,0 +1,50 @@
+"""
+API transport tests for AutomationExercise.com.
+"""
+import pytest
+from src.api_client.controllers.products_controller import ProductsController
+from src.api_client.httpx_transport import HttpxTransport
+from src.api_client.request_pool import RequestContextPool
+
+
+@pytest.mark.api
+class TestAPITransports:
+    """Test class for the Playwright and httpx API transports."""
+    
+    def test_transports_return_the_same_controller_responses(self, stand_in_site):
+        """
+        Test the same controller calls through both transports.
+        
+        Tests that the pooled Playwright and httpx transports give identical results for a GET,
+        a form POST and a rejected method against the stand-in server.
+        """
+        results = {}
+        with RequestContextPool(size=1) as pool, HttpxTransport() as client:
+            for name, transport in (("playwright", pool), ("httpx", client)):
+                controller = ProductsController(transport, base_url=stand_in_site.api_base_url)
+                results[name] = [
+                    controller.get_all_products(),
+                    controller.search_product("top"),
+                    controller.post_to_products_list()
+                ]
+        
+        assert results["playwright"][0]["status"] == 200
+        assert results["playwright"][0]["data"]["products"]
+        assert results["httpx"] == results["playwright"]
+    
+    def test_transports_follow_redirects_alike(self, stand_in_site):
+        """
+        Test redirect handling of both transports.
+        
+        Tests that both transports follow redirects by default and return the redirect
+        itself when max_redirects is 0, like APIRequestContext.fetch.
+        """
+        with RequestContextPool(size=1) as pool, HttpxTransport() as client:
+            for transport in (pool, client):
+                followed = transport.fetch(f"{stand_in_site.base_url}/logout")
+                assert followed.status == 200, type(transport).__name__
+                assert followed.url.endswith("/login"), type(transport).__name__
+                
+                redirect = transport.fetch(f"{stand_in_site.base_url}/logout", max_redirects=0)
+                assert redirect.status == 302, type(transport).__name__
+                assert redirect.headers["location"] == "/login", type(transport).__name__
@@ -1,9 +1,18 @@
 """
 Products API tests for AutomationExercise.com.
 """
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import pytest
-import time
-from src.fixtures.test_data_fixtures import products_controller, api_test_data
+from src.fixtures.test_data_fixtures import (
+    PERFORMANCE_SAMPLES, api_latency, products_controller, api_test_data, performance_thresholds,
+    performance_test_data
+)
+from src.api_client.controllers.async_products_controller import AsyncProductsController
+from src.api_client.typed_response import TypedResponse
+from src.helpers.catalog_store import CatalogStore
+from src.models.product import ProductsResponse
+from src.helpers.load_generator import OpenLoopLoadGenerator, controller_operations
 
 
 @pytest.mark.api
@@ -83,6 +92,55 @@ class TestProductsAPI:
             )
             assert search_results, f"Search results should contain '{search_term}'"
     
+    def test_typed_response_decodes_on_demand(self):
+        """
+        TypedResponse - status needs no decoding; data and model are decoded once, on first access.
+        
+        Runs without the network, so a broken typed_response module fails here first.
+        """
+        body = (b'{"responseCode": 200, "products": [{"id": 1, "name": "Blue Top", "price": "Rs. 500", '
+                b'"brand": "Polo", "category": {"usertype": {"usertype": "Women"}, "category": "Tops"}}]}')
+        response = TypedResponse(200, body, ProductsResponse)
+        
+        assert response.ok
+        assert response["status"] == 200
+        assert response["data"]["products"][0]["id"] == 1
+        assert response.model.products.validated_count == 0
+        assert response.model.products[0].category.usertype.usertype == "Women"
+        assert response.model is response.model
+    
+    def test_products_list_typed_response(self, products_controller, api_test_data):
+        """
+        API 1: GET All Products List as a typed response - body validated into ProductsResponse.
+        
+        Validates that the raw body is parsed once, straight into the pydantic models.
+        """
+        # Act
+        response = products_controller.products_list()
+        
+        # Assert
+        assert response.status == 200
+        products = response.model.products
+        assert response.model.responseCode == 200
+        assert len(products) >= api_test_data["products_data"]["expected_product_count"]
+        assert products[0].category.usertype.usertype
+        assert response.model is response.model, "The model should be validated only once"
+    
+    def test_search_products_typed_response(self, products_controller, api_test_data):
+        """
+        API 5: POST To Search Product as a typed response - matches SearchProductResponse.
+        
+        Validates that the search results validate against the search response model.
+        """
+        search_term = api_test_data["products_data"]["search_terms"]["valid"][0]
+        
+        response = products_controller.search_products(search_term)
+        
+        assert response.status == 200
+        assert response.model.responseCode == 200
+        assert all(product.id > 0 for product in response.model.products)
+        assert response["data"]["responseCode"] == 200
+    
     def test_search_product_without_parameter_bad_request(self, products_controller):
         """
         API 6: POST To Search Product without parameter - Should return 400 Bad Request.
@@ -124,39 +182,101 @@ class TestProductsAPI:
         response = products_controller.get_all_products()
         
         assert response["status"] == 200
-        assert len(response["data"]["products"]) > 0
+        store = CatalogStore(response["data"]["products"])
+        assert len(store) > 0
         
-        # Check each product has required fields
-        for i, product in enumerate(response["data"]["products"]):
-            assert "id" in product, f"Product {i} should have id"
-            assert product["id"] is not None, f"Product {i} id should not be None"
-            
-            assert "name" in product, f"Product {i} should have name"
-            assert product["name"], f"Product {i} name should not be empty"
-            
-            assert "price" in product, f"Product {i} should have price"
-            assert product["price"], f"Product {i} price should not be empty"
-            
-            assert "brand" in product, f"Product {i} should have brand"
-            assert product["brand"], f"Product {i} brand should not be empty"
-            
-            assert "category" in product, f"Product {i} should have category"
-            assert product["category"] is not None, f"Product {i} category should not be None"
+        # Required fields, types, unique positive ids and parseable prices, checked column by column
+        errors = store.integrity_errors()
+        assert not errors, "\n".join(errors)
     
-    def test_api_performance_response_time(self, products_controller):
+    def test_catalog_store_reports_missing_price_once(self):
         """
-        API Performance - Response time should be under 5 seconds.
+        CatalogStore - a missing price is one type problem, not also a range error.
         
-        Validates that the products endpoint responds within acceptable time limits (under 5 seconds).
+        Runs without the network.
         """
-        start_time = time.time()
+        category = {"usertype": {"usertype": "Women"}, "category": "Tops"}
+        store = CatalogStore([
+            {"id": 1, "name": "Blue Top", "price": "Rs. 500", "brand": "Polo", "category": category},
+            {"id": 2, "name": "Men Tshirt", "brand": "H&M", "category": category},
+            {"id": 3, "name": "Sleeveless Dress", "price": "Rs. 0", "brand": "Madame", "category": category}
+        ])
+        
+        errors = store.integrity_errors()
+        
+        assert errors == [
+            "Product 1: price should be a non-empty string, got None",
+            "Product 2: price 0 is out of range"
+        ]
+    
+    def test_catalog_store_reports_unparseable_and_negative_values(self):
+        """
+        CatalogStore - prices without an amount and negative ids or prices are problems, not MISSING rows.
         
-        response = products_controller.get_all_products()
+        Runs without the network.
+        """
+        category = {"usertype": {"usertype": "Women"}, "category": "Tops"}
+        store = CatalogStore([
+            {"id": 1, "name": "Blue Top", "price": "Free", "brand": "Polo", "category": category},
+            {"id": -1, "name": "Men Tshirt", "price": "Rs. 400", "brand": "H&M", "category": category},
+            {"id": 3, "name": "Sleeveless Dress", "price": "Rs. -5", "brand": "Madame", "category": category}
+        ])
+        
+        errors = store.integrity_errors()
+        
+        assert errors == [
+            "Product 0: price 'Free' has no amount",
+            "Product 1: id -1 is out of range",
+            "Product 2: price 'Rs. -5' is negative"
+        ]
+        assert store.price_of(1) is None
+        assert store.price_of(3) is None
+    
+    def test_api_performance_response_time(self, products_controller, api_latency):
+        """
+        API Performance - p90 response time should be under 5 seconds.
         
-        response_time = (time.time() - start_time) * 1000  # Convert to milliseconds
+        Validates that the products endpoint responds within acceptable time limits (under 5 seconds)
+        for 90% of PERFORMANCE_SAMPLES requests.
+        """
+        products_controller.latency = api_latency
         
-        assert response["status"] == 200
-        assert response_time < 5000, f"Response time {response_time}ms should be under 5000ms"
+        for _ in range(PERFORMANCE_SAMPLES):
+            response = products_controller.get_all_products(use_cache=False)
+            assert response["status"] == 200
+        
+        latency = api_latency.histogram("GET", "/productsList").summary_ms()
+        assert latency["count"] == PERFORMANCE_SAMPLES
+        assert latency["p90_ms"] < 5000, f"p90 response time {latency['p90_ms']}ms should be under 5000ms ({latency})"
+    
+    @pytest.mark.benchmark
+    def test_search_product_benchmark(self, products_controller, benchmark, performance_thresholds):
+        """
+        Search API benchmark - median response time should be under the search threshold.
+        
+        Times repeated searches after a warmup, drops outliers and compares the median with the saved baseline.
+        """
+        result = benchmark("products.search_product[dress]", products_controller.search_product, "dress")
+        
+        assert result.median_ms < performance_thresholds["search_response_time"], str(result)
+    
+    def test_search_load_at_target_rate(self, products_controller, performance_test_data, performance_thresholds):
+        """
+        Search API under load - requests at a fixed arrival rate should all succeed in time.
+        
+        Sends searches on an open-loop schedule, so slow responses delay the measured latency
+        instead of lowering the request rate.
+        """
+        operations = controller_operations(
+            products_controller, None, None, ["search"],
+            search_terms=performance_test_data["large_search_terms"]
+        )
+        
+        result = OpenLoopLoadGenerator(operations, rate=5, workers=5).run(total=20)
+        
+        assert result.completed == 20
+        assert result.error_rate == 0, str(result)
+        assert result.latency.percentile(90) / 1e6 < performance_thresholds["api_response_time"], str(result)
     
     def test_search_product_with_special_characters(self, products_controller):
         """
@@ -230,20 +350,59 @@ class TestProductsAPI:
         Tests that the API returns consistent data across multiple calls.
         """
         # Make multiple calls to the same endpoint
-        responses = []
-        for _ in range(3):
-            response = products_controller.get_all_products()
-            responses.append(response)
+        responses = [products_controller.products_list() for _ in range(3)]
         
         # All responses should be successful
         for response in responses:
-            assert response["status"] == 200
-            assert "products" in response["data"]
+            assert response.status == 200
         
-        # All responses should have the same number of products
-        product_counts = [len(response["data"]["products"]) for response in responses]
+        # Counting and comparing ids reads the raw items: no product is validated
+        products_lists = [response.model.products for response in responses]
+        stores = [CatalogStore(products.raw) for products in products_lists]
+        product_counts = [len(store) for store in stores]
         assert len(set(product_counts)) == 1, "Product count should be consistent across calls"
         
-        # All responses should have the same product IDs
-        product_ids = [set(product["id"] for product in response["data"]["products"]) for response in responses]
-        assert all(ids == product_ids[0] for ids in product_ids), "Product IDs should be consistent across calls"
+        assert all(sorted(store.product_ids) == sorted(stores[0].product_ids) for store in stores), \
+            "Product IDs should be consistent across calls"
+        assert all(products.validated_count == 0 for products in products_lists)
+    
+    def test_products_list_schema(self, products_controller):
+        """
+        Test products API schema.
+        
+        Validates every product and nested category against the models (strict mode).
+        """
+        response = products_controller.products_list()
+        
+        assert response.status == 200
+        products = response.validate(strict=True).products
+        assert len(products) > 0
+        assert products.validated_count == len(products)
+    
+    def test_products_api_async_fan_out(self, api_request_context, api_response_cache, api_test_data):
+        """
+        Test products API async fan-out.
+        
+        Tests that the async controller keeps several requests in flight from a single event loop.
+        The controller goes through the session's API transport, so it follows --network-mode
+        (HAR record/replay), --stand-in and API_TRANSPORT like the sync controllers.
+        """
+        search_terms = api_test_data["products_data"]["search_terms"]["valid"]
+        controller = AsyncProductsController(api_request_context, cache=api_response_cache)
+        controller.init()
+        
+        async def fan_out():
+            return await asyncio.gather(
+                controller.get_all_products(),
+                *(controller.search_product(term) for term in search_terms)
+            )
+        
+        # Run on a dedicated thread so the event loop does not clash with the sync Playwright session
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            responses = executor.submit(asyncio.run, fan_out()).result()
+        
+        assert len(responses) == len(search_terms) + 1
+        for response in responses:
+            assert response["status"] == 200
+            assert "products" in response["data"]
+            assert isinstance(response["data"]["products"], list)
@@ -0,0 +1,113 @@
+"""
+Response cache tests for AutomationExercise.com API clients.
+"""
+from typing import Any, List, Tuple
+import pytest
+from src.api_client.controllers.brands_controller import BrandsController
+from src.api_client.controllers.products_controller import ProductsController
+from src.api_client.response_cache import ResponseCache
+
+
+class CountingTransport:
+    """Transport wrapper that remembers what reached the server."""
+    
+    def __init__(self, transport: Any):
+        """
+        Initialize the wrapper.
+        
+        Args:
+            transport: Transport with fetch() to send requests through
+        """
+        self.transport = transport
+        self.sent: List[Tuple[str, str, int]] = []
+    
+    def fetch(self, url: str, **kwargs: Any) -> Any:
+        """Send a request and record its URL, If-None-Match header and status."""
+        response = self.transport.fetch(url, **kwargs)
+        self.sent.append((url, (kwargs.get("headers") or {}).get("If-None-Match", ""), response.status))
+        return response
+
+
+@pytest.mark.api
+class TestResponseCacheAPI:
+    """Test class for the GET response cache against the stand-in server."""
+    
+    def test_cache_hit_and_miss(self, api_request_pool, stand_in_site):
+        """
+        Test cache hits and misses.
+        
+        Tests that a repeated GET is served from the cache without a request and that
+        another endpoint is a miss.
+        """
+        transport = CountingTransport(api_request_pool)
+        cache = ResponseCache(max_entries=8, ttl_seconds=60)
+        products = ProductsController(transport, base_url=stand_in_site.api_base_url, cache=cache)
+        brands = BrandsController(transport, base_url=stand_in_site.api_base_url, cache=cache)
+        
+        first = products.get_all_products()
+        second = products.get_all_products()
+        brands.get_all_brands()
+        
+        assert first == second
+        assert len(transport.sent) == 2
+        assert cache.stats() == {"hits": 1, "misses": 2, "revalidations": 0, "evictions": 0, "entries": 2}
+        
+        # Callers get copies, so a mutated result does not leak into the next hit
+        second["data"]["products"].clear()
+        assert products.get_all_products() == first
+    
+    def test_cache_bypass(self, api_request_pool, stand_in_site):
+        """
+        Test bypassing the cache.
+        
+        Tests that use_cache=False always reaches the server and leaves the cache alone.
+        """
+        transport = CountingTransport(api_request_pool)
+        cache = ResponseCache(max_entries=8, ttl_seconds=60)
+        products = ProductsController(transport, base_url=stand_in_site.api_base_url, cache=cache)
+        
+        products.get_all_products(use_cache=False)
+        products.get_all_products(use_cache=False)
+        
+        assert len(transport.sent) == 2
+        assert cache.stats()["entries"] == 0
+    
+    def test_expired_entry_is_revalidated_with_304(self, api_request_pool, stand_in_site):
+        """
+        Test expiry and 304 revalidation.
+        
+        Tests that an expired entry is re-requested with If-None-Match, that the stand-in's
+        304 Not Modified refreshes it, and that the cached data is returned.
+        """
+        transport = CountingTransport(api_request_pool)
+        # Every entry is expired as soon as it is stored
+        cache = ResponseCache(max_entries=8, ttl_seconds=0)
+        products = ProductsController(transport, base_url=stand_in_site.api_base_url, cache=cache)
+        
+        first = products.get_all_products()
+        second = products.get_all_products()
+        
+        assert second == first
+        (_, first_etag, first_status), (_, second_etag, second_status) = transport.sent
+        assert (first_etag, first_status) == ("", 200)
+        assert second_etag and second_status == 304
+        assert cache.stats() == {"hits": 0, "misses": 2, "revalidations": 1, "evictions": 0, "entries": 1}
+    
+    def test_least_recently_used_entry_is_evicted_at_capacity(self, api_request_pool, stand_in_site):
+        """
+        Test eviction at capacity.
+        
+        Tests that storing past max_entries evicts the least recently used entry, so the
+        next request for it reaches the server again.
+        """
+        transport = CountingTransport(api_request_pool)
+        cache = ResponseCache(max_entries=1, ttl_seconds=60)
+        products = ProductsController(transport, base_url=stand_in_site.api_base_url, cache=cache)
+        brands = BrandsController(transport, base_url=stand_in_site.api_base_url, cache=cache)
+        
+        products.get_all_products()
+        brands.get_all_brands()
+        products.get_all_products()
+        
+        assert [url.rsplit("/", 1)[-1] for url, _, _ in transport.sent] == ["productsList", "brandsList", "productsList"]
+        assert cache.stats() == {"hits": 0, "misses": 3, "revalidations": 0, "evictions": 2, "entries": 1}
@@ -0,0 +1,114 @@
+"""
+Duration sharding unit tests for AutomationExercise testing framework.
+"""
+import pytest
+from src.helpers.duration_sharding import (
+    DEFAULT_DURATION, DURATIONS_CACHE_KEY, DurationStore, is_ui_test, lpt_partition, plan_shards
+)
+
+
+class FakeCache:
+    """In-memory stand-in for pytest's config.cache."""
+    
+    def __init__(self, values=None):
+        self.values = dict(values or {})
+    
+    def get(self, key, default):
+        return self.values.get(key, default)
+    
+    def set(self, key, value):
+        self.values[key] = value
+
+
+def api_test(name: str) -> str:
+    return f"src/tests/api/test_products_api.py::TestProductsAPI::{name}"
+
+
+def ui_test(name: str) -> str:
+    return f"src/tests/user_interface/test_e2e_cart.py::TestE2ECart::{name}"
+
+
+@pytest.mark.unit
+class TestDurationSharding:
+    """Test class for duration-based test sharding."""
+    
+    def test_duration_store_estimates_and_blends(self):
+        """
+        DurationStore - unknown tests get the median, new runs are blended in and persisted.
+        """
+        cache = FakeCache({DURATIONS_CACHE_KEY: {"a": 1.0, "b": 3.0, "c": 8.0}})
+        store = DurationStore(cache, smoothing=0.5)
+        
+        assert store.estimate("a") == 1.0
+        assert store.estimate("never-ran") == 3.0
+        assert DurationStore(None).estimate("never-ran") == DEFAULT_DURATION
+        
+        store.update({"a": 3.0, "d": 2.0})
+        
+        assert cache.values[DURATIONS_CACHE_KEY] == {"a": 2.0, "b": 3.0, "c": 8.0, "d": 2.0}
+    
+    def test_lpt_partition_balances_bins(self):
+        """
+        lpt_partition - every item lands in exactly one bin, longest first, within 4/3 of the optimum.
+        """
+        durations = [9.0, 8.0, 7.0, 6.0, 5.0, 4.0, 3.0, 2.0, 2.0, 1.0, 1.0]
+        items = list(enumerate(durations))
+        
+        partition = lpt_partition(items, 3)
+        
+        assert sorted(item for bin_items in partition for item in bin_items) == list(range(len(items)))
+        for bin_items in partition:
+            assert [durations[item] for item in bin_items] == sorted((durations[item] for item in bin_items),
+                                                                     reverse=True)
+        loads = [sum(durations[item] for item in bin_items) for bin_items in partition]
+        optimum = max(sum(durations) / 3, max(durations))
+        assert max(loads) <= optimum * 4 / 3
+    
+    def test_lpt_partition_more_bins_than_items(self):
+        """
+        lpt_partition - surplus bins stay empty.
+        """
+        partition = lpt_partition([(0, 2.0), (1, 1.0)], 4)
+        
+        assert sorted(map(sorted, partition)) == [[], [], [0], [1]]
+    
+    def test_plan_shards_keeps_ui_and_api_apart(self):
+        """
+        plan_shards - UI and API tests never share a worker, and workers follow the suites' durations.
+        """
+        collection = [ui_test(f"test_ui_{i}") for i in range(6)] + [api_test(f"test_api_{i}") for i in range(6)]
+        durations = {nodeid: (10.0 if is_ui_test(nodeid) else 1.0) for nodeid in collection}
+        
+        plan = plan_shards(collection, 4, durations.get)
+        
+        assert len(plan) == 4
+        assert sorted(index for _, indices in plan for index in indices) == list(range(len(collection)))
+        for kind, indices in plan:
+            assert {is_ui_test(collection[index]) for index in indices} <= {kind == "ui"}
+        # 60s of UI tests against 6s of API tests: three UI workers, one API worker
+        assert [kind for kind, _ in plan] == ["ui", "ui", "ui", "api"]
+    
+    def test_plan_shards_gives_each_suite_a_worker(self):
+        """
+        plan_shards - a suite with a tiny share of the duration still gets one worker of its own.
+        """
+        collection = [api_test("test_fast")] + [ui_test(f"test_ui_{i}") for i in range(8)]
+        durations = {nodeid: (60.0 if is_ui_test(nodeid) else 0.1) for nodeid in collection}
+        
+        plan = plan_shards(collection, 2, durations.get)
+        
+        assert plan == [("ui", [1, 2, 3, 4, 5, 6, 7, 8]), ("api", [0])]
+    
+    @pytest.mark.parametrize("collection, workers, kinds", [
+        ([api_test("test_a"), api_test("test_b"), api_test("test_c")], 2, ["api", "api"]),
+        ([ui_test("test_a"), ui_test("test_b")], 3, ["ui", "ui", "ui"]),
+        ([ui_test("test_a"), api_test("test_b")], 1, ["ui"]),
+    ])
+    def test_plan_shards_single_suite_or_worker(self, collection, workers, kinds):
+        """
+        plan_shards - with one suite or one worker every worker takes from the same pool.
+        """
+        plan = plan_shards(collection, workers, lambda nodeid: 1.0)
+        
+        assert [kind for kind, _ in plan] == kinds
+        assert sorted(index for _, indices in plan for index in indices) == list(range(len(collection)))
@@ -0,0 +1,83 @@
+"""
+Price parsing unit tests for AutomationExercise testing framework.
+"""
+import pytest
+from src.helpers.money import parse_many, parse_minor, to_major, to_minor
+
+
+@pytest.mark.unit
+class TestMoney:
+    """Test class for the shared price parser."""
+    
+    @pytest.mark.parametrize("text, locale, expected", [
+        ("Rs. 500", "en_IN", 50000),
+        ("Rs. 1,234.50", "en_IN", 123450),
+        ("Rs. 1,23,456.50", "en_IN", 12345650),
+        ("$1,234,567.89", "en_US", 123456789),
+        ("1.234,50 €", "de_DE", 123450),
+        ("1 234,50 €", "fr_FR", 123450),
+        ("1\u00a0234,50 €", "fr_FR", 123450),
+        ("1\u202f234,50 €", "fr_FR", 123450),
+        ("1.234,5 €", "es_ES", 123450),
+        ("¥1,234", "ja_JP", 1234),
+        ("1'234.50", "en_US", 123450),
+        ("Rs. 1234.567", "en_IN", 123457),
+    ])
+    def test_parse_minor_locales_and_grouping(self, text, locale, expected):
+        """
+        parse_minor - honours each locale's decimal separator and digit grouping.
+        """
+        assert parse_minor(text, locale) == expected
+    
+    @pytest.mark.parametrize("text, expected", [
+        ("Rs. -5", -500),
+        ("-Rs. 5", -500),
+        ("-1,234.50", -123450),
+    ])
+    def test_parse_minor_negative_amounts(self, text, expected):
+        """
+        parse_minor - a minus sign before the amount or the currency symbol makes it negative.
+        """
+        assert parse_minor(text, "en_IN") == expected
+    
+    @pytest.mark.parametrize("text, locale", [
+        ("", "en_IN"),
+        ("Free", "en_IN"),
+        ("500 Rs. 2", "en_IN"),
+        ("Rs. 500 2", "en_IN"),
+        ("Rs. 1.234,50", "en_IN"),
+        ("1,2345", "en_US"),
+        ("12 34,50", "fr_FR"),
+        ("1,234.50", "de_DE"),
+    ])
+    def test_parse_minor_rejects_bad_input(self, text, locale):
+        """
+        parse_minor - no amount, several amounts or another locale's grouping raise ValueError.
+        """
+        with pytest.raises(ValueError):
+            parse_minor(text, locale)
+    
+    def test_parse_minor_unknown_locale(self):
+        """
+        parse_minor - an unknown locale raises ValueError; a bare language picks its locale.
+        """
+        with pytest.raises(ValueError):
+            parse_minor("Rs. 500", "xx_XX")
+        assert parse_minor("1.234,50", "de") == 123450
+    
+    def test_parse_many_keeps_order_and_marks_bad_prices(self):
+        """
+        parse_many - one result per text, in order, with None where a text holds no valid amount.
+        """
+        texts = ["Rs. 500", "Free", "Rs. 1,234.50", "Rs. 500", "Rs. 1.234,50"]
+        
+        assert parse_many(texts, "en_IN") == [50000, None, 123450, 50000, None]
+        assert parse_many([], "en_IN") == []
+    
+    def test_major_minor_round_trip(self):
+        """
+        to_minor / to_major - convert between major-unit floats and minor units.
+        """
+        assert to_minor(499.5, "en_IN") == 49950
+        assert to_major(123450, "en_IN") == 1234.5
+        assert to_minor(1234, "ja_JP") == 1234
@@ -0,0 +1,119 @@
+"""
+Network routing rule tests for AutomationExercise testing framework.
+"""
+from types import SimpleNamespace
+import pytest
+from src.helpers.network_routing import DEFAULT_DENY_DOMAINS, NetworkBlocker, RoutingRules
+
+
+class FakeRoute:
+    """Route stand-in that records how the blocker answered it."""
+    
+    def __init__(self, url: str, resource_type: str):
+        """Build a route for a request URL and resource type."""
+        self.request = SimpleNamespace(url=url, resource_type=resource_type)
+        self.outcome = None
+    
+    def fallback(self) -> None:
+        self.outcome = ("fallback",)
+    
+    def abort(self, error_code: str) -> None:
+        self.outcome = ("abort", error_code)
+    
+    def fulfill(self, status: int, body: str, content_type: str) -> None:
+        self.outcome = ("fulfill", status, content_type)
+
+
+@pytest.mark.unit
+class TestNetworkRouting:
+    """Test class for RoutingRules matching and NetworkBlocker."""
+    
+    @pytest.fixture
+    def rules(self):
+        """Rules with every kind of allow and deny entry."""
+        return RoutingRules(
+            deny_domains=["doubleclick.net", "Hotjar.com"],
+            deny_resource_types=["font", "media"],
+            deny_url_globs=["*/ads/*"],
+            allow_domains=["automationexercise.com"],
+            allow_url_globs=["https://cdn.example.com/ads/keep.js"]
+        )
+    
+    @pytest.mark.parametrize("url, resource_type, reason", [
+        # Denied hosts, subdomains included, case-insensitive
+        ("https://doubleclick.net/pixel", "image", "domain:doubleclick.net"),
+        ("https://ad.g.doubleclick.net/pixel", "script", "domain:doubleclick.net"),
+        ("https://static.hotjar.com/c.js", "script", "domain:hotjar.com"),
+        # A host only ending in a denied name is not a subdomain of it
+        ("https://notdoubleclick.net/pixel", "image", None),
+        # Resource types and URL globs
+        ("https://cdn.example.com/font.woff2", "font", "type:font"),
+        ("https://cdn.example.com/ads/banner.js", "script", "glob:*/ads/*"),
+        ("https://cdn.example.com/app.js", "script", None),
+    ])
+    def test_deny_rules(self, rules, url, resource_type, reason):
+        """
+        RoutingRules.match - denied hosts (and their subdomains), resource types and URL globs are blocked.
+        """
+        assert rules.match(url, resource_type) == reason
+    
+    @pytest.mark.parametrize("url, resource_type, reason", [
+        # First-party hosts ignore domain and glob denies, but not resource types
+        ("https://automationexercise.com/ads/page", "document", None),
+        ("https://www.automationexercise.com/static/app.js", "script", None),
+        ("https://automationexercise.com/static/font.woff", "font", "type:font"),
+        # An allowed URL glob wins over every deny entry
+        ("https://cdn.example.com/ads/keep.js", "script", None),
+    ])
+    def test_allow_rules_win(self, rules, url, resource_type, reason):
+        """
+        RoutingRules.match - allowed hosts and URL globs win over deny entries, except resource types.
+        """
+        assert rules.match(url, resource_type) == reason
+    
+    def test_unknown_action_is_rejected(self):
+        """
+        RoutingRules - an action other than abort or stub raises ValueError.
+        """
+        with pytest.raises(ValueError, match="Unknown blocking action"):
+            RoutingRules(action="drop")
+    
+    def test_from_env_allows_base_url_host(self, monkeypatch):
+        """
+        RoutingRules.from_env - the BASE_URL host at build time (e.g. the stand-in server) is first-party.
+        """
+        monkeypatch.setenv("BASE_URL", "http://127.0.0.1:8765")
+        monkeypatch.setenv("BLOCK_DOMAINS", "127.0.0.1, tracker.test")
+        monkeypatch.setenv("ALLOW_URL_GLOBS", "https://tracker.test/keep/*")
+        monkeypatch.delenv("BLOCK_RESOURCE_TYPES", raising=False)
+        monkeypatch.delenv("BLOCK_ACTION", raising=False)
+        
+        rules = RoutingRules.from_env()
+        
+        assert rules.deny_domains == DEFAULT_DENY_DOMAINS + ["127.0.0.1", "tracker.test"]
+        assert rules.match("http://127.0.0.1:8765/products", "document") is None
+        assert rules.match("https://tracker.test/pixel", "image") == "domain:tracker.test"
+        assert rules.match("https://tracker.test/keep/pixel", "image") is None
+        assert rules.match("http://127.0.0.1:8765/clip.mp4", "media") == "type:media"
+    
+    @pytest.mark.parametrize("action, blocked_outcome", [
+        ("abort", ("abort", "blockedbyclient")),
+        ("stub", ("fulfill", 200, "application/javascript")),
+    ])
+    def test_blocker_handles_and_counts_requests(self, action, blocked_outcome):
+        """
+        NetworkBlocker - allowed requests fall back, blocked ones are aborted or stubbed and counted by reason.
+        """
+        blocker = NetworkBlocker(RoutingRules(deny_domains=["doubleclick.net"], action=action))
+        allowed = FakeRoute("https://automationexercise.com/", "document")
+        blocked = FakeRoute("https://doubleclick.net/tag.js", "script")
+        
+        blocker._handle(allowed)
+        blocker._handle(blocked)
+        blocker._handle(FakeRoute("https://doubleclick.net/pixel", "image"))
+        
+        assert allowed.outcome == ("fallback",)
+        assert blocked.outcome == blocked_outcome
+        assert blocker.passed_count == 1
+        assert blocker.blocked_total == 2
+        assert blocker.summary() == {"domain:doubleclick.net": 2}
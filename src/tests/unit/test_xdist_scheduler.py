@@ -0,0 +1,152 @@
+"""
+Duration-aware xdist scheduler unit tests for AutomationExercise testing framework.
+"""
+from collections import deque
+from types import SimpleNamespace
+import pytest
+from src.helpers.duration_sharding import DURATIONS_CACHE_KEY, DurationStore
+from src.helpers.xdist_scheduler import WORKER_PREFETCH, DurationScheduling
+
+
+class FakeCache:
+    """In-memory stand-in for pytest's config.cache."""
+    
+    def __init__(self, values):
+        self.values = values
+    
+    def get(self, key, default):
+        return self.values.get(key, default)
+    
+    def set(self, key, value):
+        self.values[key] = value
+
+
+class FakeConfig:
+    """pytest config stand-in with the options LoadScheduling reads."""
+    
+    def __init__(self, workers: int):
+        self.options = {"tx": [f"{workers}*popen"], "maxschedchunk": None}
+    
+    def getvalue(self, name):
+        return self.options[name]
+    
+    def getoption(self, name):
+        return self.options[name]
+
+
+class FakeNode:
+    """Worker stand-in that records the tests it was sent."""
+    
+    def __init__(self, name: str):
+        self.gateway = SimpleNamespace(id=name)
+        self.shutting_down = False
+        self.sent = []
+    
+    def send_runtest_some(self, indices):
+        self.sent.extend(indices)
+    
+    def shutdown(self):
+        self.shutting_down = True
+    
+    def __repr__(self) -> str:
+        return f"FakeNode({self.gateway.id})"
+
+
+API = "src/tests/api/test_products_api.py::TestProductsAPI::test_{}"
+UI = "src/tests/user_interface/test_e2e_cart.py::TestE2ECart::test_{}"
+
+
+def make_scheduler(durations, node_count):
+    """Build a scheduler whose workers all collected the given node ids (in dict order)."""
+    store = DurationStore(FakeCache({DURATIONS_CACHE_KEY: durations}))
+    scheduler = DurationScheduling(FakeConfig(node_count), durations=store)
+    nodes = [FakeNode(f"gw{index}") for index in range(node_count)]
+    for node in nodes:
+        scheduler.add_node(node)
+        scheduler.add_node_collection(node, list(durations))
+    return scheduler, nodes
+
+
+@pytest.mark.unit
+class TestDurationScheduling:
+    """Test class for DurationScheduling without real xdist workers."""
+    
+    def test_schedule_sends_each_worker_its_longest_tests(self):
+        """
+        schedule - every worker gets its own suite's shard, WORKER_PREFETCH tests at a time, longest first.
+        """
+        durations = {UI.format("a"): 9.0, UI.format("b"): 8.0, UI.format("c"): 1.0,
+                     API.format("a"): 3.0, API.format("b"): 2.0, API.format("c"): 1.0}
+        scheduler, (ui_node, api_node) = make_scheduler(durations, 2)
+        
+        scheduler.schedule()
+        
+        assert scheduler.node2kind == {ui_node: "ui", api_node: "api"}
+        for node, shard in ((ui_node, [0, 1, 2]), (api_node, [3, 4, 5])):
+            assert node.sent == shard[:WORKER_PREFETCH]
+            assert list(scheduler.node2queue[node]) == shard[WORKER_PREFETCH:]
+    
+    def test_steal_takes_shortest_half_of_busiest_same_kind_queue(self):
+        """
+        _steal - an idle worker takes the shortest half of its own suite's busiest queue.
+        """
+        durations = {API.format(name): 1.0 for name in "abcdefgh"}
+        scheduler, (thief, busy, light, ui_node) = make_scheduler(durations, 4)
+        scheduler.collection = list(durations)
+        scheduler.node2queue = {thief: deque(), busy: deque([0, 1, 2, 3, 4]), light: deque([5]),
+                                ui_node: deque([6, 7])}
+        scheduler.node2kind = {thief: "api", busy: "api", light: "api", ui_node: "ui"}
+        
+        scheduler._steal(thief)
+        
+        # Queues are longest first: the tail (shortest) half moves, keeping its order
+        assert list(scheduler.node2queue[thief]) == [2, 3, 4]
+        assert list(scheduler.node2queue[busy]) == [0, 1]
+        assert list(scheduler.node2queue[ui_node]) == [6, 7]
+    
+    def test_steal_falls_back_to_other_suite(self):
+        """
+        _steal - with nothing queued in its own suite, an idle worker takes work from the other one.
+        """
+        durations = {API.format("a"): 1.0, UI.format("a"): 5.0, UI.format("b"): 4.0, UI.format("c"): 3.0}
+        scheduler, (thief, ui_node) = make_scheduler(durations, 2)
+        scheduler.collection = list(durations)
+        scheduler.node2queue = {thief: deque(), ui_node: deque([1, 2, 3])}
+        scheduler.node2kind = {thief: "api", ui_node: "ui"}
+        
+        scheduler._steal(thief)
+        
+        assert list(scheduler.node2queue[thief]) == [2, 3]
+        assert list(scheduler.node2queue[ui_node]) == [1]
+    
+    def test_worker_with_nothing_to_steal_is_shut_down(self):
+        """
+        check_schedule - a worker whose queue is empty and cannot steal is shut down.
+        """
+        durations = {API.format("a"): 1.0}
+        scheduler, (first, second) = make_scheduler(durations, 2)
+        
+        scheduler.schedule()
+        
+        assert first.sent == [0]
+        assert second.sent == [] and second.shutting_down
+    
+    def test_remove_node_requeues_unfinished_tests(self):
+        """
+        remove_node - the crashed test is reported and the rest goes to the least loaded active worker.
+        """
+        durations = {API.format(name): seconds for name, seconds in zip("abcdefg", [7, 6, 5, 4, 3, 2, 1])}
+        scheduler, (crashed, busy, idle) = make_scheduler(durations, 3)
+        scheduler.collection = list(durations)
+        scheduler.node2pending = {crashed: [0, 1], busy: [2], idle: [3]}
+        scheduler.node2queue = {crashed: deque([4]), busy: deque([5]), idle: deque()}
+        scheduler.node2kind = {crashed: "api", busy: "api", idle: "api"}
+        
+        crashitem = scheduler.remove_node(crashed)
+        
+        assert crashitem == API.format("a")
+        assert crashed not in scheduler.node2pending and crashed not in scheduler.node2queue
+        # The idle worker had the least queued work; check_schedule then tops every worker up
+        assert list(scheduler.node2queue[idle]) == [4]
+        assert idle.sent == [1] and scheduler.node2pending[idle] == [3, 1]
+        assert busy.sent == [5] and scheduler.node2pending[busy] == [2, 5]
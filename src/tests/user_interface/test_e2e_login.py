@@ -2,7 +2,7 @@
 E2E Login tests for AutomationExercise.com.
 """
 import pytest
-from src.fixtures.test_data_fixtures import home_page, login_page, ui_test_data
+from src.fixtures.test_data_fixtures import home_page, logged_in_home_page, login_page, ui_test_data
 
 
 @pytest.mark.ui
@@ -426,3 +426,34 @@ class TestE2ELogin:
         # Verify both forms have proper ARIA structure
         assert login_page.login_form.get_attribute('action')
         assert login_page.signup_form.get_attribute('action')
+    
+    def test_stored_session_starts_logged_in(self, logged_in_home_page, ui_test_data):
+        """
+        Should start logged in from the cached storage state.
+        
+        Verifies that a context built from the saved session shows the account links without using the login form.
+        """
+        # Act
+        logged_in_home_page.navigate()
+        
+        # Assert
+        logged_in_home_page.verify_user_logged_in(ui_test_data["valid_user"]["name"])
+    
+    def test_logout_from_stored_session(self, logged_in_home_page, storage_state_factory, ui_test_data):
+        """
+        Should log out of a session restored from the cached storage state.
+        
+        Verifies that logout ends the session and returns the user to the login page.
+        """
+        # Arrange
+        logged_in_home_page.navigate()
+        logged_in_home_page.verify_user_logged_in()
+        
+        # Act
+        logged_in_home_page.logout()
+        # The server-side session is gone, so the next test has to log in again
+        storage_state_factory.invalidate(ui_test_data["valid_user"]["email"])
+        
+        # Assert
+        assert logged_in_home_page.page.url.endswith('/login')
+        logged_in_home_page.verify_user_logged_out()
@@ -2,7 +2,7 @@
 E2E Products tests for AutomationExercise.com.
 """
 import pytest
-from src.fixtures.test_data_fixtures import home_page, products_page, ui_test_data
+from src.fixtures.test_data_fixtures import home_page, products_page, ui_test_data, performance_thresholds
 
 
 @pytest.mark.ui
@@ -123,27 +123,28 @@ class TestE2EProducts:
             products = products_page.get_all_products_info()
             assert len(products) > 0
     
-    def test_brand_filter_functionality(self, products_page, ui_test_data):
+    def test_brand_filter_functionality(self, products_page, catalog_test_data):
         """
         Should filter products by brand.
         
-        Tests that brand filtering works correctly.
+        Tests that brand filtering shows the products the catalog lists for each brand.
         """
         # Arrange
         products_page.navigate_to_products()
-        brands = ui_test_data["products_data"]["brands"]
+        brands = catalog_test_data["brands"]
         
         for brand in brands:
             # Act
             products_page.click_brand_link(brand)
             
-            # Assert
+            # Assert (a listed brand may have no products yet)
+            expected_count = catalog_test_data["products_by_brand"][brand]
             assert products_page.is_on_products_page()
-            assert products_page.has_products()
+            assert products_page.has_products() == (expected_count > 0)
             
             # Get products after filtering
             products = products_page.get_all_products_info()
-            assert len(products) > 0
+            assert len(products) == expected_count
     
     def test_add_product_to_cart(self, products_page, ui_test_data):
         """
@@ -244,23 +245,21 @@ class TestE2EProducts:
                 assert products_page.is_on_products_page()
                 assert products_page.has_products()
     
-    def test_products_page_performance(self, products_page, ui_test_data):
+    def test_products_page_performance(self, products_page, ui_test_data, performance_thresholds):
         """
         Should load products page within acceptable time.
         
-        Tests that the products page loads within acceptable time limits.
+        Tests that the browser-measured load time of the products page is within acceptable limits.
         """
-        # Arrange
-        start_time = products_page.page.evaluate("Date.now()")
-        
         # Act
         products_page.navigate_to_products()
+        metrics = products_page.collect_page_metrics(wait_for_load=True)
         
         # Assert
-        end_time = products_page.page.evaluate("Date.now()")
-        load_time = end_time - start_time
-        
-        assert load_time < 5000, f"Page load time {load_time}ms should be under 5000ms"
+        threshold = performance_thresholds["page_load_time"]
+        assert metrics.page_load_ms is not None
+        assert metrics.page_load_ms < threshold, f"Page load time {metrics.page_load_ms}ms should be under {threshold}ms"
+        assert metrics.ttfb_ms is not None and metrics.ttfb_ms < metrics.page_load_ms
         assert products_page.has_products()
     
     def test_products_page_accessibility(self, products_page, ui_test_data):